@@ -1,91 +1,61 @@
 import re
 
-from unstructured.cleaners.core import (
-    clean,
-    clean_non_ascii_chars,
-    replace_unicode_quotes,
+from unstructured.cleaners.core import replace_unicode_quotes
+
+# Mapping of the bold numbers to their regular equivalents. The other bold digit styles in
+# U+1D7CE-U+1D7FF are left unchanged.
+BOLD_NUMBERS = {chr(0x1D7EC + digit): str(digit) for digit in range(10)}
+BOLD_CHARACTERS = {
+    **BOLD_NUMBERS,
+    **{chr(0x1D5D4 + offset): chr(ord("A") + offset) for offset in range(26)},
+    **{chr(0x1D5EE + offset): chr(ord("a") + offset) for offset in range(26)},
+}
+ITALIC_LETTERS = {
+    **{chr(0x1D608 + offset): chr(ord("A") + offset) for offset in range(26)},
+    **{chr(0x1D622 + offset): chr(ord("a") + offset) for offset in range(26)},
+}
+
+EMOJIS_AND_SYMBOLS = (
+    "\U0001f600-\U0001f64f"  # emoticons
+    "\U0001f300-\U0001f5ff"  # symbols & pictographs
+    "\U0001f680-\U0001f6ff"  # transport & map symbols
+    "\U0001f1e0-\U0001f1ff"  # flags (iOS)
+    "\U00002193"  # downwards arrow
+    "\U000021b3"  # downwards arrow with tip rightwards
+    "\U00002192"  # rightwards arrow
 )
+STYLED_CHARACTERS_TABLE = str.maketrans({**BOLD_CHARACTERS, **ITALIC_LETTERS})
+# Matches the runs of styled letters and emojis, which are rare in a text, in a single scan.
+NORMALIZATION_PATTERN = re.compile(
+    f"[{EMOJIS_AND_SYMBOLS}"
+    "\U0001d5d4-\U0001d63b"  # bold and italic letters
+    "\U0001d7ec-\U0001d7f5"  # bold numbers
+    "]+",
+    flags=re.UNICODE,
+)
+BOLD_PATTERN = re.compile(r"[\U0001D5D4-\U0001D607\U0001D7EC-\U0001D7F5]")
+ITALIC_PATTERN = re.compile(r"[\U0001D608-\U0001D63B]")
+EMOJI_AND_SYMBOL_PATTERN = re.compile(f"[{EMOJIS_AND_SYMBOLS}]+", flags=re.UNICODE)
+URL_PATTERN = re.compile(r"https?://\S+|www\.\S+")
 
-
-def unbold_text(text):
-    # Mapping of bold numbers to their regular equivalents
-    bold_numbers = {
-        "𝟬": "0",
-        "𝟭": "1",
-        "𝟮": "2",
-        "𝟯": "3",
-        "𝟰": "4",
-        "𝟱": "5",
-        "𝟲": "6",
-        "𝟳": "7",
-        "𝟴": "8",
-        "𝟵": "9",
-    }
-
-    # Function to convert bold characters (letters and numbers)
-    def convert_bold_char(match):
-        char = match.group(0)
-        # Convert bold numbers
-        if char in bold_numbers:
-            return bold_numbers[char]
-        # Convert bold uppercase letters
-        elif "\U0001d5d4" <= char <= "\U0001d5ed":
-            return chr(ord(char) - 0x1D5D4 + ord("A"))
-        # Convert bold lowercase letters
-        elif "\U0001d5ee" <= char <= "\U0001d607":
-            return chr(ord(char) - 0x1D5EE + ord("a"))
-        else:
-            return char  # Return the character unchanged if it's not a bold number or letter
-
-    # Regex for bold characters (numbers, uppercase, and lowercase letters)
-    bold_pattern = re.compile(r"[\U0001D5D4-\U0001D5ED\U0001D5EE-\U0001D607\U0001D7CE-\U0001D7FF]")
-    text = bold_pattern.sub(convert_bold_char, text)
-
-    return text
+# Every mojibake sequence handled by `replace_unicode_quotes` starts with this prefix.
+MOJIBAKE_PREFIX = "â\x80"
 
 
-def unitalic_text(text):
-    # Function to convert italic characters (both letters)
-    def convert_italic_char(match):
-        char = match.group(0)
-        # Unicode ranges for italic characters
-        if "\U0001d608" <= char <= "\U0001d621":  # Italic uppercase A-Z
-            return chr(ord(char) - 0x1D608 + ord("A"))
-        elif "\U0001d622" <= char <= "\U0001d63b":  # Italic lowercase a-z
-            return chr(ord(char) - 0x1D622 + ord("a"))
-        else:
-            return char  # Return the character unchanged if it's not an italic letter
+def unbold_text(text: str) -> str:
+    return BOLD_PATTERN.sub(lambda match: BOLD_CHARACTERS[match[0]], text)
 
-    # Regex for italic characters (uppercase and lowercase letters)
-    italic_pattern = re.compile(r"[\U0001D608-\U0001D621\U0001D622-\U0001D63B]")
-    text = italic_pattern.sub(convert_italic_char, text)
 
-    return text
+def unitalic_text(text: str) -> str:
+    return ITALIC_PATTERN.sub(lambda match: ITALIC_LETTERS[match[0]], text)
 
 
-def remove_emojis_and_symbols(text):
-    # Extended pattern to include specific symbols like ↓ (U+2193) or ↳ (U+21B3)
-    emoji_and_symbol_pattern = re.compile(
-        "["
-        "\U0001f600-\U0001f64f"  # emoticons
-        "\U0001f300-\U0001f5ff"  # symbols & pictographs
-        "\U0001f680-\U0001f6ff"  # transport & map symbols
-        "\U0001f1e0-\U0001f1ff"  # flags (iOS)
-        "\U00002193"  # downwards arrow
-        "\U000021b3"  # downwards arrow with tip rightwards
-        "\U00002192"  # rightwards arrow
-        "]+",
-        flags=re.UNICODE,
-    )
+def remove_emojis_and_symbols(text: str) -> str:
+    return EMOJI_AND_SYMBOL_PATTERN.sub(" ", text)
 
-    return emoji_and_symbol_pattern.sub(r" ", text)
 
-
-def replace_urls_with_placeholder(text, placeholder="[URL]"):
-    # Regular expression pattern for matching URLs
-    url_pattern = r"https?://\S+|www\.\S+"
-
-    return re.sub(url_pattern, placeholder, text)
+def replace_urls_with_placeholder(text: str, placeholder: str = "[URL]") -> str:
+    return URL_PATTERN.sub(placeholder, text)
 
 
 def remove_non_ascii(text: str) -> str:
@@ -93,13 +63,33 @@ def remove_non_ascii(text: str) -> str:
     return text
 
 
+def _normalize_match(match: re.Match) -> str:
+    # A run fully contains the emoji runs it overlaps, so they still collapse into a single space.
+    return EMOJI_AND_SYMBOL_PATTERN.sub(" ", match[0]).translate(
+        STYLED_CHARACTERS_TABLE
+    )
+
+
 def clean_text(text_content: str) -> str:
-    cleaned_text = unbold_text(text_content)
-    cleaned_text = unitalic_text(cleaned_text)
-    cleaned_text = remove_emojis_and_symbols(cleaned_text)
-    cleaned_text = clean(cleaned_text)
-    cleaned_text = replace_unicode_quotes(cleaned_text)
-    cleaned_text = clean_non_ascii_chars(cleaned_text)
-    cleaned_text = replace_urls_with_placeholder(cleaned_text)
+    """
+    Normalizes a raw post, article or repository text: unbolds and unitalicizes the
+    Unicode-styled letters, replaces emojis and arrows with spaces, strips the text, replaces
+    the Unicode quotes, removes the non-ASCII characters and replaces the URLs with a placeholder.
+
+    The steps are applied in this order, but fused into as few passes over the text as possible.
+    """
+
+    if text_content.isascii():
+        # Plain ASCII text has neither styled letters, emojis, Unicode quotes nor mojibake.
+        return URL_PATTERN.sub("[URL]", text_content.strip().replace("&apos;", "'"))
+
+    cleaned_text = NORMALIZATION_PATTERN.sub(_normalize_match, text_content).strip()
+    if MOJIBAKE_PREFIX in cleaned_text:
+        cleaned_text = replace_unicode_quotes(cleaned_text)
+    else:
+        # Without mojibake, the only quote replacement surviving the non-ASCII removal is this one.
+        cleaned_text = cleaned_text.replace("&apos;", "'")
+    cleaned_text = remove_non_ascii(cleaned_text)
+    cleaned_text = URL_PATTERN.sub("[URL]", cleaned_text)
 
     return cleaned_text
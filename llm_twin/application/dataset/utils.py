@@ -1,5 +1,5 @@
 from sklearn.model_selection import train_test_split
-from llm_twin.application.preprocessing.operations.chunking import chunk_document
+from llm_twin.application.preprocessing.operations.chunking import iter_article_chunks
 from llm_twin.domain.cleaned_documents import CleanedDocument
 from llm_twin.domain.dataset import (
     InstructDataset,
@@ -130,7 +130,9 @@ def extract_substrings(
 ) -> list[CleanedDocument]:
     extracts = []
     for document in documents:
-        document_extracts = chunk_document(document.content, min_length, max_length)
+        document_extracts = iter_article_chunks(
+            document.content, min_length, max_length
+        )
         for extract in document_extracts:
             subdocument = document.model_copy()
             subdocument.content = extract
@@ -1,3 +1,10 @@
+from .embedding_cache import EmbeddingCache
+from .embedding_pool import EmbeddingProcessPool
 from .embeddings import CrossEncoderModelSingleton, EmbeddingModelSingleton
 
-__all__ = ["EmbeddingModelSingleton", "CrossEncoderModelSingleton"]
+__all__ = [
+    "EmbeddingCache",
+    "EmbeddingProcessPool",
+    "EmbeddingModelSingleton",
+    "CrossEncoderModelSingleton",
+]
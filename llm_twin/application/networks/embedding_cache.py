@@ -0,0 +1,179 @@
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+from numpy.typing import NDArray
+
+from llm_twin.application.utils import misc
+from llm_twin.settings import settings
+
+from .base import SingletonMeta
+from .embeddings import EmbeddingModelSingleton
+
+
+class EmbeddingCache(metaclass=SingletonMeta):
+    """
+    A singleton, thread-safe cache of embeddings keyed by (model_id, content hash), with an LRU
+    in-memory tier in front of an optional SQLite tier persisted across runs.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = (
+            Path(settings.EMBEDDING_CACHE_PATH).expanduser()
+            if settings.EMBEDDING_CACHE_PATH
+            else None
+        ),
+        max_memory_items: int = settings.EMBEDDING_CACHE_MAX_MEMORY_ITEMS,
+    ) -> None:
+        self._max_memory_items = max_memory_items
+        self._memory: OrderedDict[tuple[str, str], NDArray[np.float32]] = OrderedDict()
+        self._lock = Lock()
+
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model_id TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    PRIMARY KEY (model_id, content_hash)
+                ) WITHOUT ROWID
+                """
+            )
+            self._db.commit()
+
+    @staticmethod
+    def hash_content(text: str) -> str:
+        """Hashes the text the same way the chunk ids are computed."""
+
+        return hashlib.md5(text.encode()).hexdigest()
+
+    def embed(
+        self, input_text: list[str], embedding_model: EmbeddingModelSingleton
+    ) -> NDArray[np.float32]:
+        """
+        Generates the embeddings of the input text, sending only the cache misses to the model.
+
+        Args:
+            input_text (list[str]): The input text to generate embeddings for.
+            embedding_model (EmbeddingModelSingleton): The model used for the cache misses.
+
+        Returns:
+            NDArray[np.float32]: The embeddings, one row per input text, in the input order, or an
+                empty array if the model failed to embed some of the cache misses.
+        """
+
+        if len(input_text) == 0:
+            return np.array([], dtype=np.float32)
+
+        # Quantized backends don't produce exactly the same embeddings as the original model. The
+        # backend is the active one, which is torch if the configured ONNX one fell back to it.
+        model_id = embedding_model.model_id
+        backend = embedding_model.backend
+        if backend != "torch":
+            model_id = f"{model_id}:{backend}"
+        content_hashes = [self.hash_content(text) for text in input_text]
+        cached_embeddings = self.get_many(model_id, content_hashes)
+
+        missing_texts = {
+            content_hash: text
+            for text, content_hash, embedding in zip(
+                input_text, content_hashes, cached_embeddings
+            )
+            if embedding is None
+        }
+        if missing_texts:
+            missing_hashes = list(missing_texts.keys())
+            missing_embeddings = embedding_model(
+                list(missing_texts.values()), to_list=False
+            )
+            if len(missing_embeddings) != len(missing_hashes):
+                # A partial result can't be aligned with the inputs, hence nothing is cached.
+                logger.error(
+                    "The embedding model didn't embed every cache miss.",
+                    num_misses=len(missing_hashes),
+                    num_embeddings=len(missing_embeddings),
+                )
+
+                return np.array([], dtype=np.float32)
+
+            self.put_many(model_id, missing_hashes, missing_embeddings)
+
+            computed_embeddings = dict(zip(missing_hashes, missing_embeddings))
+            cached_embeddings = [
+                embedding
+                if embedding is not None
+                else computed_embeddings[content_hash]
+                for content_hash, embedding in zip(content_hashes, cached_embeddings)
+            ]
+
+        logger.debug(
+            "Embedding cache lookup.",
+            num_inputs=len(input_text),
+            num_misses=len(missing_texts),
+        )
+
+        return np.stack(cached_embeddings).astype(np.float32, copy=False)
+
+    def get_many(
+        self, model_id: str, content_hashes: list[str]
+    ) -> list[NDArray[np.float32] | None]:
+        with self._lock:
+            embeddings = {}
+            for content_hash in content_hashes:
+                key = (model_id, content_hash)
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    embeddings[content_hash] = self._memory[key]
+
+            missing_hashes = list({h for h in content_hashes if h not in embeddings})
+            if self._db is not None and missing_hashes:
+                for hashes_batch in misc.batch(missing_hashes, size=500):
+                    placeholders = ",".join("?" * len(hashes_batch))
+                    rows = self._db.execute(
+                        "SELECT content_hash, embedding FROM embeddings "
+                        f"WHERE model_id = ? AND content_hash IN ({placeholders})",
+                        (model_id, *hashes_batch),
+                    )
+                    for content_hash, blob in rows:
+                        embedding = np.frombuffer(blob, dtype=np.float32)
+                        embeddings[content_hash] = embedding
+                        self._remember((model_id, content_hash), embedding)
+
+        return [embeddings.get(content_hash) for content_hash in content_hashes]
+
+    def put_many(
+        self, model_id: str, content_hashes: list[str], embeddings: NDArray[np.float32]
+    ) -> None:
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+
+        with self._lock:
+            for content_hash, embedding in zip(content_hashes, embeddings):
+                self._remember((model_id, content_hash), embedding)
+
+            if self._db is not None:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model_id, content_hash, embedding) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (model_id, content_hash, embedding.tobytes())
+                        for content_hash, embedding in zip(content_hashes, embeddings)
+                    ],
+                )
+                self._db.commit()
+
+    def _remember(self, key: tuple[str, str], embedding: NDArray[np.float32]) -> None:
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory_items:
+            self._memory.popitem(last=False)
@@ -0,0 +1,206 @@
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from threading import Lock
+from typing import Optional
+
+import numpy as np
+from loguru import logger
+from numpy.typing import NDArray
+
+from llm_twin.settings import settings
+
+from .base import SingletonMeta
+from .embeddings import EmbeddingModelSingleton
+
+
+class EmbeddingProcessPool(metaclass=SingletonMeta):
+    """
+    A singleton pool of worker processes, each holding its own copy of the embedding model, used
+    to embed large inputs on CPU-only nodes.
+
+    The input texts are sharded across the workers, which write their float32 embeddings directly
+    into a shared memory block, hence the results are never pickled back to the parent process.
+    The workers are started on first use and stopped by `shutdown`, after which the pool can be
+    used again.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = settings.EMBEDDING_POOL_NUM_WORKERS,
+        threads_per_worker: Optional[int] = settings.EMBEDDING_POOL_THREADS_PER_WORKER,
+        model_id: str = settings.TEXT_EMBEDDING_MODEL_ID,
+        device: str = settings.RAG_MODEL_DEVICE,
+        backend: str = settings.RAG_MODEL_BACKEND,
+    ) -> None:
+        self._num_workers = max(num_workers, 1)
+        self._threads_per_worker = threads_per_worker or max(
+            (os.cpu_count() or 1) // self._num_workers, 1
+        )
+        self._model_id = model_id
+        self._device = device
+        self._backend = backend
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._embedding_size: int | None = None
+        self._active_backend: str | None = None
+        self._lock = Lock()
+
+    @property
+    def model_id(self) -> str:
+        return self._model_id
+
+    @property
+    def backend(self) -> str:
+        """
+        Returns the inference backend running in the workers, which is torch if the configured
+        ONNX one fell back to it.
+        """
+
+        if self._active_backend is None:
+            self._active_backend = (
+                self._get_executor().submit(_get_backend).result()
+                if self._backend != "torch"
+                else self._backend
+            )
+
+        return self._active_backend
+
+    @property
+    def num_workers(self) -> int:
+        return self._num_workers
+
+    @property
+    def embedding_size(self) -> int:
+        if self._embedding_size is None:
+            self._embedding_size = (
+                self._get_executor().submit(_get_embedding_size).result()
+            )
+
+        return self._embedding_size
+
+    def __call__(
+        self, input_text: list[str], to_list: bool = True
+    ) -> NDArray[np.float32] | list[list[float]]:
+        """
+        Generates embeddings for the input text across the worker processes.
+
+        Args:
+            input_text (list[str]): The input text to generate embeddings for.
+            to_list (bool): Whether to return the embeddings as a list or numpy array. Defaults to True.
+
+        Returns:
+            Union[np.ndarray, list]: The embeddings, one row per input text, in the input order.
+        """
+
+        if len(input_text) == 0:
+            return [] if to_list else np.array([], dtype=np.float32)
+
+        executor = self._get_executor()
+        shape = (len(input_text), self.embedding_size)
+        shared_memory = SharedMemory(
+            create=True, size=math.prod(shape) * np.float32().itemsize
+        )
+        try:
+            # Smaller shards than workers balance the load between long and short texts.
+            shard_size = max(math.ceil(len(input_text) / (self._num_workers * 4)), 1)
+            futures = [
+                executor.submit(
+                    _embed_shard,
+                    input_text[start : start + shard_size],
+                    shared_memory.name,
+                    shape,
+                    start,
+                )
+                for start in range(0, len(input_text), shard_size)
+            ]
+            for future in futures:
+                future.result()
+
+            embeddings = np.ndarray(
+                shape, dtype=np.float32, buffer=shared_memory.buf
+            ).copy()
+        except Exception:
+            logger.exception(
+                f"Error generating embeddings in the pool for {self._model_id=}"
+            )
+
+            return [] if to_list else np.array([], dtype=np.float32)
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+
+        if to_list:
+            return embeddings.tolist()
+
+        return embeddings
+
+    def shutdown(self) -> None:
+        """Stops the worker processes, if they were started."""
+
+        with self._lock:
+            if self._executor is None:
+                return
+
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+        logger.info("Embedding pool shut down.", num_workers=self._num_workers)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                logger.info(
+                    "Starting the embedding pool.",
+                    num_workers=self._num_workers,
+                    threads_per_worker=self._threads_per_worker,
+                )
+                # Forking a process after torch started its thread pools can deadlock.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._num_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(
+                        self._model_id,
+                        self._device,
+                        self._backend,
+                        self._threads_per_worker,
+                    ),
+                )
+
+            return self._executor
+
+
+def _init_worker(model_id: str, device: str, backend: str, num_threads: int) -> None:
+    import torch
+
+    torch.set_num_threads(num_threads)
+    EmbeddingModelSingleton(model_id=model_id, device=device, backend=backend)
+
+
+def _get_embedding_size() -> int:
+    return EmbeddingModelSingleton().embedding_size
+
+
+def _get_backend() -> str:
+    return EmbeddingModelSingleton().backend
+
+
+def _embed_shard(
+    input_text: list[str], shared_memory_name: str, shape: tuple[int, int], start: int
+) -> int:
+    embeddings = EmbeddingModelSingleton()(input_text, to_list=False)
+    if len(embeddings) != len(input_text):
+        raise RuntimeError(f"Failed to embed the shard starting at {start}.")
+
+    shared_memory = SharedMemory(name=shared_memory_name)
+    try:
+        output = np.ndarray(shape, dtype=np.float32, buffer=shared_memory.buf)
+        output[start : start + len(input_text)] = embeddings
+        del output
+    finally:
+        shared_memory.close()
+
+    return len(input_text)
@@ -1,17 +1,30 @@
+import json
 from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from threading import Lock
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
 from loguru import logger
 from numpy.typing import NDArray
-from sentence_transformers.cross_encoder import CrossEncoder
-from sentence_transformers.SentenceTransformer import SentenceTransformer
-from transformers import AutoTokenizer
 
 from llm_twin.settings import settings
 
 from .base import SingletonMeta
+from .onnx import load_onnx_model, validate_backend
+
+PARITY_CHECK_TEXTS = [
+    "How do I build a feature pipeline for an LLM twin?",
+    "Qdrant stores the embedded chunks of the posts, articles and repositories.",
+    "def chunk_text(text: str, chunk_size: int = 500) -> list[str]:",
+]
+
+# torch, transformers and sentence-transformers take seconds to import, hence they are imported
+# when a model is first used rather than when this module is imported.
+if TYPE_CHECKING:
+    from sentence_transformers.cross_encoder import CrossEncoder
+    from sentence_transformers.SentenceTransformer import SentenceTransformer
+    from transformers import AutoTokenizer
 
 
 class EmbeddingModelSingleton(metaclass=SingletonMeta):
@@ -24,16 +37,50 @@ class EmbeddingModelSingleton(metaclass=SingletonMeta):
         model_id: str = settings.TEXT_EMBEDDING_MODEL_ID,
         device: str = settings.RAG_MODEL_DEVICE,
         cache_dir: Optional[Path] = None,
+        backend: str = settings.RAG_MODEL_BACKEND,
     ) -> None:
         self._model_id = model_id
         self._device = device
+        self._cache_dir = cache_dir
+        self._backend = validate_backend(backend)
+
+        # The model is loaded on first use.
+        self._loaded_model: Optional["SentenceTransformer"] = None
+        self._onnx_model = None
+        self._load_lock = Lock()
+
+    @property
+    def _model(self) -> "SentenceTransformer":
+        if self._loaded_model is None:
+            with self._load_lock:
+                if self._loaded_model is None:
+                    self._load_model()
 
-        self._model = SentenceTransformer(
+        return self._loaded_model
+
+    def _load_model(self) -> None:
+        from sentence_transformers.SentenceTransformer import SentenceTransformer
+
+        logger.info(
+            f"Loading the embedding model {self._model_id=}.", backend=self._backend
+        )
+
+        model = SentenceTransformer(
             self._model_id,
             device=self._device,
-            cache_folder=str(cache_dir) if cache_dir else None,
+            cache_folder=str(self._cache_dir) if self._cache_dir else None,
         )
-        self._model.eval()
+        model.eval()
+        self._loaded_model = model
+
+        if self._backend != "torch":
+            self._onnx_model = load_onnx_model(
+                self._model_id,
+                task="feature-extraction",
+                quantize=self._backend == "onnx-int8",
+                device=self._device,
+            )
+            self._check_onnx_parity()
 
     @property
     def model_id(self) -> str:
@@ -46,32 +93,120 @@ class EmbeddingModelSingleton(metaclass=SingletonMeta):
 
         return self._model_id
 
+    @property
+    def backend(self) -> str:
+        """
+        Returns the inference backend running the model. An ONNX backend is only known to be
+        active once the model is loaded, as it falls back to PyTorch if it fails the parity check,
+        hence the model is loaded first.
+
+        Returns:
+            str: The inference backend running the model, one of torch, onnx or onnx-int8.
+        """
+
+        if self._backend != "torch":
+            self._model  # Runs the parity check, which may fall back to torch.
+
+        return self._backend
+
     @cached_property
     def embedding_size(self) -> int:
         """
         Returns the size of the embeddings generated by the pre-trained transformer model.
 
+        It is read from the model's modules once loaded. Otherwise, it is read from the
+        sentence-transformers modules config, without loading the model: the output size of the
+        last dense projection or, without one, of the pooling. Models without modules config are
+        pooled over the hidden states of the transformer, hence their hidden size is used.
+
         Returns:
             int: The size of the embeddings generated by the pre-trained transformer model.
         """
 
-        dummy_embedding = self._model.encode("")
+        if self._loaded_model is not None:
+            return self._loaded_model.get_sentence_embedding_dimension()
 
-        return dummy_embedding.shape[0]
+        embedding_size = self._read_modules_embedding_size()
+        if embedding_size is not None:
+            return embedding_size
 
-    @property
+        from transformers import AutoConfig
+
+        config = AutoConfig.from_pretrained(self._model_id, cache_dir=self._cache_dir)
+
+        return config.hidden_size
+
+    def _read_modules_embedding_size(self) -> int | None:
+        modules = self._read_model_config("modules.json")
+        for module in reversed(modules or []):
+            module_type = module["type"].rsplit(".", 1)[-1]
+            if module_type == "Dense":
+                return self._read_model_config(f"{module['path']}/config.json")[
+                    "out_features"
+                ]
+            elif module_type == "Pooling":
+                config = self._read_model_config(f"{module['path']}/config.json")
+                # The pooled embeddings of every enabled mode are concatenated.
+                num_pooling_modes = sum(
+                    1
+                    for key, value in config.items()
+                    if key.startswith("pooling_mode_") and value
+                )
+
+                return config["word_embedding_dimension"] * max(num_pooling_modes, 1)
+
+        return None
+
+    def _read_model_config(self, filename: str) -> dict | list | None:
+        """Reads a JSON file of the model, either from its local directory or from the Hub."""
+
+        local_path = Path(self._model_id)
+        if local_path.is_dir():
+            path = local_path / filename
+
+            return json.loads(path.read_text()) if path.exists() else None
+
+        from huggingface_hub import hf_hub_download
+        from huggingface_hub.utils import EntryNotFoundError, RepositoryNotFoundError
+
+        # Like sentence-transformers, short model names refer to its organization on the Hub.
+        repo_id = (
+            self._model_id
+            if "/" in self._model_id
+            else f"sentence-transformers/{self._model_id}"
+        )
+        try:
+            path = hf_hub_download(
+                repo_id=repo_id, filename=filename, cache_dir=self._cache_dir
+            )
+        except (EntryNotFoundError, RepositoryNotFoundError):
+            return None
+
+        return json.loads(Path(path).read_text())
+
+    @cached_property
     def max_input_length(self) -> int:
         """
         Returns the maximum length of input text to tokenize.
 
+        It is read from the model once loaded. Otherwise, it is read from the sentence-transformers
+        config without loading the model, which is only loaded for models without one.
+
         Returns:
             int: The maximum length of input text to tokenize.
         """
 
+        if self._loaded_model is not None:
+            return self._loaded_model.max_seq_length
+
+        config = self._read_model_config("sentence_bert_config.json")
+        if config and config.get("max_seq_length"):
+            return config["max_seq_length"]
+
         return self._model.max_seq_length
 
     @property
-    def tokenizer(self) -> AutoTokenizer:
+    def tokenizer(self) -> "AutoTokenizer":
         """
         Returns the tokenizer used to tokenize input text.
 
@@ -82,7 +217,10 @@ class EmbeddingModelSingleton(metaclass=SingletonMeta):
         return self._model.tokenizer
 
     def __call__(
-        self, input_text: str | list[str], to_list: bool = True
+        self,
+        input_text: str | list[str],
+        to_list: bool = True,
+        max_batch_tokens: Optional[int] = settings.EMBEDDING_MAX_BATCH_TOKENS,
     ) -> NDArray[np.float32] | list[float] | list[list[float]]:
         """
         Generates embeddings for the input text using the pre-trained transformer model.
@@ -90,13 +228,18 @@ class EmbeddingModelSingleton(metaclass=SingletonMeta):
         Args:
             input_text (str): The input text to generate embeddings for.
             to_list (bool): Whether to return the embeddings as a list or numpy array. Defaults to True.
+            max_batch_tokens (Optional[int]): Token budget of a padded batch when encoding a list
+                of texts bucketed by length. If None, the texts are encoded in fixed-size batches.
 
         Returns:
             Union[np.ndarray, list]: The embeddings generated for the input text.
         """
 
         try:
-            embeddings = self._model.encode(input_text)
+            if isinstance(input_text, list) and max_batch_tokens:
+                embeddings = self._encode_length_bucketed(input_text, max_batch_tokens)
+            else:
+                embeddings = self._encode(input_text)
         except Exception:
             logger.error(f"Error generating embeddings for {self._model_id=} and {input_text=}")
 
@@ -107,12 +250,125 @@ class EmbeddingModelSingleton(metaclass=SingletonMeta):
 
         return embeddings
 
+    def _encode_length_bucketed(
+        self, input_text: list[str], max_batch_tokens: int
+    ) -> NDArray[np.float32]:
+        """
+        Encodes the texts from the longest to the shortest, in batches holding at most
+        `max_batch_tokens` padded tokens: long texts are encoded in small batches and short texts
+        in large ones. The embeddings are returned in the order of the input texts.
+        """
+
+        if len(input_text) == 0:
+            return self._encode(input_text)
+
+        token_lengths = self._get_token_lengths(input_text)
+        sorted_indices = np.argsort(-token_lengths, kind="stable")
+
+        embeddings = np.empty((len(input_text), self.embedding_size), dtype=np.float32)
+        start = 0
+        while start < len(sorted_indices):
+            # The first text of the batch is the longest one, hence sets the padded length.
+            padded_length = max(int(token_lengths[sorted_indices[start]]), 1)
+            batch_size = max(max_batch_tokens // padded_length, 1)
+            batch_indices = sorted_indices[start : start + batch_size]
+
+            embeddings[batch_indices] = self._encode(
+                [input_text[i] for i in batch_indices], batch_size=len(batch_indices)
+            )
+            start += batch_size
+
+        return embeddings
+
+    def _encode(
+        self, input_text: str | list[str], batch_size: int = 32
+    ) -> NDArray[np.float32]:
+        model = self._model  # Loads the ONNX graph as well, if required.
+        if self._onnx_model is None:
+            return model.encode(input_text, batch_size=batch_size)
+
+        if isinstance(input_text, str):
+            return self._encode_onnx([input_text], batch_size=batch_size)[0]
+
+        return self._encode_onnx(input_text, batch_size=batch_size)
+
+    def _encode_onnx(
+        self, input_text: list[str], batch_size: int
+    ) -> NDArray[np.float32]:
+        """
+        Runs the ONNX graph in place of the transformer module of the SentenceTransformer, then
+        its remaining modules (pooling, normalization) to compute the sentence embeddings.
+        """
+
+        import torch
+
+        embeddings = []
+        with torch.inference_mode():
+            for start in range(0, len(input_text), batch_size):
+                features = self._model.tokenize(input_text[start : start + batch_size])
+                outputs = self._onnx_model(
+                    **{
+                        k: v
+                        for k, v in features.items()
+                        if k in self._onnx_model.input_names
+                    }
+                )
+                features["token_embeddings"] = outputs.last_hidden_state
+                for module in list(self._model)[1:]:
+                    features = module(features)
+
+                embeddings.append(features["sentence_embedding"].cpu().numpy())
+
+        if len(embeddings) == 0:
+            return np.empty((0, self.embedding_size), dtype=np.float32)
+
+        return np.concatenate(embeddings).astype(np.float32, copy=False)
+
+    def _check_onnx_parity(self) -> None:
+        """
+        Compares the ONNX embeddings with the PyTorch ones. If their cosine similarity is not
+        within `ONNX_PARITY_TOLERANCE` of 1, the model falls back to the PyTorch backend.
+        """
+
+        reference = self._model.encode(PARITY_CHECK_TEXTS, normalize_embeddings=True)
+        embeddings = self._encode_onnx(
+            PARITY_CHECK_TEXTS, batch_size=len(PARITY_CHECK_TEXTS)
+        )
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+        min_similarity = float((reference * embeddings).sum(axis=1).min())
+        if min_similarity < 1 - settings.ONNX_PARITY_TOLERANCE:
+            logger.error(
+                f"The {self._backend} embeddings of {self._model_id=} diverge from the PyTorch "
+                f"ones ({min_similarity=:.4f}). Falling back to the PyTorch backend."
+            )
+            self._onnx_model = None
+            self._backend = "torch"
+        else:
+            logger.info(
+                f"Using the {self._backend} backend for {self._model_id=}.",
+                min_similarity=round(min_similarity, 4),
+            )
+
+    def _get_token_lengths(self, input_text: list[str]) -> NDArray[np.int64]:
+        encodings = self.tokenizer(
+            input_text,
+            add_special_tokens=True,
+            truncation=True,
+            max_length=self.max_input_length,
+        )
+
+        return np.array(
+            [len(input_ids) for input_ids in encodings["input_ids"]], dtype=np.int64
+        )
+
 
 class CrossEncoderModelSingleton(metaclass=SingletonMeta):
     def __init__(
         self,
         model_id: str = settings.RERANKING_CROSS_ENCODER_MODEL_ID,
         device: str = settings.RAG_MODEL_DEVICE,
+        backend: str = settings.RAG_MODEL_BACKEND,
     ) -> None:
         """
         A singleton class that provides a pre-trained cross-encoder model for scoring pairs of input text.
@@ -120,19 +376,125 @@ class CrossEncoderModelSingleton(metaclass=SingletonMeta):
 
         self._model_id = model_id
         self._device = device
+        self._backend = validate_backend(backend)
+
+        # The model is loaded on first use.
+        self._loaded_model: Optional["CrossEncoder"] = None
+        self._onnx_model = None
+        self._load_lock = Lock()
+
+    @property
+    def _model(self) -> "CrossEncoder":
+        if self._loaded_model is None:
+            with self._load_lock:
+                if self._loaded_model is None:
+                    self._load_model()
+
+        return self._loaded_model
 
-        self._model = CrossEncoder(
+    def _load_model(self) -> None:
+        from sentence_transformers.cross_encoder import CrossEncoder
+
+        logger.info(
+            f"Loading the cross-encoder model {self._model_id=}.", backend=self._backend
+        )
+
+        model = CrossEncoder(
             model_name=self._model_id,
             device=self._device,
         )
-        self._model.model.eval()
+        model.model.eval()
+        self._loaded_model = model
+
+        if self._backend != "torch":
+            self._onnx_model = load_onnx_model(
+                self._model_id,
+                task="text-classification",
+                quantize=self._backend == "onnx-int8",
+                device=self._device,
+            )
+            self._check_onnx_parity()
+
+    @property
+    def backend(self) -> str:
+        return self._backend
 
     def __call__(
-        self, pairs: list[tuple[str, str]], to_list: bool = True
+        self,
+        pairs: list[tuple[str, str]],
+        to_list: bool = True,
+        batch_size: int = settings.RERANKING_BATCH_SIZE,
     ) -> NDArray[np.float32] | list[float]:
-        scores = self._model.predict(pairs)
+        model = self._model  # Loads the ONNX graph as well, if required.
+        if self._onnx_model is None:
+            scores = model.predict(
+                pairs, batch_size=batch_size, show_progress_bar=False
+            )
+        else:
+            scores = self._predict_onnx(pairs, batch_size=batch_size)
 
         if to_list:
             scores = scores.tolist()
 
         return scores
+
+    def _predict_onnx(
+        self, pairs: list[tuple[str, str]], batch_size: int = 32
+    ) -> NDArray[np.float32]:
+        """Scores the pairs like `CrossEncoder.predict`, running the ONNX graph instead."""
+
+        import torch
+
+        scores = []
+        with torch.inference_mode():
+            for start in range(0, len(pairs), batch_size):
+                batch = pairs[start : start + batch_size]
+                features = self._model.tokenizer(
+                    [pair[0] for pair in batch],
+                    [pair[1] for pair in batch],
+                    padding=True,
+                    truncation="longest_first",
+                    return_tensors="pt",
+                    max_length=self._model.max_length,
+                )
+                outputs = self._onnx_model(
+                    **{
+                        k: v
+                        for k, v in features.items()
+                        if k in self._onnx_model.input_names
+                    }
+                )
+                logits = self._model.default_activation_function(outputs.logits)
+                if logits.shape[1] == 1:
+                    logits = logits[:, 0]
+
+                scores.append(logits.cpu().numpy())
+
+        if len(scores) == 0:
+            return np.array([], dtype=np.float32)
+
+        return np.concatenate(scores).astype(np.float32, copy=False)
+
+    def _check_onnx_parity(self) -> None:
+        """
+        Compares the ONNX scores with the PyTorch ones. If they differ by more than
+        `ONNX_PARITY_TOLERANCE`, the model falls back to the PyTorch backend.
+        """
+
+        pairs = [(PARITY_CHECK_TEXTS[0], text) for text in PARITY_CHECK_TEXTS]
+        reference = self._model.predict(pairs)
+        scores = self._predict_onnx(pairs)
+
+        max_abs_diff = float(np.abs(reference - scores).max())
+        if max_abs_diff > settings.ONNX_PARITY_TOLERANCE:
+            logger.error(
+                f"The {self._backend} scores of {self._model_id=} diverge from the PyTorch "
+                f"ones ({max_abs_diff=:.4f}). Falling back to the PyTorch backend."
+            )
+            self._onnx_model = None
+            self._backend = "torch"
+        else:
+            logger.info(
+                f"Using the {self._backend} backend for {self._model_id=}.",
+                max_abs_diff=round(max_abs_diff, 4),
+            )
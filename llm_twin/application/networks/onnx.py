@@ -0,0 +1,90 @@
+from pathlib import Path
+from typing import Literal
+
+from loguru import logger
+
+from llm_twin.domain.exceptions import ImproperlyConfigured
+from llm_twin.settings import settings
+
+InferenceBackend = Literal["torch", "onnx", "onnx-int8"]
+OnnxTask = Literal["feature-extraction", "text-classification"]
+
+INFERENCE_BACKENDS = ("torch", "onnx", "onnx-int8")
+
+
+def validate_backend(backend: str) -> InferenceBackend:
+    if backend not in INFERENCE_BACKENDS:
+        raise ImproperlyConfigured(
+            f"Unsupported inference backend '{backend}'. Choose one of {INFERENCE_BACKENDS}."
+        )
+
+    return backend
+
+
+def load_onnx_model(
+    model_id: str,
+    task: OnnxTask,
+    quantize: bool = False,
+    device: str = settings.RAG_MODEL_DEVICE,
+    cache_dir: Path = Path(settings.ONNX_MODELS_CACHE_DIR).expanduser(),
+):
+    """
+    Loads the ONNX Runtime version of a Hugging Face model. On first use, the model is exported
+    to ONNX and, if required, dynamically quantized to int8. Both graphs are cached on disk.
+
+    Args:
+        model_id (str): The identifier of the pre-trained transformer model to export.
+        task (OnnxTask): The task the graph is exported for, which defines its outputs.
+        quantize (bool): Whether to load the int8-quantized graph. Defaults to False.
+        device (str): The device to run the graph on. Defaults to the RAG model device.
+        cache_dir (Path): The directory caching the exported graphs.
+
+    Returns:
+        ORTModel: The ONNX Runtime model, callable like the transformers model.
+    """
+
+    try:
+        from optimum.onnxruntime import (
+            ORTModelForFeatureExtraction,
+            ORTModelForSequenceClassification,
+            ORTQuantizer,
+        )
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    except ImportError as e:
+        raise ImproperlyConfigured(
+            "The ONNX backends require Optimum. Install with `poetry install --with onnx`."
+        ) from e
+
+    model_class = {
+        "feature-extraction": ORTModelForFeatureExtraction,
+        "text-classification": ORTModelForSequenceClassification,
+    }[task]
+    provider = (
+        "CUDAExecutionProvider" if device.startswith("cuda") else "CPUExecutionProvider"
+    )
+    export_dir = cache_dir / model_id.replace("/", "--") / task
+
+    file_name = "model.onnx"
+    if not (export_dir / file_name).exists():
+        logger.info(f"Exporting {model_id=} to ONNX.", export_dir=str(export_dir))
+
+        model = model_class.from_pretrained(model_id, export=True)
+        model.save_pretrained(export_dir)
+
+    if quantize:
+        file_name = "model_quantized.onnx"
+        if not (export_dir / file_name).exists():
+            logger.info(f"Quantizing the ONNX graph of {model_id=} to int8.")
+
+            quantizer = ORTQuantizer.from_pretrained(export_dir, file_name="model.onnx")
+            # AVX2 kernels run on every x86-64 CPU, unlike the AVX512 ones.
+            quantization_config = AutoQuantizationConfig.avx2(
+                is_static=False, per_channel=False
+            )
+            quantizer.quantize(
+                save_dir=export_dir, quantization_config=quantization_config
+            )
+
+    return model_class.from_pretrained(
+        export_dir, file_name=file_name, provider=provider
+    )
@@ -1,3 +1,13 @@
-from .dispatchers import ChunkingDispatcher, CleaningDispatcher, EmbeddingDispatcher
+from .dispatchers import (
+    ChunkingDispatcher,
+    CleaningDispatcher,
+    CleaningProcessPool,
+    EmbeddingDispatcher,
+)
 
-__all__ = ["CleaningDispatcher", "ChunkingDispatcher", "EmbeddingDispatcher"]
+__all__ = [
+    "CleaningDispatcher",
+    "CleaningProcessPool",
+    "ChunkingDispatcher",
+    "EmbeddingDispatcher",
+]
@@ -11,7 +11,7 @@ from llm_twin.domain.cleaned_documents import (
     CleanedRepositoryDocument,
 )
 
-from .operations import chunk_article, chunk_text
+from .operations import chunk_article, chunk_texts
 
 CleanedDocumentT = TypeVar("CleanedDocumentT", bound=CleanedDocument)
 ChunkT = TypeVar("ChunkT", bound=Chunk)
@@ -34,6 +34,9 @@ class ChunkingDataHandler(ABC, Generic[CleanedDocumentT, ChunkT]):
     def chunk(self, data_model: CleanedDocumentT) -> list[ChunkT]:
         pass
 
+    def chunk_batch(self, data_models: list[CleanedDocumentT]) -> list[list[ChunkT]]:
+        return [self.chunk(data_model) for data_model in data_models]
+
 
 class PostChunkingHandler(ChunkingDataHandler):
     @property
@@ -44,30 +47,36 @@ class PostChunkingHandler(ChunkingDataHandler):
         }
 
     def chunk(self, data_model: CleanedPostDocument) -> list[PostChunk]:
-        data_models_list = []
+        return self.chunk_batch([data_model])[0]
 
-        cleaned_content = data_model.content
-        chunks = chunk_text(
-            cleaned_content,
+    def chunk_batch(
+        self, data_models: list[CleanedPostDocument]
+    ) -> list[list[PostChunk]]:
+        chunks_per_document = chunk_texts(
+            [data_model.content for data_model in data_models],
             chunk_size=self.metadata["chunk_size"],
             chunk_overlap=self.metadata["chunk_overlap"],
         )
 
-        for chunk in chunks:
-            chunk_id = hashlib.md5(chunk.encode()).hexdigest()
-            model = PostChunk(
-                id=UUID(chunk_id, version=4),
-                content=chunk,
-                platform=data_model.platform,
-                document_id=data_model.id,
-                author_id=data_model.author_id,
-                author_full_name=data_model.author_full_name,
-                image=data_model.image if data_model.image else None,
-                metadata=self.metadata,
-            )
-            data_models_list.append(model)
-
-        return data_models_list
+        data_models_lists = []
+        for data_model, chunks in zip(data_models, chunks_per_document, strict=True):
+            data_models_list = []
+            for chunk in chunks:
+                chunk_id = hashlib.md5(chunk.encode()).hexdigest()
+                model = PostChunk(
+                    id=UUID(chunk_id, version=4),
+                    content=chunk,
+                    platform=data_model.platform,
+                    document_id=data_model.id,
+                    author_id=data_model.author_id,
+                    author_full_name=data_model.author_full_name,
+                    image=data_model.image if data_model.image else None,
+                    metadata=self.metadata,
+                )
+                data_models_list.append(model)
+            data_models_lists.append(data_models_list)
+
+        return data_models_lists
 
 
 class ArticleChunkingHandler(ChunkingDataHandler):
@@ -114,28 +123,34 @@ class RepositoryChunkingHandler(ChunkingDataHandler):
         }
 
     def chunk(self, data_model: CleanedRepositoryDocument) -> list[RepositoryChunk]:
-        data_models_list = []
+        return self.chunk_batch([data_model])[0]
 
-        cleaned_content = data_model.content
-        chunks = chunk_text(
-            cleaned_content,
+    def chunk_batch(
+        self, data_models: list[CleanedRepositoryDocument]
+    ) -> list[list[RepositoryChunk]]:
+        chunks_per_document = chunk_texts(
+            [data_model.content for data_model in data_models],
             chunk_size=self.metadata["chunk_size"],
             chunk_overlap=self.metadata["chunk_overlap"],
         )
 
-        for chunk in chunks:
-            chunk_id = hashlib.md5(chunk.encode()).hexdigest()
-            model = RepositoryChunk(
-                id=UUID(chunk_id, version=4),
-                content=chunk,
-                platform=data_model.platform,
-                name=data_model.name,
-                link=data_model.link,
-                document_id=data_model.id,
-                author_id=data_model.author_id,
-                author_full_name=data_model.author_full_name,
-                metadata=self.metadata,
-            )
-            data_models_list.append(model)
-
-        return data_models_list
+        data_models_lists = []
+        for data_model, chunks in zip(data_models, chunks_per_document, strict=True):
+            data_models_list = []
+            for chunk in chunks:
+                chunk_id = hashlib.md5(chunk.encode()).hexdigest()
+                model = RepositoryChunk(
+                    id=UUID(chunk_id, version=4),
+                    content=chunk,
+                    platform=data_model.platform,
+                    name=data_model.name,
+                    link=data_model.link,
+                    document_id=data_model.id,
+                    author_id=data_model.author_id,
+                    author_full_name=data_model.author_full_name,
+                    metadata=self.metadata,
+                )
+                data_models_list.append(model)
+            data_models_lists.append(data_models_list)
+
+        return data_models_lists
@@ -1,7 +1,15 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+
 from loguru import logger
 
+from llm_twin.application.networks.base import SingletonMeta
 from llm_twin.domain.base import NoSQLBaseDocument, VectorBaseDocument
 from llm_twin.domain.types import DataCategory
+from llm_twin.settings import settings
 
 from .chunking_data_handlers import (
     ArticleChunkingHandler,
@@ -54,6 +62,113 @@ class CleaningDispatcher:
 
         return clean_model
 
+    @classmethod
+    def dispatch_batch(
+        cls,
+        data_models: list[NoSQLBaseDocument],
+        num_workers: int | None = None,
+        chunk_size: int = 16,
+        min_parallel_documents: int = 32,
+    ) -> list[tuple[VectorBaseDocument | None, float]]:
+        """
+        Cleans the documents across a pool of worker processes.
+
+        The workers of the `CleaningProcessPool` are reused across calls, hence the documents can
+        be cleaned batch by batch without starting new processes every time.
+
+        Args:
+            data_models (list[NoSQLBaseDocument]): The raw documents to clean.
+            num_workers (int | None): The number of worker processes, only used when the pool is
+                started. Defaults to `settings.CLEANING_NUM_WORKERS`.
+            chunk_size (int): The number of documents sent to a worker at once. Defaults to 16.
+            min_parallel_documents (int): Fewer documents are cleaned serially, as starting the
+                workers would cost more than it saves. Defaults to 32.
+
+        Returns:
+            list[tuple[VectorBaseDocument | None, float]]: For each input document, in order, the
+                cleaned document, or None if it failed to be cleaned, and the cleaning time in
+                seconds.
+        """
+
+        pool = CleaningProcessPool(
+            num_workers=num_workers or settings.CLEANING_NUM_WORKERS
+        )
+        if pool.num_workers <= 1 or len(data_models) < min_parallel_documents:
+            return [_dispatch_cleaning(data_model) for data_model in data_models]
+
+        return pool.map(data_models, chunk_size=chunk_size)
+
+
+class CleaningProcessPool(metaclass=SingletonMeta):
+    """
+    A singleton pool of worker processes cleaning the documents of `CleaningDispatcher`. The
+    workers are started on first use and stopped by `shutdown`, after which the pool can be used
+    again.
+    """
+
+    def __init__(self, num_workers: int | None = settings.CLEANING_NUM_WORKERS) -> None:
+        self._num_workers = max(num_workers or os.cpu_count() or 1, 1)
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+
+    @property
+    def num_workers(self) -> int:
+        return self._num_workers
+
+    def map(
+        self, data_models: list[NoSQLBaseDocument], chunk_size: int = 16
+    ) -> list[tuple[VectorBaseDocument | None, float]]:
+        """Cleans the documents in the worker processes, see `CleaningDispatcher.dispatch_batch`."""
+
+        return list(
+            self._get_executor().map(
+                _dispatch_cleaning, data_models, chunksize=chunk_size
+            )
+        )
+
+    def shutdown(self) -> None:
+        """Stops the worker processes, if they were started."""
+
+        with self._lock:
+            if self._executor is None:
+                return
+
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+        logger.info("Cleaning pool shut down.", num_workers=self._num_workers)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                logger.info(
+                    "Starting the cleaning pool.", num_workers=self._num_workers
+                )
+                # Workers are spawned rather than forked, as the parent process runs database
+                # threads.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._num_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+
+            return self._executor
+
+
+def _dispatch_cleaning(
+    data_model: NoSQLBaseDocument,
+) -> tuple[VectorBaseDocument | None, float]:
+    """Cleans a single document, isolating its failure from the other documents."""
+
+    start_time = time.perf_counter()
+    try:
+        clean_model = CleaningDispatcher.dispatch(data_model)
+    except Exception:
+        logger.exception("Failed to clean document.", document_id=str(data_model.id))
+        clean_model = None
+
+    return clean_model, time.perf_counter() - start_time
+
 
 class ChunkingHandlerFactory:
     @staticmethod
@@ -85,6 +200,39 @@ class ChunkingDispatcher:
 
         return chunk_models
 
+    @classmethod
+    def dispatch_batch(
+        cls, data_models: list[VectorBaseDocument]
+    ) -> list[list[VectorBaseDocument]]:
+        """
+        Chunks the documents in one batch per category, and returns their chunks in the order of
+        the input documents.
+        """
+
+        document_indices_by_category = {}
+        for i, data_model in enumerate(data_models):
+            document_indices_by_category.setdefault(
+                data_model.get_category(), []
+            ).append(i)
+
+        chunk_models = [[] for _ in data_models]
+        for data_category, document_indices in document_indices_by_category.items():
+            handler = cls.factory.create_handler(data_category)
+            batched_chunk_models = handler.chunk_batch(
+                [data_models[i] for i in document_indices]
+            )
+            for i, document_chunk_models in zip(document_indices, batched_chunk_models):
+                chunk_models[i] = document_chunk_models
+
+            logger.info(
+                "Documents chunked successfully.",
+                num_documents=len(document_indices),
+                num=sum(len(models) for models in batched_chunk_models),
+                data_category=data_category,
+            )
+
+        return chunk_models
+
 
 class EmbeddingHandlerFactory:
     @staticmethod
@@ -1,7 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, cast
+from typing import Generic, TypeVar
 
-from llm_twin.application.networks import EmbeddingModelSingleton
+import numpy as np
+from numpy.typing import NDArray
+
+from llm_twin.application.networks import (
+    EmbeddingCache,
+    EmbeddingModelSingleton,
+    EmbeddingProcessPool,
+)
 from llm_twin.domain.chunks import ArticleChunk, Chunk, PostChunk, RepositoryChunk
 from llm_twin.domain.embedded_chunks import (
     EmbeddedArticleChunk,
@@ -10,12 +17,11 @@ from llm_twin.domain.embedded_chunks import (
     EmbeddedRepositoryChunk,
 )
 from llm_twin.domain.queries import EmbeddedQuery, Query
+from llm_twin.settings import settings
 
 ChunkT = TypeVar("ChunkT", bound=Chunk)
 EmbeddedChunkT = TypeVar("EmbeddedChunkT", bound=EmbeddedChunk)
 
-embedding_model = EmbeddingModelSingleton()
-
 
 class EmbeddingDataHandler(ABC, Generic[ChunkT, EmbeddedChunkT]):
     """
@@ -28,22 +34,46 @@ class EmbeddingDataHandler(ABC, Generic[ChunkT, EmbeddedChunkT]):
 
     def embed_batch(self, data_model: list[ChunkT]) -> list[EmbeddedChunkT]:
         embedding_model_input = [data_model.content for data_model in data_model]
-        embeddings = embedding_model(embedding_model_input, to_list=True)
+        model = self._get_embedding_model(len(embedding_model_input))
+        if settings.EMBEDDING_CACHE_ENABLED:
+            embeddings = EmbeddingCache().embed(embedding_model_input, model)
+        else:
+            embeddings = model(embedding_model_input, to_list=False)
 
         embedded_chunk = [
-            self.map_model(data_model, cast(list[float], embedding))
+            self.map_model(data_model, embedding)
             for data_model, embedding in zip(data_model, embeddings, strict=False)
         ]
 
         return embedded_chunk
 
+    @staticmethod
+    def _get_embedding_model(
+        num_inputs: int,
+    ) -> EmbeddingModelSingleton | EmbeddingProcessPool:
+        """Large inputs are sharded across the embedding pool, when enabled."""
+
+        if (
+            settings.EMBEDDING_POOL_NUM_WORKERS > 0
+            and num_inputs >= settings.EMBEDDING_POOL_MIN_BATCH_SIZE
+        ):
+            return EmbeddingProcessPool()
+
+        return EmbeddingModelSingleton()
+
     @abstractmethod
-    def map_model(self, data_model: ChunkT, embedding: list[float]) -> EmbeddedChunkT:
+    def map_model(
+        self, data_model: ChunkT, embedding: NDArray[np.float32]
+    ) -> EmbeddedChunkT:
         pass
 
 
 class QueryEmbeddingHandler(EmbeddingDataHandler):
-    def map_model(self, data_model: Query, embedding: list[float]) -> EmbeddedQuery:
+    def map_model(
+        self, data_model: Query, embedding: NDArray[np.float32]
+    ) -> EmbeddedQuery:
+        embedding_model = EmbeddingModelSingleton()
+
         return EmbeddedQuery(
             id=data_model.id,
             author_id=data_model.author_id,
@@ -59,7 +89,11 @@ class QueryEmbeddingHandler(EmbeddingDataHandler):
 
 
 class PostEmbeddingHandler(EmbeddingDataHandler):
-    def map_model(self, data_model: PostChunk, embedding: list[float]) -> EmbeddedPostChunk:
+    def map_model(
+        self, data_model: PostChunk, embedding: NDArray[np.float32]
+    ) -> EmbeddedPostChunk:
+        embedding_model = EmbeddingModelSingleton()
+
         return EmbeddedPostChunk(
             id=data_model.id,
             content=data_model.content,
@@ -77,7 +111,11 @@ class PostEmbeddingHandler(EmbeddingDataHandler):
 
 
 class ArticleEmbeddingHandler(EmbeddingDataHandler):
-    def map_model(self, data_model: ArticleChunk, embedding: list[float]) -> EmbeddedArticleChunk:
+    def map_model(
+        self, data_model: ArticleChunk, embedding: NDArray[np.float32]
+    ) -> EmbeddedArticleChunk:
+        embedding_model = EmbeddingModelSingleton()
+
         return EmbeddedArticleChunk(
             id=data_model.id,
             content=data_model.content,
@@ -97,8 +135,10 @@ class ArticleEmbeddingHandler(EmbeddingDataHandler):
 
 class RepositoryEmbeddingHandler(EmbeddingDataHandler):
     def map_model(
-        self, data_model: RepositoryChunk, embedding: list[float]
+        self, data_model: RepositoryChunk, embedding: NDArray[np.float32]
     ) -> EmbeddedRepositoryChunk:
+        embedding_model = EmbeddingModelSingleton()
+
         return EmbeddedRepositoryChunk(
             id=data_model.id,
             content=data_model.content,
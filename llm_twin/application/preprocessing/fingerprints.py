@@ -0,0 +1,387 @@
+import hashlib
+import json
+
+from loguru import logger
+from pydantic import UUID4, BaseModel
+
+from llm_twin.application import utils
+from llm_twin.domain.base import NoSQLBaseDocument, VectorBaseDocument
+from llm_twin.domain.cleaned_documents import (
+    CleanedArticleDocument,
+    CleanedPostDocument,
+    CleanedRepositoryDocument,
+)
+from llm_twin.domain.documents import (
+    ArticleDocument,
+    Document,
+    PostDocument,
+    RepositoryDocument,
+)
+from llm_twin.domain.embedded_chunks import (
+    EmbeddedArticleChunk,
+    EmbeddedChunk,
+    EmbeddedPostChunk,
+    EmbeddedRepositoryChunk,
+)
+from llm_twin.domain.fingerprints import DocumentFingerprint
+from llm_twin.domain.types import DataCategory
+from llm_twin.settings import settings
+
+
+class DocumentChanges(BaseModel):
+    new_documents: list[Document] = []
+    updated_documents: list[Document] = []
+    unchanged_documents: list[Document] = []
+    deleted_fingerprints: list[DocumentFingerprint] = []
+
+    @property
+    def changed_documents(self) -> list[Document]:
+        return self.new_documents + self.updated_documents
+
+
+class FingerprintStore:
+    """
+    Keeps the fingerprints of the raw documents loaded into the vector database, which lets the
+    feature engineering pipeline process only the new or changed documents, and delete the chunks
+    that their new versions no longer produce.
+    """
+
+    raw_document_classes: dict[DataCategory, type[NoSQLBaseDocument]] = {
+        DataCategory.POSTS: PostDocument,
+        DataCategory.ARTICLES: ArticleDocument,
+        DataCategory.REPOSITORIES: RepositoryDocument,
+    }
+    cleaned_document_classes: dict[DataCategory, type[VectorBaseDocument]] = {
+        DataCategory.POSTS: CleanedPostDocument,
+        DataCategory.ARTICLES: CleanedArticleDocument,
+        DataCategory.REPOSITORIES: CleanedRepositoryDocument,
+    }
+    embedded_chunk_classes: dict[DataCategory, type[VectorBaseDocument]] = {
+        DataCategory.POSTS: EmbeddedPostChunk,
+        DataCategory.ARTICLES: EmbeddedArticleChunk,
+        DataCategory.REPOSITORIES: EmbeddedRepositoryChunk,
+    }
+
+    @classmethod
+    def get_changes(
+        cls, documents: list[Document], author_ids: list[UUID4]
+    ) -> DocumentChanges:
+        """
+        Compares the raw documents of the authors with their fingerprints.
+
+        Args:
+            documents (list[Document]): All the raw documents of the authors.
+            author_ids (list[UUID4]): The authors whose documents were queried.
+
+        Returns:
+            DocumentChanges: The new, updated and unchanged documents, and the fingerprints of the
+                documents that were deleted from the data warehouse.
+
+        Raises:
+            RuntimeError: If the raw documents of some fingerprints are missing from `documents`
+                but still in the data warehouse, i.e. their query failed or was incomplete.
+        """
+
+        fingerprints = cls.get_fingerprints(author_ids)
+
+        changes = DocumentChanges()
+        for document in documents:
+            fingerprint = fingerprints.pop(str(document.id), None)
+            if fingerprint is None:
+                changes.new_documents.append(document)
+            elif cls.is_changed(document, fingerprint):
+                changes.updated_documents.append(document)
+            else:
+                changes.unchanged_documents.append(document)
+        changes.deleted_fingerprints = cls.get_deleted(list(fingerprints))
+
+        return changes
+
+    @staticmethod
+    def get_fingerprints(author_ids: list[UUID4]) -> dict[str, dict]:
+        """
+        Returns the content hash and embedding model id of the fingerprints of the authors, by
+        document id. The chunk hashes are only fetched for the deleted documents.
+        """
+
+        return {
+            fingerprint["_id"]: fingerprint
+            for fingerprint in DocumentFingerprint.iter_find(
+                {"author_id": {"$in": [str(author_id) for author_id in author_ids]}},
+                projection=["content_hash", "embedding_model_id"],
+                raw=True,
+            )
+        }
+
+    @classmethod
+    def is_changed(cls, document: Document, fingerprint: dict) -> bool:
+        return (
+            fingerprint["content_hash"] != cls.hash_document(document)
+            or fingerprint["embedding_model_id"] != settings.TEXT_EMBEDDING_MODEL_ID
+        )
+
+    @classmethod
+    def get_deleted(cls, fingerprint_ids: list[str]) -> list[DocumentFingerprint]:
+        """
+        Returns the fingerprints whose raw documents were deleted from the data warehouse.
+
+        Raises:
+            RuntimeError: If some raw documents are still in the data warehouse.
+        """
+
+        if not fingerprint_ids:
+            return []
+
+        fingerprints = DocumentFingerprint.bulk_find(_id={"$in": fingerprint_ids})
+        cls._check_deleted(fingerprints)
+
+        return fingerprints
+
+    @classmethod
+    def _check_deleted(cls, fingerprints: list[DocumentFingerprint]) -> None:
+        # A failed query of the data warehouse returns no documents, which would look deleted and
+        # have their chunks wiped, hence they are checked to be gone before anything is deleted.
+        for category, category_fingerprints in cls._group_by_category(
+            fingerprints
+        ).items():
+            existing_documents = list(
+                cls.raw_document_classes[category].iter_find(
+                    {
+                        "_id": {
+                            "$in": [
+                                str(fingerprint.id)
+                                for fingerprint in category_fingerprints
+                            ]
+                        }
+                    },
+                    projection=["id"],
+                    raw=True,
+                )
+            )
+            if existing_documents:
+                raise RuntimeError(
+                    f"The data warehouse still holds {len(existing_documents)} of the {category} "
+                    "missing from the queried documents. Their query failed or was incomplete, "
+                    "hence no fingerprint is deleted."
+                )
+
+    @classmethod
+    def delete(cls, fingerprints: list[DocumentFingerprint]) -> int:
+        """
+        Deletes the cleaned documents and the chunks of deleted raw documents from the vector
+        database, then their fingerprints. The chunks shared with other documents are kept. A
+        fingerprint is kept if its vectors couldn't be deleted, so that the next run retries.
+
+        Returns:
+            int: The number of deleted chunks.
+        """
+
+        shared_chunk_ids = cls._get_shared_chunk_ids(
+            {
+                chunk_id
+                for fingerprint in fingerprints
+                for chunk_id in fingerprint.chunk_hashes
+            },
+            excluded_document_ids=[str(fingerprint.id) for fingerprint in fingerprints],
+        )
+
+        num_deleted_chunks = 0
+        deleted_fingerprint_ids = []
+        for category, category_fingerprints in cls._group_by_category(
+            fingerprints
+        ).items():
+            chunk_ids = {
+                chunk_id
+                for fingerprint in category_fingerprints
+                for chunk_id in fingerprint.chunk_hashes
+                if chunk_id not in shared_chunk_ids
+            }
+            document_ids = [fingerprint.id for fingerprint in category_fingerprints]
+
+            chunks_deleted = cls.embedded_chunk_classes[category].bulk_delete(chunk_ids)
+            documents_deleted = cls.cleaned_document_classes[category].bulk_delete(
+                document_ids
+            )
+            if chunks_deleted and documents_deleted:
+                num_deleted_chunks += len(chunk_ids)
+                deleted_fingerprint_ids.extend(
+                    str(document_id) for document_id in document_ids
+                )
+
+        DocumentFingerprint.bulk_delete(deleted_fingerprint_ids)
+
+        return num_deleted_chunks
+
+    @classmethod
+    def update(
+        cls,
+        documents: list[Document],
+        num_chunks_per_document: dict[str, int],
+        embedded_chunks: list[EmbeddedChunk],
+    ) -> dict:
+        """
+        Fingerprints the documents loaded into the vector database and deletes the orphaned chunks
+        of their previous versions.
+
+        Args:
+            documents (list[Document]): The new or changed raw documents.
+            num_chunks_per_document (dict[str, int]): The number of chunks of each cleaned
+                document. The documents that failed to be cleaned, or whose chunks weren't all
+                embedded, aren't fingerprinted, hence are processed again by the next run.
+            embedded_chunks (list[EmbeddedChunk]): The embedded chunks of the documents.
+
+        Returns:
+            dict: The number of fingerprinted and unembedded documents, and of new, unchanged and
+                orphaned chunks.
+        """
+
+        chunks_by_document = {}
+        for embedded_chunk in embedded_chunks:
+            document_id = str(embedded_chunk.document_id)
+            chunks_by_document.setdefault(document_id, []).append(embedded_chunk)
+        # Chunks are identified by the hash of their content, so two documents can share a chunk.
+        loaded_chunk_ids = {
+            str(embedded_chunk.id) for embedded_chunk in embedded_chunks
+        }
+
+        cleaned_documents = [
+            document
+            for document in documents
+            if str(document.id) in num_chunks_per_document
+        ]
+        documents = [
+            document
+            for document in cleaned_documents
+            if len(chunks_by_document.get(str(document.id), []))
+            == num_chunks_per_document[str(document.id)]
+        ]
+        stats = {
+            "num_unembedded_documents": len(cleaned_documents) - len(documents),
+            "num_new_chunks": 0,
+            "num_unchanged_chunks": 0,
+            "num_orphaned_chunks": 0,
+        }
+        if stats["num_unembedded_documents"] > 0:
+            logger.warning(
+                "Some chunks failed to be embedded. Their documents aren't fingerprinted.",
+                num_unembedded_documents=stats["num_unembedded_documents"],
+            )
+
+        document_ids = [str(document.id) for document in documents]
+        previous_chunk_hashes_by_document = {
+            fingerprint["_id"]: fingerprint.get("chunk_hashes", {})
+            for fingerprint in DocumentFingerprint.iter_find(
+                {"_id": {"$in": document_ids}}, projection=["chunk_hashes"], raw=True
+            )
+        }
+
+        fingerprints = []
+        orphaned_chunk_ids = {}
+        for document in documents:
+            chunk_hashes = {
+                str(embedded_chunk.id): cls.hash_chunk(embedded_chunk)
+                for embedded_chunk in chunks_by_document.get(str(document.id), [])
+            }
+            fingerprint = DocumentFingerprint(
+                id=document.id,
+                category=DataCategory(document.get_collection_name()),
+                author_id=document.author_id,
+                content_hash=cls.hash_document(document),
+                embedding_model_id=settings.TEXT_EMBEDDING_MODEL_ID,
+                chunk_hashes=chunk_hashes,
+            )
+            fingerprints.append(fingerprint)
+
+            previous_chunk_hashes = previous_chunk_hashes_by_document.get(
+                str(document.id), {}
+            )
+            for chunk_id, chunk_hash in chunk_hashes.items():
+                if previous_chunk_hashes.get(chunk_id) == chunk_hash:
+                    stats["num_unchanged_chunks"] += 1
+                else:
+                    stats["num_new_chunks"] += 1
+            orphaned_chunk_ids.setdefault(fingerprint.category, set()).update(
+                set(previous_chunk_hashes) - loaded_chunk_ids
+            )
+
+        shared_chunk_ids = cls._get_shared_chunk_ids(
+            set().union(*orphaned_chunk_ids.values()),
+            excluded_document_ids=document_ids,
+        )
+        fingerprinted_categories = set()
+        for category, chunk_ids in orphaned_chunk_ids.items():
+            chunk_ids = chunk_ids - shared_chunk_ids
+            if cls.embedded_chunk_classes[category].bulk_delete(chunk_ids):
+                fingerprinted_categories.add(category)
+                stats["num_orphaned_chunks"] += len(chunk_ids)
+            else:
+                logger.error(
+                    f"Failed to delete the orphaned chunks of the {category} documents."
+                )
+
+        # The documents whose orphaned chunks couldn't be deleted are processed again next run.
+        fingerprints = [
+            fingerprint
+            for fingerprint in fingerprints
+            if fingerprint.category in fingerprinted_categories
+        ]
+        if not DocumentFingerprint.bulk_upsert(fingerprints):
+            fingerprints = []
+        stats["num_fingerprinted_documents"] = len(fingerprints)
+
+        return stats
+
+    @staticmethod
+    def _get_shared_chunk_ids(
+        chunk_ids: set[str], excluded_document_ids: list[str]
+    ) -> set[str]:
+        """
+        Returns the chunk ids still referenced by the fingerprints of other documents than the
+        excluded ones, whose points must be kept.
+        """
+
+        shared_chunk_ids = set()
+        for chunk_ids_batch in utils.misc.batch(sorted(chunk_ids), size=500):
+            for fingerprint in DocumentFingerprint.iter_find(
+                {
+                    "_id": {"$nin": excluded_document_ids},
+                    "$or": [
+                        {f"chunk_hashes.{chunk_id}": {"$exists": True}}
+                        for chunk_id in chunk_ids_batch
+                    ],
+                },
+                projection=["chunk_hashes"],
+                raw=True,
+            ):
+                shared_chunk_ids.update(
+                    chunk_ids.intersection(fingerprint["chunk_hashes"])
+                )
+
+        return shared_chunk_ids
+
+    @staticmethod
+    def hash_document(document: Document) -> str:
+        parsed = document.to_mongo()
+        parsed.pop("_id", None)
+
+        return hashlib.md5(
+            json.dumps(parsed, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    @staticmethod
+    def hash_chunk(embedded_chunk: EmbeddedChunk) -> str:
+        payload = embedded_chunk.model_dump(exclude={"id", "embedding"})
+
+        return hashlib.md5(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    @staticmethod
+    def _group_by_category(
+        fingerprints: list[DocumentFingerprint],
+    ) -> dict[DataCategory, list[DocumentFingerprint]]:
+        grouped = {}
+        for fingerprint in fingerprints:
+            grouped.setdefault(fingerprint.category, []).append(fingerprint)
+
+        return grouped
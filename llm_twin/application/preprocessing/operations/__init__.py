@@ -1,8 +1,11 @@
-from .chunking import chunk_article, chunk_text
+from .chunking import chunk_article, chunk_text, iter_article_chunks
 from .cleaning import clean_text
+from .token_chunking import chunk_texts
 
 __all__ = [
     "chunk_article",
     "chunk_text",
+    "chunk_texts",
     "clean_text",
+    "iter_article_chunks",
 ]
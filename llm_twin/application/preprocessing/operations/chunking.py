@@ -1,26 +1,16 @@
 import re
+from collections.abc import Iterator
 
-from langchain.text_splitter import (
-    RecursiveCharacterTextSplitter,
-    SentenceTransformersTokenTextSplitter,
-)
+from .splitters import get_text_splitters
 
-from llm_twin.application.networks import EmbeddingModelSingleton
-
-embedding_model = EmbeddingModelSingleton()
+SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s")
 
 
 def chunk_text(text: str, chunk_size: int = 500, chunk_overlap: int = 50) -> list[str]:
-    character_splitter = RecursiveCharacterTextSplitter(
-        separators=["\n\n"], chunk_size=chunk_size, chunk_overlap=0
-    )
+    character_splitter, token_splitter = get_text_splitters(chunk_size, chunk_overlap)
+
     text_split_by_characters = character_splitter.split_text(text)
 
-    token_splitter = SentenceTransformersTokenTextSplitter(
-        chunk_overlap=chunk_overlap,
-        tokens_per_chunk=embedding_model.max_input_length,
-        model_name=embedding_model.model_id,
-    )
     chunks_by_tokens = []
     for section in text_split_by_characters:
         chunks_by_tokens.extend(token_splitter.split_text(section))
@@ -35,23 +25,45 @@ def chunk_document(text: str, min_length: int, max_length: int) -> list[str]:
 
 
 def chunk_article(text: str, min_length: int, max_length: int) -> list[str]:
-    sentences = re.split(r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s", text)
+    return list(iter_article_chunks(text, min_length, max_length))
+
+
+def iter_article_chunks(text: str, min_length: int, max_length: int) -> Iterator[str]:
+    """
+    Yields the chunks of whole sentences of the text, of at most `max_length` characters, as
+    they are built. Chunks shorter than `min_length` characters are dropped.
 
-    extracts = []
-    current_chunk = ""
-    for sentence in sentences:
+    The lengths are tracked numerically and each chunk is joined once, hence the text is chunked
+    in linear time.
+    """
+
+    chunk_sentences = []
+    # Length of the sentences of the chunk, each one followed by a space.
+    chunk_length = 0
+    for sentence in iter_sentences(text):
         sentence = sentence.strip()
         if not sentence:
             continue
 
-        if len(current_chunk) + len(sentence) <= max_length:
-            current_chunk += sentence + " "
+        if chunk_length + len(sentence) <= max_length:
+            chunk_sentences.append(sentence)
+            chunk_length += len(sentence) + 1
         else:
-            if len(current_chunk) >= min_length:
-                extracts.append(current_chunk.strip())
-            current_chunk = sentence + " "
+            if chunk_length >= min_length:
+                yield " ".join(chunk_sentences)
+            chunk_sentences = [sentence]
+            chunk_length = len(sentence) + 1
+
+    if chunk_length >= min_length:
+        yield " ".join(chunk_sentences)
+
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """Yields the sentences of the text, split on the whitespace following their punctuation."""
 
-    if len(current_chunk) >= min_length:
-        extracts.append(current_chunk.strip())
+    start = 0
+    for match in SENTENCE_BOUNDARY_PATTERN.finditer(text):
+        yield text[start : match.start()]
+        start = match.end()
 
-    return extracts
+    yield text[start:]
@@ -0,0 +1,68 @@
+from threading import Lock
+
+from langchain.text_splitter import (
+    RecursiveCharacterTextSplitter,
+    SentenceTransformersTokenTextSplitter,
+    TextSplitter,
+)
+
+from llm_twin.application.networks import EmbeddingModelSingleton
+
+
+class EmbeddingModelTokenTextSplitter(SentenceTransformersTokenTextSplitter):
+    """
+    A SentenceTransformersTokenTextSplitter reusing the tokenizer of the embedding model, instead
+    of loading its own SentenceTransformer.
+    """
+
+    def __init__(
+        self,
+        embedding_model: EmbeddingModelSingleton,
+        chunk_overlap: int = 50,
+        tokens_per_chunk: int | None = None,
+    ) -> None:
+        TextSplitter.__init__(self, chunk_overlap=chunk_overlap)
+
+        self.model_name = embedding_model.model_id
+        self.tokenizer = embedding_model.tokenizer
+        self.maximum_tokens_per_chunk = embedding_model.max_input_length
+        self.tokens_per_chunk = tokens_per_chunk or self.maximum_tokens_per_chunk
+
+        if self.tokens_per_chunk > self.maximum_tokens_per_chunk:
+            raise ValueError(
+                f"The token limit of the model '{self.model_name}' is "
+                f"{self.maximum_tokens_per_chunk}, got tokens_per_chunk={self.tokens_per_chunk}."
+            )
+
+
+_splitters: dict[
+    tuple[str, int, int],
+    tuple[RecursiveCharacterTextSplitter, EmbeddingModelTokenTextSplitter],
+] = {}
+_splitters_lock = Lock()
+
+
+def get_text_splitters(
+    chunk_size: int, chunk_overlap: int
+) -> tuple[RecursiveCharacterTextSplitter, EmbeddingModelTokenTextSplitter]:
+    """
+    Returns the character and token splitters used by `chunk_text`. They are stateless, hence
+    they are built once per (model_id, chunk_size, chunk_overlap) and shared between threads.
+    """
+
+    embedding_model = EmbeddingModelSingleton()
+    key = (embedding_model.model_id, chunk_size, chunk_overlap)
+
+    with _splitters_lock:
+        if key not in _splitters:
+            character_splitter = RecursiveCharacterTextSplitter(
+                separators=["\n\n"], chunk_size=chunk_size, chunk_overlap=0
+            )
+            token_splitter = EmbeddingModelTokenTextSplitter(
+                embedding_model,
+                chunk_overlap=chunk_overlap,
+                tokens_per_chunk=embedding_model.max_input_length,
+            )
+            _splitters[key] = (character_splitter, token_splitter)
+
+        return _splitters[key]
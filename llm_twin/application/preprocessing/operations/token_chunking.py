@@ -0,0 +1,93 @@
+from collections.abc import Iterator
+
+from llm_twin.application.networks import EmbeddingModelSingleton
+
+from .splitters import get_text_splitters
+
+
+def chunk_texts(
+    texts: list[str],
+    chunk_size: int = 500,
+    chunk_overlap: int = 50,
+    batch_size: int = 1024,
+) -> list[list[str]]:
+    """
+    Batch version of `chunk_text`, returning exactly the same chunks.
+
+    The texts are split into sections of at most `chunk_size` characters, as in `chunk_text`.
+    Then the sections of all the texts are tokenized in batches by the tokenizer of the embedding
+    model, windows of `max_input_length` tokens overlapping by `chunk_overlap` tokens are cut out
+    of them, and all the windows are decoded back to text in batches.
+
+    Args:
+        texts (list[str]): The texts to chunk.
+        chunk_size (int): The maximum number of characters of a section. Defaults to 500.
+        chunk_overlap (int): The number of tokens shared by consecutive chunks. Defaults to 50.
+        batch_size (int): The number of sections tokenized at once. Defaults to 1024.
+
+    Returns:
+        list[list[str]]: The chunks of each text, in the order of the input texts.
+    """
+
+    embedding_model = EmbeddingModelSingleton()
+    tokenizer = embedding_model.tokenizer
+    character_splitter, _ = get_text_splitters(chunk_size, chunk_overlap)
+
+    sections = []
+    text_indices = []
+    for text_index, text in enumerate(texts):
+        text_sections = character_splitter.split_text(text)
+        sections.extend(text_sections)
+        text_indices.extend([text_index] * len(text_sections))
+
+    chunks = [[] for _ in texts]
+    for start in range(0, len(sections), batch_size):
+        sections_batch = sections[start : start + batch_size]
+        # Tokenized like langchain's SentenceTransformersTokenTextSplitter, which strips the
+        # start and end tokens.
+        encodings = tokenizer(
+            sections_batch,
+            truncation=False,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+            verbose=False,
+        )
+
+        windows = []
+        window_text_indices = []
+        for i, token_ids in enumerate(encodings["input_ids"]):
+            section_windows = list(
+                split_token_ids(
+                    token_ids[1:-1],
+                    tokens_per_chunk=embedding_model.max_input_length,
+                    chunk_overlap=chunk_overlap,
+                )
+            )
+            windows.extend(section_windows)
+            window_text_indices.extend([text_indices[start + i]] * len(section_windows))
+
+        for text_index, chunk in zip(
+            window_text_indices, tokenizer.batch_decode(windows)
+        ):
+            chunks[text_index].append(chunk)
+
+    return chunks
+
+
+def split_token_ids(
+    token_ids: list[int], tokens_per_chunk: int, chunk_overlap: int
+) -> Iterator[list[int]]:
+    """
+    Yields the windows of `tokens_per_chunk` tokens, overlapping by `chunk_overlap` tokens, cut
+    by langchain's `split_text_on_tokens`.
+    """
+
+    num_tokens = len(token_ids)
+    start = 0
+    while start < num_tokens:
+        end = min(start + tokens_per_chunk, num_tokens)
+        yield token_ids[start:end]
+
+        if end == num_tokens:
+            break
+        start += tokens_per_chunk - chunk_overlap
@@ -0,0 +1,321 @@
+import contextlib
+import itertools
+import threading
+import time
+from queue import Full, Queue
+from typing import Any, Generator, Iterable, Iterator
+
+from loguru import logger
+from pydantic import UUID4
+
+from llm_twin.application import utils
+from llm_twin.domain.base import NoSQLBaseDocument, VectorBaseDocument
+from llm_twin.settings import settings
+
+from .dispatchers import ChunkingDispatcher, CleaningDispatcher, EmbeddingDispatcher
+from .fingerprints import FingerprintStore
+
+_STAGE_DONE = object()
+
+
+class StreamingFeaturePipeline:
+    """
+    Cleans, chunks and embeds a stream of raw documents with the same handlers as the feature
+    engineering steps, and upserts the results into the vector database batch by batch, without
+    ever materializing the whole corpus.
+
+    Each stage (read, clean, chunk, embed) runs in its own thread and hands its batches to the
+    next one through a bounded queue. A slow stage, usually the embedding, blocks the upstream
+    ones instead of letting batches pile up, hence memory stays constant regardless of the
+    corpus size.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.STREAMING_BATCH_SIZE,
+        max_queued_batches: int = settings.STREAMING_MAX_QUEUED_BATCHES,
+        embedding_batch_size: int = 256,
+        load_batch_size: int = 256,
+    ) -> None:
+        self._batch_size = batch_size
+        self._max_queued_batches = max_queued_batches
+        self._embedding_batch_size = embedding_batch_size
+        self._load_batch_size = load_batch_size
+
+    def run(
+        self,
+        documents: Iterable[NoSQLBaseDocument],
+        author_ids: list[UUID4] | None = None,
+    ) -> dict:
+        """
+        Processes the raw documents, which can be lazily fetched from the data warehouse.
+
+        Args:
+            documents (Iterable[NoSQLBaseDocument]): All the raw documents of the authors.
+            author_ids (list[UUID4] | None): When set, the run is incremental, as the batch
+                feature engineering steps: the unchanged documents of these authors are skipped,
+                the fingerprints of every loaded batch are updated and, once all the documents
+                went through, the vectors of the deleted documents are deleted.
+
+        Returns:
+            dict: A summary of the run: the number of documents and chunks going through each
+                stage, the loading statistics of each collection and the throughput.
+        """
+
+        summary = {
+            "num_documents": 0,
+            "num_failed_documents": 0,
+            "num_cleaned_documents": 0,
+            "num_chunks": 0,
+            "num_embedded_chunks": 0,
+            "loading": {},
+        }
+        fingerprints = None
+        if author_ids is not None:
+            summary.update(
+                {
+                    "num_new_documents": 0,
+                    "num_updated_documents": 0,
+                    "num_skipped_documents": 0,
+                    "fingerprints": {},
+                }
+            )
+            fingerprints = FingerprintStore.get_fingerprints(author_ids)
+            documents = self._filter_changed(documents, fingerprints, summary)
+
+        start_time = time.perf_counter()
+        batches = self._prefetch(itertools.batched(documents, self._batch_size))
+        batches = self._prefetch(self._clean(batches, summary))
+        batches = self._prefetch(self._chunk(batches, summary))
+        batches = self._prefetch(self._embed(batches, summary))
+        with contextlib.closing(batches):
+            for (
+                raw_documents,
+                cleaned_documents,
+                num_chunks_per_document,
+                embedded_chunks,
+            ) in batches:
+                cleaned_documents_loaded = self._load(
+                    cleaned_documents, summary["loading"]
+                )
+                embedded_chunks_loaded = self._load(embedded_chunks, summary["loading"])
+                if fingerprints is not None:
+                    self._update_fingerprints(
+                        raw_documents,
+                        num_chunks_per_document,
+                        embedded_chunks,
+                        loaded=cleaned_documents_loaded and embedded_chunks_loaded,
+                        fingerprints_summary=summary["fingerprints"],
+                    )
+        if fingerprints is not None:
+            # The fingerprints left were never matched by a document of the stream.
+            deleted_fingerprints = FingerprintStore.get_deleted(list(fingerprints))
+            summary["num_deleted_documents"] = len(deleted_fingerprints)
+            summary["num_deleted_chunks"] = FingerprintStore.delete(
+                deleted_fingerprints
+            )
+        duration = time.perf_counter() - start_time
+
+        summary["duration_seconds"] = round(duration, 3)
+        summary["documents_per_second"] = (
+            round(summary["num_documents"] / duration, 2) if duration > 0 else 0.0
+        )
+        summary["batch_size"] = self._batch_size
+        summary["max_queued_batches"] = self._max_queued_batches
+
+        return summary
+
+    @staticmethod
+    def _filter_changed(
+        documents: Iterable[NoSQLBaseDocument], fingerprints: dict, summary: dict
+    ) -> Generator[NoSQLBaseDocument, None, None]:
+        """Skips the unchanged documents, popping the fingerprints of all the documents read."""
+
+        for document in documents:
+            fingerprint = fingerprints.pop(str(document.id), None)
+            if fingerprint is None:
+                summary["num_new_documents"] += 1
+            elif FingerprintStore.is_changed(document, fingerprint):
+                summary["num_updated_documents"] += 1
+            else:
+                summary["num_skipped_documents"] += 1
+                continue
+
+            yield document
+
+    def _clean(
+        self, batches: Iterator[tuple[NoSQLBaseDocument, ...]], summary: dict
+    ) -> Generator[
+        tuple[list[NoSQLBaseDocument], list[VectorBaseDocument]], None, None
+    ]:
+        with contextlib.closing(batches):
+            for documents in batches:
+                documents = list(documents)
+                # The cleaning pool is reused across batches, until the caller shuts it down.
+                results = CleaningDispatcher.dispatch_batch(
+                    documents,
+                    chunk_size=settings.CLEANING_CHUNK_SIZE,
+                    min_parallel_documents=settings.CLEANING_MIN_PARALLEL_DOCUMENTS,
+                )
+                cleaned_documents = [
+                    document for document, _ in results if document is not None
+                ]
+
+                summary["num_documents"] += len(documents)
+                summary["num_failed_documents"] += len(documents) - len(
+                    cleaned_documents
+                )
+                summary["num_cleaned_documents"] += len(cleaned_documents)
+
+                yield documents, cleaned_documents
+
+    def _chunk(
+        self,
+        batches: Iterator[tuple[list[NoSQLBaseDocument], list[VectorBaseDocument]]],
+        summary: dict,
+    ) -> Generator[tuple[list, list, dict[str, int], list], None, None]:
+        with contextlib.closing(batches):
+            for documents, cleaned_documents in batches:
+                chunks_per_document = ChunkingDispatcher.dispatch_batch(
+                    cleaned_documents
+                )
+                num_chunks_per_document = {
+                    str(document.id): len(document_chunks)
+                    for document, document_chunks in zip(
+                        cleaned_documents, chunks_per_document
+                    )
+                }
+                chunks = utils.misc.flatten(chunks_per_document)
+                summary["num_chunks"] += len(chunks)
+
+                yield documents, cleaned_documents, num_chunks_per_document, chunks
+
+    def _embed(
+        self,
+        batches: Iterator[tuple[list, list, dict[str, int], list]],
+        summary: dict,
+    ) -> Generator[tuple[list, list, dict[str, int], list], None, None]:
+        with contextlib.closing(batches):
+            for (
+                documents,
+                cleaned_documents,
+                num_chunks_per_document,
+                chunks,
+            ) in batches:
+                embedded_chunks = []
+                for category_chunks in VectorBaseDocument.group_by_category(
+                    chunks
+                ).values():
+                    for batched_chunks in utils.misc.batch(
+                        category_chunks, self._embedding_batch_size
+                    ):
+                        embedded_chunks.extend(
+                            EmbeddingDispatcher.dispatch(batched_chunks)
+                        )
+                summary["num_embedded_chunks"] += len(embedded_chunks)
+
+                yield (
+                    documents,
+                    cleaned_documents,
+                    num_chunks_per_document,
+                    embedded_chunks,
+                )
+
+    def _load(self, documents: list[VectorBaseDocument], loading_summary: dict) -> bool:
+        """Returns whether all the documents were loaded."""
+
+        loaded = True
+        for document_class, class_documents in VectorBaseDocument.group_by_class(
+            documents
+        ).items():
+            stats = document_class.bulk_load(
+                class_documents, batch_size=self._load_batch_size
+            )
+            if stats["num_failed_documents"] > 0:
+                logger.error(
+                    f"Failed to insert some documents into {document_class.get_collection_name()}"
+                )
+                loaded = False
+
+            collection_summary = loading_summary.setdefault(
+                document_class.get_collection_name(),
+                {
+                    "num_documents": 0,
+                    "num_failed_documents": 0,
+                    "duration_seconds": 0.0,
+                },
+            )
+            for key in collection_summary:
+                collection_summary[key] = round(collection_summary[key] + stats[key], 3)
+
+        return loaded
+
+    @staticmethod
+    def _update_fingerprints(
+        documents: list[NoSQLBaseDocument],
+        num_chunks_per_document: dict[str, int],
+        embedded_chunks: list[VectorBaseDocument],
+        loaded: bool,
+        fingerprints_summary: dict,
+    ) -> None:
+        if not loaded:
+            logger.warning(
+                "Some documents of the batch failed to load into the vector database. "
+                "Skipping its fingerprints update, so that the next run processes them again."
+            )
+
+            return
+
+        stats = FingerprintStore.update(
+            documents,
+            num_chunks_per_document=num_chunks_per_document,
+            embedded_chunks=embedded_chunks,
+        )
+        for key, value in stats.items():
+            fingerprints_summary[key] = fingerprints_summary.get(key, 0) + value
+
+    def _prefetch(self, batches: Iterator[Any]) -> Generator[Any, None, None]:
+        """
+        Consumes the batches in a background thread, keeping at most `max_queued_batches` of them
+        ahead of the caller. The thread stops as soon as the caller stops iterating or closes the
+        generator, which every stage does on its input when it fails, so that an error doesn't
+        leave the upstream threads blocked on their full queues.
+        """
+
+        queue: Queue = Queue(maxsize=self._max_queued_batches)
+        stop = threading.Event()
+
+        def put(item: Any) -> None:
+            while not stop.is_set():
+                try:
+                    queue.put(item, timeout=0.1)
+
+                    return
+                except Full:
+                    continue
+
+        def produce() -> None:
+            try:
+                for batch in batches:
+                    put(batch)
+                    if stop.is_set():
+                        break
+            except Exception as e:
+                put(e)
+            finally:
+                # Stops the upstream stages as well.
+                if hasattr(batches, "close"):
+                    batches.close()
+                put(_STAGE_DONE)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            while (item := queue.get()) is not _STAGE_DONE:
+                if isinstance(item, Exception):
+                    raise item
+
+                yield item
+        finally:
+            stop.set()
+            producer.join()
@@ -0,0 +1,3 @@
+from .reranking import Reranker
+
+__all__ = ["Reranker"]
@@ -0,0 +1,120 @@
+import hashlib
+from collections import OrderedDict
+from threading import Lock
+
+import numpy as np
+from loguru import logger
+from numpy.typing import NDArray
+
+from llm_twin.application.networks import CrossEncoderModelSingleton
+from llm_twin.application.networks.base import SingletonMeta
+from llm_twin.domain.embedded_chunks import EmbeddedChunk
+from llm_twin.domain.queries import Query
+from llm_twin.settings import settings
+
+
+class Reranker(metaclass=SingletonMeta):
+    """
+    A singleton reranking service scoring (query, passage) pairs with the cross-encoder model.
+
+    The pairs are deduplicated and their scores cached in an LRU keyed by (query hash, passage
+    hash), hence the passages retrieved for several expanded queries are scored only once. The
+    remaining pairs are scored in batches of `batch_size`.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.RERANKING_BATCH_SIZE,
+        max_cache_items: int = settings.RERANKING_CACHE_MAX_ITEMS,
+    ) -> None:
+        self._batch_size = batch_size
+        self._max_cache_items = max_cache_items
+        self._cache: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._lock = Lock()
+
+    def generate(
+        self, query: Query, chunks: list[EmbeddedChunk], keep_top_k: int
+    ) -> list[tuple[EmbeddedChunk, float]]:
+        """
+        Reranks the chunks retrieved for the query.
+
+        Args:
+            query (Query): The query the chunks were retrieved for.
+            chunks (list[EmbeddedChunk]): The retrieved chunks.
+            keep_top_k (int): The number of chunks to keep.
+
+        Returns:
+            list[tuple[EmbeddedChunk, float]]: The `keep_top_k` best chunks with their score,
+                sorted by decreasing score.
+        """
+
+        scores = self.score([(query.content, chunk.content) for chunk in chunks])
+        top_k_indices = self.get_top_k_indices(scores, keep_top_k)
+
+        return [(chunks[i], float(scores[i])) for i in top_k_indices]
+
+    def score(self, pairs: list[tuple[str, str]]) -> NDArray[np.float32]:
+        """
+        Scores the (query, passage) pairs, sending only the unique uncached pairs to the model.
+
+        Args:
+            pairs (list[tuple[str, str]]): The (query, passage) pairs to score.
+
+        Returns:
+            NDArray[np.float32]: The scores, in the order of the input pairs.
+        """
+
+        keys = [
+            (self.hash_text(query), self.hash_text(passage)) for query, passage in pairs
+        ]
+
+        with self._lock:
+            scores = {}
+            for key in keys:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    scores[key] = self._cache[key]
+
+        missing_pairs = {
+            key: pair for key, pair in zip(keys, pairs) if key not in scores
+        }
+        if missing_pairs:
+            missing_scores = CrossEncoderModelSingleton()(
+                list(missing_pairs.values()), to_list=False, batch_size=self._batch_size
+            )
+            computed_scores = dict(zip(missing_pairs.keys(), missing_scores.tolist()))
+            scores.update(computed_scores)
+
+            with self._lock:
+                for key, score in computed_scores.items():
+                    self._cache[key] = score
+                    self._cache.move_to_end(key)
+                while len(self._cache) > self._max_cache_items:
+                    self._cache.popitem(last=False)
+
+        logger.debug(
+            "Reranking cache lookup.",
+            num_pairs=len(pairs),
+            num_misses=len(missing_pairs),
+        )
+
+        return np.array([scores[key] for key in keys], dtype=np.float32)
+
+    @staticmethod
+    def get_top_k_indices(scores: NDArray[np.float32], k: int) -> NDArray[np.int64]:
+        """
+        Returns the indices of the `k` highest scores, sorted by decreasing score. Only the top
+        `k` scores are sorted, after partitioning them from the rest with `np.argpartition`.
+        """
+
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.array([], dtype=np.int64)
+
+        top_k_indices = np.argpartition(-scores, k - 1)[:k]
+
+        return top_k_indices[np.argsort(-scores[top_k_indices], kind="stable")]
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.md5(text.encode()).hexdigest()
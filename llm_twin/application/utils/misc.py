@@ -1,9 +1,10 @@
-from typing import Generator
-
-from transformers import AutoTokenizer
+import asyncio
+from typing import Awaitable, Generator, Iterable, TypeVar
 
 from llm_twin.settings import settings
 
+T = TypeVar("T")
+
 
 def flatten(nested_list: list) -> list:
     """Flatten a list of lists into a single list."""
@@ -16,6 +17,30 @@ def batch(list_: list, size: int) -> Generator[list, None, None]:
 
 
 def compute_num_tokens(text: str) -> int:
+    from transformers import AutoTokenizer
+
     tokenizer = AutoTokenizer.from_pretrained(settings.HF_MODEL_ID)
 
     return len(tokenizer.encode(text, add_special_tokens=False))
+
+
+async def gather_with_concurrency(
+    coroutines: Iterable[Awaitable[T]],
+    max_concurrency: int,
+    return_exceptions: bool = False,
+) -> list[T | BaseException]:
+    """
+    Awaits the coroutines with at most `max_concurrency` of them running at once. Exceptions are
+    returned in place of the results when `return_exceptions` is set, as in `asyncio.gather`.
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(coroutine: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(
+        *(run(coroutine) for coroutine in coroutines),
+        return_exceptions=return_exceptions,
+    )
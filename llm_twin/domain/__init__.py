@@ -6,6 +6,7 @@ from . import (
     documents,
     embedded_chunks,
     exceptions,
+    fingerprints,
     prompt,
     types,
 )
@@ -18,6 +19,7 @@ __all__ = [
     "documents",
     "embedded_chunks",
     "exceptions",
+    "fingerprints",
     "prompt",
     "types",
 ]
@@ -1,4 +1,5 @@
+from .async_vector import AsyncVectorBaseDocument
 from .nosql import NoSQLBaseDocument
 from .vector import VectorBaseDocument
 
-__all__ = ["NoSQLBaseDocument", "VectorBaseDocument"]
+__all__ = ["AsyncVectorBaseDocument", "NoSQLBaseDocument", "VectorBaseDocument"]
@@ -0,0 +1,481 @@
+import asyncio
+import time
+from abc import ABC
+from functools import cache
+from typing import AsyncGenerator, Iterable, Type, TypeVar
+from uuid import UUID
+
+import numpy as np
+from loguru import logger
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import CollectionInfo, Filter, PointStruct
+
+from llm_twin.application.utils.misc import gather_with_concurrency
+from llm_twin.infrastructure.db.qdrant import (
+    QDRANT_REQUEST_ERRORS,
+    AsyncQdrantDatabaseConnector,
+    QdrantDatabaseConnector,
+)
+
+from .vector import VectorBaseDocument
+
+T = TypeVar("T", bound="AsyncVectorBaseDocument")
+
+_SEGMENT_DONE = object()
+
+
+def _get_connection() -> AsyncQdrantClient:
+    return AsyncQdrantDatabaseConnector()
+
+
+class AsyncVectorBaseDocument(VectorBaseDocument, ABC):
+    """
+    asyncio counterpart of `VectorBaseDocument` built on `AsyncQdrantClient`.
+    Every method talking to Qdrant is a coroutine (or an async generator) with the same
+    signature as its synchronous version, while the model helpers are inherited unchanged.
+    """
+
+    @classmethod
+    @cache
+    def from_document_class(
+        cls, document_class: type[VectorBaseDocument]
+    ) -> type["AsyncVectorBaseDocument"]:
+        """
+        Creates the async variant of an existing document class, sharing its fields and Config.
+
+        Args:
+            document_class (type[VectorBaseDocument]): The synchronous document class.
+
+        Returns:
+            type[AsyncVectorBaseDocument]: The async document class, e.g. `AsyncEmbeddedPostChunk`.
+        """
+
+        return type(
+            f"Async{document_class.__name__}",
+            (cls, document_class),
+            {"__module__": document_class.__module__},
+        )
+
+    @classmethod
+    async def bulk_insert(cls: Type[T], documents: list["VectorBaseDocument"]) -> bool:
+        try:
+            await cls._bulk_insert(documents)
+        except QDRANT_REQUEST_ERRORS:
+            logger.info(
+                f"Collection '{cls.get_collection_name()}' does not exist. Trying to create the collection and reinsert the documents."
+            )
+
+            await cls.create_collection()
+
+            try:
+                await cls._bulk_insert(documents)
+            except QDRANT_REQUEST_ERRORS:
+                logger.error(
+                    f"Failed to insert documents in '{cls.get_collection_name()}'."
+                )
+
+                return False
+
+        return True
+
+    @classmethod
+    async def _bulk_insert(cls: Type[T], documents: list["VectorBaseDocument"]) -> None:
+        points = [doc.to_point() for doc in documents]
+
+        await _get_connection().upsert(
+            collection_name=cls.get_collection_name(), points=points
+        )
+
+    @classmethod
+    async def bulk_load(
+        cls: Type[T],
+        documents: Iterable["VectorBaseDocument"],
+        batch_size: int = 256,
+        max_batch_bytes: int = 8 * 1024 * 1024,
+        max_in_flight: int = 4,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+    ) -> dict:
+        """Async version of `VectorBaseDocument.bulk_load`, with the same batching semantics."""
+
+        await cls.get_or_create_collection()
+        collection_name = cls.get_collection_name()
+
+        async def upsert(points: list[PointStruct], wait: bool) -> bool:
+            for attempt in range(max_retries + 1):
+                try:
+                    await _get_connection().upsert(
+                        collection_name=collection_name, points=points, wait=wait
+                    )
+
+                    return True
+                except Exception:
+                    if attempt == max_retries:
+                        logger.exception(
+                            f"Failed to insert a batch of {len(points)} documents in '{collection_name}'."
+                        )
+
+                        return False
+
+                    delay = backoff_seconds * 2**attempt
+                    logger.warning(
+                        f"Failed to insert a batch in '{collection_name}'. Retrying in {delay:.1f}s."
+                    )
+                    await asyncio.sleep(delay)
+
+            return False
+
+        start_time = time.perf_counter()
+
+        tasks: list[tuple[asyncio.Task, int]] = []
+        in_flight = asyncio.Semaphore(max_in_flight)
+        batches = cls._batch_points(
+            (doc.to_point() for doc in documents),
+            batch_size=batch_size,
+            max_batch_bytes=max_batch_bytes,
+        )
+        last_batch = next(batches, None)
+        for next_batch in batches:
+            await in_flight.acquire()
+            task = asyncio.create_task(upsert(last_batch, False))
+            task.add_done_callback(lambda _: in_flight.release())
+            tasks.append((task, len(last_batch)))
+
+            last_batch = next_batch
+        results = [(await task, num_points) for task, num_points in tasks]
+
+        if last_batch is not None:
+            results.append((await upsert(last_batch, True), len(last_batch)))
+
+        return cls._get_load_stats(results, duration=time.perf_counter() - start_time)
+
+    @classmethod
+    async def bulk_find(
+        cls: Type[T], limit: int = 10, **kwargs
+    ) -> tuple[list[T], UUID | None]:
+        try:
+            documents, next_offset = await cls._bulk_find(limit=limit, **kwargs)
+        except QDRANT_REQUEST_ERRORS:
+            logger.error(
+                f"Failed to search documents in '{cls.get_collection_name()}'."
+            )
+
+            documents, next_offset = [], None
+
+        return documents, next_offset
+
+    @classmethod
+    async def _bulk_find(
+        cls: Type[T], limit: int = 10, **kwargs
+    ) -> tuple[list[T], UUID | None]:
+        collection_name = cls.get_collection_name()
+
+        offset = kwargs.pop("offset", None)
+        offset = str(offset) if offset else None
+
+        records, next_offset = await _get_connection().scroll(
+            collection_name=collection_name,
+            limit=limit,
+            with_payload=kwargs.pop("with_payload", True),
+            with_vectors=kwargs.pop("with_vectors", False),
+            offset=offset,
+            **kwargs,
+        )
+        documents = [cls.from_record(record) for record in records]
+        if next_offset is not None:
+            next_offset = UUID(next_offset, version=4)
+
+        return documents, next_offset
+
+    @classmethod
+    async def iter_all(
+        cls: Type[T], batch_size: int = 256, with_vectors: bool = False, **kwargs
+    ) -> AsyncGenerator[T, None]:
+        """Async version of `VectorBaseDocument.iter_all`, prefetching the next page in a task."""
+
+        def fetch_page(offset: UUID | None) -> asyncio.Task:
+            return asyncio.create_task(
+                cls._bulk_find(
+                    limit=batch_size, with_vectors=with_vectors, offset=offset, **kwargs
+                )
+            )
+
+        next_page = fetch_page(None)
+        try:
+            is_first_page = True
+            while next_page is not None:
+                try:
+                    documents, next_offset = await next_page
+                except QDRANT_REQUEST_ERRORS:
+                    # A missing collection fails on the first page, while a failure on a later
+                    # one would silently truncate the scroll, hence it is raised.
+                    if not is_first_page:
+                        raise
+
+                    logger.error(
+                        f"Failed to scroll documents in '{cls.get_collection_name()}'."
+                    )
+
+                    return
+                is_first_page = False
+
+                next_page = fetch_page(next_offset) if next_offset else None
+
+                for document in documents:
+                    yield document
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    @classmethod
+    async def iter_all_parallel(
+        cls: Type[T],
+        num_segments: int = 4,
+        batch_size: int = 256,
+        with_vectors: bool = False,
+        **kwargs,
+    ) -> AsyncGenerator[T, None]:
+        """Async version of `VectorBaseDocument.iter_all_parallel`, one task per segment."""
+
+        if num_segments <= 1:
+            async for document in cls.iter_all(
+                batch_size=batch_size, with_vectors=with_vectors, **kwargs
+            ):
+                yield document
+
+            return
+
+        # Unlike a missing collection, a failed segment is raised, as it would
+        # silently drop a share of the documents.
+        if not await _get_connection().collection_exists(cls.get_collection_name()):
+            logger.error(
+                f"Failed to scroll documents in '{cls.get_collection_name()}'."
+            )
+
+            return
+
+        pages: asyncio.Queue = asyncio.Queue(maxsize=2 * num_segments)
+
+        async def drain(lower: UUID | None, upper: UUID | None) -> None:
+            offset = lower
+            try:
+                while True:
+                    documents, next_offset = await cls._bulk_find(
+                        limit=batch_size,
+                        with_vectors=with_vectors,
+                        offset=offset,
+                        **kwargs,
+                    )
+                    documents, next_offset = cls._clip_page(
+                        documents, next_offset, upper
+                    )
+
+                    await pages.put(documents)
+
+                    if next_offset is None:
+                        break
+                    offset = next_offset
+            except Exception as e:
+                await pages.put(e)
+
+            await pages.put(_SEGMENT_DONE)
+
+        bounds = cls._get_segment_bounds(num_segments)
+        tasks = [
+            asyncio.create_task(drain(lower, upper))
+            for lower, upper in zip(bounds[:-1], bounds[1:])
+        ]
+        try:
+            remaining_segments = num_segments
+            while remaining_segments > 0:
+                item = await pages.get()
+                if item is _SEGMENT_DONE:
+                    remaining_segments -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    for document in item:
+                        yield document
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @classmethod
+    async def search(
+        cls: Type[T], query_vector: list, limit: int = 10, **kwargs
+    ) -> list[T]:
+        try:
+            documents = await cls._search(
+                query_vector=query_vector, limit=limit, **kwargs
+            )
+        except QDRANT_REQUEST_ERRORS:
+            logger.error(
+                f"Failed to search documents in '{cls.get_collection_name()}'."
+            )
+
+            documents = []
+
+        return documents
+
+    @classmethod
+    async def _search(
+        cls: Type[T], query_vector: list, limit: int = 10, **kwargs
+    ) -> list[T]:
+        collection_name = cls.get_collection_name()
+        records = await _get_connection().search(
+            collection_name=collection_name,
+            query_vector=query_vector,
+            limit=limit,
+            with_payload=kwargs.pop("with_payload", True),
+            with_vectors=kwargs.pop("with_vectors", False),
+            search_params=kwargs.pop("search_params", cls.get_search_params()),
+            **kwargs,
+        )
+        documents = [cls.from_record(record) for record in records]
+
+        return documents
+
+    @classmethod
+    async def search_many(
+        cls,
+        query_vectors: list[list[float] | np.ndarray],
+        document_classes: list[type[VectorBaseDocument]],
+        limit: int = 10,
+        query_filter: Filter | None = None,
+        max_concurrency: int = 8,
+        **kwargs,
+    ) -> list[VectorBaseDocument]:
+        """
+        Async version of `VectorBaseDocument.search_many`. Synchronous document classes are
+        converted with `from_document_class` and at most `max_concurrency` collections are
+        searched at once.
+        """
+
+        document_classes = [
+            document_class
+            if issubclass(document_class, AsyncVectorBaseDocument)
+            else AsyncVectorBaseDocument.from_document_class(document_class)
+            for document_class in document_classes
+        ]
+        results = await gather_with_concurrency(
+            (
+                document_class._search_batch(
+                    query_vectors=query_vectors,
+                    limit=limit,
+                    query_filter=query_filter,
+                    **kwargs,
+                )
+                for document_class in document_classes
+            ),
+            max_concurrency=max_concurrency,
+            return_exceptions=True,
+        )
+
+        scored_documents = []
+        for document_class, result in zip(document_classes, results):
+            if isinstance(result, QDRANT_REQUEST_ERRORS):
+                logger.error(
+                    f"Failed to search documents in '{document_class.get_collection_name()}'."
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                scored_documents.extend(result)
+
+        return cls._merge_scored_documents(scored_documents)
+
+    @classmethod
+    async def _search_batch(
+        cls: Type[T],
+        query_vectors: list[list[float] | np.ndarray],
+        limit: int = 10,
+        query_filter: Filter | None = None,
+        **kwargs,
+    ) -> list[tuple[T, float]]:
+        requests = cls._get_search_requests(
+            query_vectors, limit, query_filter, **kwargs
+        )
+        batch_results = await _get_connection().search_batch(
+            collection_name=cls.get_collection_name(), requests=requests
+        )
+
+        return [
+            (cls.from_record(point), point.score)
+            for points in batch_results
+            for point in points
+        ]
+
+    @classmethod
+    async def get_or_create_collection(cls: Type[T]) -> CollectionInfo:
+        collection_name = cls.get_collection_name()
+        connection = _get_connection()
+
+        if not await connection.collection_exists(collection_name=collection_name):
+            use_vector_index = cls.get_use_vector_index()
+
+            collection_created = await cls._create_collection(
+                collection_name=collection_name, use_vector_index=use_vector_index
+            )
+            if collection_created is False:
+                raise RuntimeError(f"Couldn't create collection {collection_name}")
+
+        collection_info = await connection.get_collection(
+            collection_name=collection_name
+        )
+        if await cls._reconcile_payload_indexes(collection_info) is True:
+            collection_info = await connection.get_collection(
+                collection_name=collection_name
+            )
+
+        return collection_info
+
+    @classmethod
+    async def create_collection(cls: Type[T]) -> bool:
+        collection_name = cls.get_collection_name()
+        use_vector_index = cls.get_use_vector_index()
+
+        collection_created = await cls._create_collection(
+            collection_name=collection_name, use_vector_index=use_vector_index
+        )
+        if collection_created is True:
+            await cls._reconcile_payload_indexes(
+                await _get_connection().get_collection(collection_name=collection_name)
+            )
+
+        return collection_created
+
+    @classmethod
+    async def _reconcile_payload_indexes(
+        cls: Type[T], collection_info: CollectionInfo
+    ) -> bool:
+        if QdrantDatabaseConnector.is_local_mode():
+            return False
+
+        collection_name = cls.get_collection_name()
+        changes = cls._get_payload_index_changes(collection_info)
+        for field_name, field_schema in changes:
+            if field_name in (collection_info.payload_schema or {}):
+                await _get_connection().delete_payload_index(
+                    collection_name=collection_name, field_name=field_name, wait=True
+                )
+
+            logger.info(
+                f"Creating '{field_schema}' payload index on '{collection_name}.{field_name}'."
+            )
+            await _get_connection().create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=field_schema,
+                wait=True,
+            )
+
+        return len(changes) > 0
+
+    @classmethod
+    async def _create_collection(
+        cls, collection_name: str, use_vector_index: bool = True
+    ) -> bool:
+        return await _get_connection().create_collection(
+            collection_name=collection_name,
+            **cls.get_collection_options(use_vector_index=use_vector_index),
+        )
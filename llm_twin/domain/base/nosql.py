@@ -1,10 +1,11 @@
+import functools
 import uuid
 from abc import ABC
-from typing import Generic, List, Optional, Type, TypeVar
+from typing import Annotated, Generator, Generic, List, Optional, Type, TypeVar
 
 from loguru import logger
-from pydantic import UUID4, BaseModel, Field
-from pymongo import errors
+from pydantic import UUID4, BaseModel, Field, TypeAdapter
+from pymongo import ReplaceOne, errors
 
 from llm_twin.domain.exceptions import ImproperlyConfigured
 from llm_twin.infrastructure.db.mongo import connection
@@ -93,6 +94,34 @@ class NoSQLBaseDocument(BaseModel, Generic[T], ABC):
             logger.error(f"Failed to insert document {e}")
             return None
 
+    @classmethod
+    def bulk_upsert(cls: Type[T], documents: List[T], **kwargs) -> bool:
+        collection = _database[cls.get_collection_name()]
+        operations = []
+        for document in documents:
+            parsed = document.to_mongo(**kwargs)
+            operations.append(ReplaceOne({"_id": parsed["_id"]}, parsed, upsert=True))
+
+        if not operations:
+            return True
+
+        try:
+            collection.bulk_write(operations, ordered=False)
+            return True
+        except errors.PyMongoError as e:
+            logger.error(f"Failed to upsert documents {e}")
+            return False
+
+    @classmethod
+    def bulk_delete(cls: Type[T], ids: List[str]) -> int:
+        collection = _database[cls.get_collection_name()]
+        try:
+            result = collection.delete_many({"_id": {"$in": [str(id_) for id_ in ids]}})
+            return result.deleted_count
+        except errors.WriteError as e:
+            logger.error(f"Failed to delete documents {e}")
+            return 0
+
     @classmethod
     def find(cls: Type[T], **filter_options) -> T | None:
         collection = _database[cls.get_collection_name()]
@@ -109,19 +138,77 @@ class NoSQLBaseDocument(BaseModel, Generic[T], ABC):
 
     @classmethod
     def bulk_find(cls: Type[T], **filter_options) -> list[T]:
-        collection = _database[cls.get_collection_name()]
+        documents = []
         try:
-            instances = collection.find(filter_options)
-            return [
-                document
-                for instance in instances
-                if (document := cls.from_mongo(instance)) is not None
-            ]
+            for document in cls.iter_find(filter_options):
+                documents.append(document)
         except errors.OperationFailure:
-            logger.error("Failed to retrieve documents")
+            # A partial result would pass for a complete one, hence none is returned.
+            logger.error(
+                "Failed to retrieve documents", num_retrieved_documents=len(documents)
+            )
 
             return []
 
+        return documents
+
+    @classmethod
+    def iter_find(
+        cls: Type[T],
+        filter: dict | None = None,
+        projection: list[str] | None = None,
+        batch_size: int = 100,
+        sort: list[tuple[str, int]] | None = None,
+        raw: bool = False,
+    ) -> Generator[T | dict, None, None]:
+        """
+        Lazily yields the documents matching the filter, fetching them from the MongoDB cursor
+        `batch_size` documents at a time.
+
+        Args:
+            filter (dict | None): The MongoDB filter. Defaults to all the documents.
+            projection (list[str] | None): The fields to fetch. Only these fields are validated,
+                the other ones are left unset. Defaults to all the fields.
+            batch_size (int): The number of documents returned by each cursor round trip.
+            sort (list[tuple[str, int]] | None): The (field, direction) pairs to sort by.
+            raw (bool): Whether to yield the raw MongoDB dicts, skipping the validation, for
+                read-only scans. Defaults to False.
+
+        Yields:
+            T | dict: The matching documents.
+
+        Raises:
+            OperationFailure: If the query fails, possibly after some documents were yielded.
+        """
+
+        collection = _database[cls.get_collection_name()]
+        if projection is not None:
+            projection = ["_id" if field == "id" else field for field in projection]
+
+        cursor = collection.find(
+            filter or {}, projection=projection, sort=sort, batch_size=batch_size
+        )
+        for instance in cursor:
+            if raw:
+                yield instance
+            elif projection is None:
+                yield cls.from_mongo(instance)
+            else:
+                yield cls.from_projected_mongo(instance)
+
+    @classmethod
+    def from_projected_mongo(cls: Type[T], data: dict) -> T:
+        """Validates only the fields of a projected document, leaving the other ones unset."""
+
+        data = dict(data, id=data["_id"]) if "_id" in data else data
+        fields = {}
+        for name, field_info in cls.model_fields.items():
+            key = name if name in data else field_info.alias
+            if key in data:
+                fields[name] = _get_field_adapter(cls, name).validate_python(data[key])
+
+        return cls.model_construct(_fields_set=set(fields), **fields)
+
     @classmethod
     def get_collection_name(cls: Type[T]) -> str:
         if not hasattr(cls, "Settings") or not hasattr(cls.Settings, "name"):
@@ -130,3 +217,12 @@ class NoSQLBaseDocument(BaseModel, Generic[T], ABC):
             )
 
         return cls.Settings.name
+
+
+@functools.cache
+def _get_field_adapter(model: type[BaseModel], name: str) -> TypeAdapter:
+    field_info = model.model_fields[name]
+    if field_info.metadata:
+        return TypeAdapter(Annotated[field_info.annotation, *field_info.metadata])
+
+    return TypeAdapter(field_info.annotation)
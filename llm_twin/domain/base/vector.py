@@ -1,22 +1,65 @@
+import json
+import threading
+import time
 import uuid
 from abc import ABC
-from typing import Any, Callable, Dict, Generic, Type, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from queue import Full, Queue
+from typing import Any, Callable, Dict, Generator, Generic, Iterable, Type, TypeVar
 from uuid import UUID
 
 import numpy as np
 from loguru import logger
 from pydantic import UUID4, BaseModel, Field
-from qdrant_client.http import exceptions
-from qdrant_client.http.models import Distance, VectorParams
-from qdrant_client.models import CollectionInfo, PointStruct, Record
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import (
+    CompressionRatio,
+    Distance,
+    HnswConfigDiff,
+    PayloadSchemaType,
+    ProductQuantization,
+    ProductQuantizationConfig,
+    QuantizationConfig,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    VectorParams,
+)
+from qdrant_client.models import (
+    CollectionInfo,
+    Filter,
+    PointIdsList,
+    PointStruct,
+    Record,
+    SearchRequest,
+)
 
 from llm_twin.application.networks.embeddings import EmbeddingModelSingleton
 from llm_twin.domain.exceptions import ImproperlyConfigured
 from llm_twin.domain.types import DataCategory
-from llm_twin.infrastructure.db.qdrant import connection
+from llm_twin.infrastructure.db.qdrant import (
+    QDRANT_REQUEST_ERRORS,
+    QDRANT_TRANSPORT_ERRORS,
+    CollectionNotFoundError,
+    QdrantDatabaseConnector,
+)
 
 T = TypeVar("T", bound="VectorBaseDocument")
 
+_SEGMENT_DONE = object()
+
+
+def _get_connection() -> QdrantClient:
+    # The client is created on first use, hence importing the documents (e.g. in the worker
+    # processes cleaning them) doesn't open the local storage, which only one client can hold.
+    return QdrantDatabaseConnector()
+
+
+# Upper bound of a JSON-encoded float32 (e.g. "-0.012345678,") used to estimate request sizes.
+_VECTOR_FLOAT_BYTES = 16
+
 
 class VectorBaseDocument(BaseModel, Generic[T], ABC):
     id: UUID4 = Field(default_factory=uuid.uuid4)
@@ -49,12 +92,19 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
         exclude_unset = kwargs.pop("exclude_set", False)
         by_alias = kwargs.pop("by_alias", True)
 
-        payload = self.model_dump(exclude_unset=exclude_unset, by_alias=by_alias, **kwargs)
+        exclude = set(kwargs.pop("exclude", None) or ()) | {"embedding"}
+
+        payload = self.model_dump(
+            exclude_unset=exclude_unset, by_alias=by_alias, exclude=exclude, **kwargs
+        )
 
         _id = str(payload.pop("id"))
-        vector = payload.pop("embedding", {})
-        if vector and isinstance(vector, np.ndarray):
+        # Read the embedding straight from the model so the array is converted only once.
+        vector = getattr(self, "embedding", None)
+        if isinstance(vector, np.ndarray):
             vector = vector.tolist()
+        elif vector is None:
+            vector = {}
 
         return PointStruct(id=_id, vector=vector, payload=payload)
 
@@ -81,7 +131,7 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
     def bulk_insert(cls: Type[T], documents: list["VectorBaseDocument"]) -> bool:
         try:
             cls._bulk_insert(documents)
-        except exceptions.UnexpectedResponse:
+        except QDRANT_REQUEST_ERRORS:
             logger.info(
                 f"Collection '{cls.get_collection_name()}' does not exist. Trying to create the collection and reinsert the documents."
             )
@@ -90,7 +140,7 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
 
             try:
                 cls._bulk_insert(documents)
-            except exceptions.UnexpectedResponse:
+            except QDRANT_REQUEST_ERRORS:
                 logger.error(f"Failed to insert documents in '{cls.get_collection_name()}'.")
 
                 return False
@@ -101,13 +151,167 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
     def _bulk_insert(cls: Type[T], documents: list["VectorBaseDocument"]) -> None:
         points = [doc.to_point() for doc in documents]
 
-        connection.upsert(collection_name=cls.get_collection_name(), points=points)
+        cls._check_local_collection()
+        _get_connection().upsert(
+            collection_name=cls.get_collection_name(), points=points
+        )
+
+    @classmethod
+    def bulk_delete(cls: Type[T], ids: Iterable[UUID | str]) -> bool:
+        points = [str(id_) for id_ in ids]
+        # Nothing was ever loaded into a missing collection, hence there is nothing to delete.
+        if not points or not _get_connection().collection_exists(
+            cls.get_collection_name()
+        ):
+            return True
+
+        try:
+            _get_connection().delete(
+                collection_name=cls.get_collection_name(),
+                points_selector=PointIdsList(points=points),
+                wait=True,
+            )
+        except QDRANT_REQUEST_ERRORS:
+            logger.error(
+                f"Failed to delete documents from '{cls.get_collection_name()}'."
+            )
+
+            return False
+
+        return True
+
+    @classmethod
+    def bulk_load(
+        cls: Type[T],
+        documents: Iterable["VectorBaseDocument"],
+        batch_size: int = 256,
+        max_batch_bytes: int = 8 * 1024 * 1024,
+        max_in_flight: int = 4,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+    ) -> dict:
+        """
+        Upserts the documents in batches bounded both by the number of points and by the
+        estimated request size. Up to `max_in_flight` batches are sent concurrently without
+        waiting for them to be indexed (`wait=False`) and every failed batch is retried with
+        exponential backoff. The last batch is sent with `wait=True` only after all the other
+        batches were acknowledged, acting as a consistency barrier: once this method returns, the
+        loaded points are visible to searches. Only request and transport errors are retried,
+        any other error is raised.
+
+        Returns:
+            dict: Loading statistics (documents, batches, failures and throughput).
+        """
+
+        start_time = time.perf_counter()
+
+        batches = cls._batch_points(
+            (doc.to_point() for doc in documents),
+            batch_size=batch_size,
+            max_batch_bytes=max_batch_bytes,
+        )
+        last_batch = next(batches, None)
+        if last_batch is None:
+            return cls._get_load_stats([], duration=time.perf_counter() - start_time)
+
+        cls.get_or_create_collection()
+        collection_name = cls.get_collection_name()
+        if QdrantDatabaseConnector.is_local_mode():
+            # The local mode isn't thread-safe, hence the batches are upserted one by one.
+            max_in_flight = 1
+
+        def upsert(points: list[PointStruct], wait: bool) -> bool:
+            for attempt in range(max_retries + 1):
+                try:
+                    _get_connection().upsert(
+                        collection_name=collection_name, points=points, wait=wait
+                    )
+
+                    return True
+                except (*QDRANT_REQUEST_ERRORS, *QDRANT_TRANSPORT_ERRORS):
+                    if attempt == max_retries:
+                        logger.exception(
+                            f"Failed to insert a batch of {len(points)} documents in '{collection_name}'."
+                        )
+
+                        return False
+
+                    delay = backoff_seconds * 2**attempt
+                    logger.warning(
+                        f"Failed to insert a batch in '{collection_name}'. Retrying in {delay:.1f}s."
+                    )
+                    time.sleep(delay)
+
+            return False
+
+        results: list[tuple[Any, int]] = []
+        in_flight = threading.BoundedSemaphore(max_in_flight)
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for next_batch in batches:
+                in_flight.acquire()
+                future = executor.submit(upsert, last_batch, False)
+                future.add_done_callback(lambda _: in_flight.release())
+                results.append((future, len(last_batch)))
+
+                last_batch = next_batch
+        results = [(future.result(), num_points) for future, num_points in results]
+        results.append((upsert(last_batch, True), len(last_batch)))
+
+        return cls._get_load_stats(results, duration=time.perf_counter() - start_time)
+
+    @staticmethod
+    def _get_load_stats(results: list[tuple[bool, int]], duration: float) -> dict:
+        num_documents = sum(num_points for _, num_points in results)
+        num_failed_documents = sum(
+            num_points for success, num_points in results if not success
+        )
+
+        return {
+            "num_documents": num_documents,
+            "num_batches": len(results),
+            "num_failed_batches": sum(1 for success, _ in results if not success),
+            "num_failed_documents": num_failed_documents,
+            "duration_seconds": round(duration, 3),
+            "documents_per_second": round(num_documents / duration, 2)
+            if duration > 0
+            else 0.0,
+        }
+
+    @classmethod
+    def _batch_points(
+        cls, points: Iterable[PointStruct], batch_size: int, max_batch_bytes: int
+    ) -> Generator[list[PointStruct], None, None]:
+        batch: list[PointStruct] = []
+        batch_bytes = 0
+        for point in points:
+            point_bytes = cls._estimate_point_size(point)
+            if batch and (
+                len(batch) >= batch_size or batch_bytes + point_bytes > max_batch_bytes
+            ):
+                yield batch
+
+                batch, batch_bytes = [], 0
+
+            batch.append(point)
+            batch_bytes += point_bytes
+
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _estimate_point_size(point: PointStruct) -> int:
+        vector_size = len(point.vector) if isinstance(point.vector, list) else 0
+        payload_size = (
+            len(json.dumps(point.payload, default=str)) if point.payload else 0
+        )
+
+        return payload_size + vector_size * _VECTOR_FLOAT_BYTES
 
     @classmethod
     def bulk_find(cls: Type[T], limit: int = 10, **kwargs) -> tuple[list[T], UUID | None]:
         try:
             documents, next_offset = cls._bulk_find(limit=limit, **kwargs)
-        except exceptions.UnexpectedResponse:
+        except QDRANT_REQUEST_ERRORS:
             logger.error(f"Failed to search documents in '{cls.get_collection_name()}'.")
 
             documents, next_offset = [], None
@@ -121,7 +325,8 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
         offset = kwargs.pop("offset", None)
         offset = str(offset) if offset else None
 
-        records, next_offset = connection.scroll(
+        cls._check_local_collection()
+        records, next_offset = _get_connection().scroll(
             collection_name=collection_name,
             limit=limit,
             with_payload=kwargs.pop("with_payload", True),
@@ -135,11 +340,163 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
 
         return documents, next_offset
 
+    @classmethod
+    def iter_all(
+        cls: Type[T], batch_size: int = 256, with_vectors: bool = False, **kwargs
+    ) -> Generator[T, None, None]:
+        """
+        Lazily yields every document of the collection by scrolling through it in pages of
+        `batch_size` points. The next page is prefetched in a background thread while the
+        caller consumes the current one.
+
+        A collection whose first page can't be fetched, e.g. a missing one, yields nothing. A
+        failure on a later page is raised, rather than truncating the documents.
+        """
+
+        def fetch_page(offset: UUID | None) -> tuple[list[T], UUID | None]:
+            return cls._bulk_find(
+                limit=batch_size, with_vectors=with_vectors, offset=offset, **kwargs
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(fetch_page, None)
+            is_first_page = True
+            while next_page is not None:
+                try:
+                    documents, next_offset = next_page.result()
+                except QDRANT_REQUEST_ERRORS:
+                    # A missing collection fails on the first page, while a failure on a later
+                    # one would silently truncate the scroll, hence it is raised.
+                    if not is_first_page:
+                        raise
+
+                    logger.error(
+                        f"Failed to scroll documents in '{cls.get_collection_name()}'."
+                    )
+
+                    return
+                is_first_page = False
+
+                next_page = (
+                    executor.submit(fetch_page, next_offset) if next_offset else None
+                )
+
+                yield from documents
+
+    @classmethod
+    def iter_all_parallel(
+        cls: Type[T],
+        num_segments: int = 4,
+        batch_size: int = 256,
+        with_vectors: bool = False,
+        **kwargs,
+    ) -> Generator[T, None, None]:
+        """
+        Lazily yields every document of the collection by splitting the UUID id space into
+        `num_segments` disjoint ranges and scrolling them concurrently. Pages are merged into a
+        single stream as they arrive, so the order of the documents is not deterministic.
+
+        Point ids are random (UUID4) or content hashes, hence equal id ranges hold roughly the
+        same number of points.
+        """
+
+        if num_segments <= 1 or QdrantDatabaseConnector.is_local_mode():
+            yield from cls.iter_all(
+                batch_size=batch_size, with_vectors=with_vectors, **kwargs
+            )
+
+            return
+
+        # Unlike a missing collection, a failed segment is raised, as it would
+        # silently drop a share of the documents.
+        if not _get_connection().collection_exists(cls.get_collection_name()):
+            logger.error(
+                f"Failed to scroll documents in '{cls.get_collection_name()}'."
+            )
+
+            return
+
+        pages: Queue = Queue(maxsize=2 * num_segments)
+        stop = threading.Event()
+
+        def put(item: Any) -> None:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+
+                    return
+                except Full:
+                    continue
+
+        def drain(lower: UUID | None, upper: UUID | None) -> None:
+            offset = lower
+            try:
+                while not stop.is_set():
+                    documents, next_offset = cls._bulk_find(
+                        limit=batch_size,
+                        with_vectors=with_vectors,
+                        offset=offset,
+                        **kwargs,
+                    )
+                    documents, next_offset = cls._clip_page(
+                        documents, next_offset, upper
+                    )
+
+                    put(documents)
+
+                    if next_offset is None:
+                        break
+                    offset = next_offset
+            except Exception as e:
+                put(e)
+            finally:
+                put(_SEGMENT_DONE)
+
+        bounds = cls._get_segment_bounds(num_segments)
+        with ThreadPoolExecutor(max_workers=num_segments) as executor:
+            for lower, upper in zip(bounds[:-1], bounds[1:]):
+                executor.submit(drain, lower, upper)
+
+            try:
+                remaining_segments = num_segments
+                while remaining_segments > 0:
+                    item = pages.get()
+                    if item is _SEGMENT_DONE:
+                        remaining_segments -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield from item
+            finally:
+                stop.set()
+
+    @staticmethod
+    def _get_segment_bounds(num_segments: int) -> list[UUID | None]:
+        step = (1 << 128) // num_segments
+        inner_bounds = [UUID(int=i * step) for i in range(1, num_segments)]
+
+        return [None, *inner_bounds, None]
+
+    @staticmethod
+    def _clip_page(
+        documents: list[T], next_offset: UUID | None, upper: UUID | None
+    ) -> tuple[list[T], UUID | None]:
+        """Drops the documents of a scrolled page that belong to the next segment."""
+
+        if upper is None:
+            return documents, next_offset
+
+        documents = [doc for doc in documents if doc.id.int < upper.int]
+        if next_offset is not None and next_offset.int >= upper.int:
+            next_offset = None
+
+        return documents, next_offset
+
     @classmethod
     def search(cls: Type[T], query_vector: list, limit: int = 10, **kwargs) -> list[T]:
         try:
             documents = cls._search(query_vector=query_vector, limit=limit, **kwargs)
-        except exceptions.UnexpectedResponse:
+        except QDRANT_REQUEST_ERRORS:
             logger.error(f"Failed to search documents in '{cls.get_collection_name()}'.")
 
             documents = []
@@ -149,55 +506,294 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
     @classmethod
     def _search(cls: Type[T], query_vector: list, limit: int = 10, **kwargs) -> list[T]:
         collection_name = cls.get_collection_name()
-        records = connection.search(
+        cls._check_local_collection()
+        records = _get_connection().search(
             collection_name=collection_name,
             query_vector=query_vector,
             limit=limit,
             with_payload=kwargs.pop("with_payload", True),
             with_vectors=kwargs.pop("with_vectors", False),
+            search_params=kwargs.pop("search_params", cls.get_search_params()),
             **kwargs,
         )
         documents = [cls.from_record(record) for record in records]
 
         return documents
 
+    @classmethod
+    def search_many(
+        cls,
+        query_vectors: list[list[float] | np.ndarray],
+        document_classes: list[type["VectorBaseDocument"]],
+        limit: int = 10,
+        query_filter: Filter | None = None,
+        **kwargs,
+    ) -> list["VectorBaseDocument"]:
+        """
+        Searches every query vector in every collection. All the queries of a collection are sent
+        in a single batch search request and the collections are searched concurrently.
+
+        Args:
+            query_vectors (list): The query embeddings.
+            document_classes (list[type[VectorBaseDocument]]): The collections to search in.
+            limit (int): The number of hits to retrieve per query and collection.
+            query_filter (Filter | None): Optional payload filter applied to every search.
+
+        Returns:
+            list[VectorBaseDocument]: The hits, deduplicated by id and sorted by decreasing score.
+        """
+
+        max_workers = (
+            1 if QdrantDatabaseConnector.is_local_mode() else len(document_classes)
+        )
+
+        scored_documents = []
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            futures = {
+                executor.submit(
+                    document_class._search_batch,
+                    query_vectors=query_vectors,
+                    limit=limit,
+                    query_filter=query_filter,
+                    **kwargs,
+                ): document_class
+                for document_class in document_classes
+            }
+            for future, document_class in futures.items():
+                try:
+                    scored_documents.extend(future.result())
+                except QDRANT_REQUEST_ERRORS:
+                    logger.error(
+                        f"Failed to search documents in '{document_class.get_collection_name()}'."
+                    )
+
+        return cls._merge_scored_documents(scored_documents)
+
+    @classmethod
+    def _search_batch(
+        cls: Type[T],
+        query_vectors: list[list[float] | np.ndarray],
+        limit: int = 10,
+        query_filter: Filter | None = None,
+        **kwargs,
+    ) -> list[tuple[T, float]]:
+        requests = cls._get_search_requests(
+            query_vectors, limit, query_filter, **kwargs
+        )
+        cls._check_local_collection()
+        batch_results = _get_connection().search_batch(
+            collection_name=cls.get_collection_name(), requests=requests
+        )
+
+        return [
+            (cls.from_record(point), point.score)
+            for points in batch_results
+            for point in points
+        ]
+
+    @classmethod
+    def _get_search_requests(
+        cls: Type[T],
+        query_vectors: list[list[float] | np.ndarray],
+        limit: int,
+        query_filter: Filter | None = None,
+        **kwargs,
+    ) -> list[SearchRequest]:
+        return [
+            SearchRequest(
+                vector=vector.tolist() if isinstance(vector, np.ndarray) else vector,
+                limit=limit,
+                filter=query_filter,
+                with_payload=kwargs.get("with_payload", True),
+                with_vector=kwargs.get("with_vectors", False),
+                params=kwargs.get("search_params", cls.get_search_params()),
+            )
+            for vector in query_vectors
+        ]
+
+    @staticmethod
+    def _merge_scored_documents(
+        scored_documents: list[tuple["VectorBaseDocument", float]],
+    ) -> list["VectorBaseDocument"]:
+        best_hits: dict[UUID, tuple["VectorBaseDocument", float]] = {}
+        for document, score in scored_documents:
+            if document.id not in best_hits or score > best_hits[document.id][1]:
+                best_hits[document.id] = (document, score)
+
+        sorted_hits = sorted(best_hits.values(), key=lambda hit: hit[1], reverse=True)
+
+        return [document for document, _ in sorted_hits]
+
+    @classmethod
+    def _check_local_collection(cls: Type[T]) -> None:
+        """Raises `CollectionNotFoundError` if the collection is missing, in local mode only."""
+
+        if (
+            QdrantDatabaseConnector.is_local_mode()
+            and not _get_connection().collection_exists(
+                collection_name=cls.get_collection_name()
+            )
+        ):
+            raise CollectionNotFoundError(
+                f"Collection '{cls.get_collection_name()}' not found."
+            )
+
     @classmethod
     def get_or_create_collection(cls: Type[T]) -> CollectionInfo:
         collection_name = cls.get_collection_name()
 
-        try:
-            return connection.get_collection(collection_name=collection_name)
-        except exceptions.UnexpectedResponse:
+        if not _get_connection().collection_exists(collection_name=collection_name):
             use_vector_index = cls.get_use_vector_index()
 
             collection_created = cls._create_collection(
                 collection_name=collection_name, use_vector_index=use_vector_index
             )
             if collection_created is False:
-                raise RuntimeError(f"Couldn't create collection {collection_name}") from None
+                raise RuntimeError(f"Couldn't create collection {collection_name}")
+
+        collection_info = _get_connection().get_collection(
+            collection_name=collection_name
+        )
+        if cls._reconcile_payload_indexes(collection_info) is True:
+            collection_info = _get_connection().get_collection(
+                collection_name=collection_name
+            )
 
-            return connection.get_collection(collection_name=collection_name)
+        return collection_info
 
     @classmethod
     def create_collection(cls: Type[T]) -> bool:
         collection_name = cls.get_collection_name()
         use_vector_index = cls.get_use_vector_index()
 
-        return cls._create_collection(
+        collection_created = cls._create_collection(
             collection_name=collection_name, use_vector_index=use_vector_index
         )
+        if collection_created is True:
+            cls._reconcile_payload_indexes(
+                _get_connection().get_collection(collection_name=collection_name)
+            )
+
+        return collection_created
+
+    @classmethod
+    def _reconcile_payload_indexes(
+        cls: Type[T], collection_info: CollectionInfo
+    ) -> bool:
+        """Creates the missing payload indexes and recreates the ones with a different type."""
+
+        if QdrantDatabaseConnector.is_local_mode():
+            # The local mode doesn't support payload indexes.
+            return False
+
+        collection_name = cls.get_collection_name()
+        changes = cls._get_payload_index_changes(collection_info)
+        for field_name, field_schema in changes:
+            if field_name in (collection_info.payload_schema or {}):
+                _get_connection().delete_payload_index(
+                    collection_name=collection_name, field_name=field_name, wait=True
+                )
+
+            logger.info(
+                f"Creating '{field_schema}' payload index on '{collection_name}.{field_name}'."
+            )
+            _get_connection().create_payload_index(
+                collection_name=collection_name,
+                field_name=field_name,
+                field_schema=field_schema,
+                wait=True,
+            )
+
+        return len(changes) > 0
+
+    @classmethod
+    def _get_payload_index_changes(
+        cls: Type[T], collection_info: CollectionInfo
+    ) -> list[tuple[str, PayloadSchemaType]]:
+        existing_indexes = collection_info.payload_schema or {}
+
+        changes = []
+        for field_name, field_type in cls.get_payload_indexes().items():
+            field_schema = PayloadSchemaType(field_type)
+            existing_index = existing_indexes.get(field_name)
+            if existing_index is None or existing_index.data_type != field_schema:
+                changes.append((field_name, field_schema))
+
+        return changes
 
     @classmethod
     def _create_collection(cls, collection_name: str, use_vector_index: bool = True) -> bool:
-        if use_vector_index is True:
-            vectors_config = VectorParams(
-                size=EmbeddingModelSingleton().embedding_size, distance=Distance.COSINE
+        return _get_connection().create_collection(
+            collection_name=collection_name,
+            **cls.get_collection_options(use_vector_index=use_vector_index),
+        )
+
+    @classmethod
+    def get_collection_options(cls: Type[T], use_vector_index: bool = True) -> dict:
+        """
+        Returns the vectors, HNSW and quantization parameters used to create the collection,
+        as declared by the `on_disk`, `hnsw_config` and `quantization` Config options.
+        """
+
+        if use_vector_index is not True:
+            return {"vectors_config": {}}
+
+        hnsw_config = cls._get_config_option("hnsw_config")
+
+        return {
+            "vectors_config": VectorParams(
+                size=EmbeddingModelSingleton().embedding_size,
+                distance=Distance.COSINE,
+                on_disk=cls._get_config_option("on_disk"),
+            ),
+            "hnsw_config": HnswConfigDiff(**hnsw_config) if hnsw_config else None,
+            "quantization_config": cls.get_quantization_config(),
+        }
+
+    @classmethod
+    def get_quantization_config(cls: Type[T]) -> QuantizationConfig | None:
+        quantization = cls._get_config_option("quantization")
+        if quantization is None:
+            return None
+        elif quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8, quantile=0.99, always_ram=True
+                )
+            )
+        elif quantization == "product":
+            return ProductQuantization(
+                product=ProductQuantizationConfig(
+                    compression=CompressionRatio.X16, always_ram=True
+                )
+            )
+
+        raise ImproperlyConfigured(
+            f"Unsupported quantization '{quantization}'. Expected 'scalar' or 'product'."
+        )
+
+    @classmethod
+    def get_search_params(cls: Type[T]) -> SearchParams | None:
+        """
+        Returns the default search-time parameters declared by the `search_params` Config option,
+        e.g. `{"hnsw_ef": 128, "rescore": True, "oversampling": 2.0}`.
+        """
+
+        search_params = cls._get_config_option("search_params")
+        if not search_params:
+            return None
+
+        quantization_params = None
+        if "rescore" in search_params or "oversampling" in search_params:
+            quantization_params = QuantizationSearchParams(
+                rescore=search_params.get("rescore"),
+                oversampling=search_params.get("oversampling"),
             )
-        else:
-            vectors_config = {}
 
-        return connection.create_collection(
-            collection_name=collection_name, vectors_config=vectors_config
+        return SearchParams(
+            hnsw_ef=search_params.get("hnsw_ef"),
+            exact=search_params.get("exact", False),
+            quantization=quantization_params,
         )
 
     @classmethod
@@ -227,6 +823,17 @@ class VectorBaseDocument(BaseModel, Generic[T], ABC):
 
         return cls.Config.use_vector_index
 
+    @classmethod
+    def get_payload_indexes(cls: Type[T]) -> dict[str, str]:
+        return cls._get_config_option("payload_indexes", default={})
+
+    @classmethod
+    def _get_config_option(cls: Type[T], name: str, default: Any = None) -> Any:
+        if not hasattr(cls, "Config"):
+            return default
+
+        return getattr(cls.Config, name, default)
+
     @classmethod
     def group_by_class(
         cls: Type["VectorBaseDocument"], documents: list["VectorBaseDocument"]
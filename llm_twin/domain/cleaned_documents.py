@@ -21,6 +21,7 @@ class CleanedPostDocument(CleanedDocument):
         name = "cleaned_posts"
         category = DataCategory.POSTS
         use_vector_index = False
+        payload_indexes = {"author_id": "keyword", "platform": "keyword"}
 
 
 class CleanedArticleDocument(CleanedDocument):
@@ -30,6 +31,7 @@ class CleanedArticleDocument(CleanedDocument):
         name = "cleaned_articles"
         category = DataCategory.ARTICLES
         use_vector_index = False
+        payload_indexes = {"author_id": "keyword", "platform": "keyword"}
 
 
 class CleanedRepositoryDocument(CleanedDocument):
@@ -40,3 +42,4 @@ class CleanedRepositoryDocument(CleanedDocument):
         name = "cleaned_repositories"
         category = DataCategory.REPOSITORIES
         use_vector_index = False
+        payload_indexes = {"author_id": "keyword", "platform": "keyword"}
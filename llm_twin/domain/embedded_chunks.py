@@ -2,14 +2,14 @@ from abc import ABC
 
 from pydantic import UUID4, Field
 
-from llm_twin.domain.types import DataCategory
+from llm_twin.domain.types import DataCategory, EmbeddingVector
 
 from .base import VectorBaseDocument
 
 
 class EmbeddedChunk(VectorBaseDocument, ABC):
     content: str
-    embedding: list[float] | None
+    embedding: EmbeddingVector | None
     platform: str
     document_id: UUID4
     author_id: UUID4
@@ -36,6 +36,11 @@ class EmbeddedPostChunk(EmbeddedChunk):
         name = "embedded_posts"
         category = DataCategory.POSTS
         use_vector_index = True
+        payload_indexes = {
+            "author_id": "keyword",
+            "document_id": "keyword",
+            "platform": "keyword",
+        }
 
 
 class EmbeddedArticleChunk(EmbeddedChunk):
@@ -45,6 +50,11 @@ class EmbeddedArticleChunk(EmbeddedChunk):
         name = "embedded_articles"
         category = DataCategory.ARTICLES
         use_vector_index = True
+        payload_indexes = {
+            "author_id": "keyword",
+            "document_id": "keyword",
+            "platform": "keyword",
+        }
 
 
 class EmbeddedRepositoryChunk(EmbeddedChunk):
@@ -55,3 +65,8 @@ class EmbeddedRepositoryChunk(EmbeddedChunk):
         name = "embedded_repositories"
         category = DataCategory.REPOSITORIES
         use_vector_index = True
+        payload_indexes = {
+            "author_id": "keyword",
+            "document_id": "keyword",
+            "platform": "keyword",
+        }
@@ -0,0 +1,20 @@
+from pydantic import UUID4, Field
+
+from .base import NoSQLBaseDocument
+from .types import DataCategory
+
+
+class DocumentFingerprint(NoSQLBaseDocument):
+    """
+    The state of a raw document, identified by its id, when it was last loaded into the vector
+    database: the hash of its content and the hash of each of its chunks, keyed by chunk id.
+    """
+
+    category: DataCategory
+    author_id: UUID4
+    content_hash: str
+    embedding_model_id: str
+    chunk_hashes: dict[str, str] = Field(default_factory=dict)
+
+    class Settings:
+        name = "document_fingerprints"
@@ -1,7 +1,7 @@
 from pydantic import UUID4, Field
 
 from llm_twin.domain.base import VectorBaseDocument
-from llm_twin.domain.types import DataCategory
+from llm_twin.domain.types import DataCategory, EmbeddingVector
 
 
 class Query(VectorBaseDocument):
@@ -28,7 +28,7 @@ class Query(VectorBaseDocument):
 
 
 class EmbeddedQuery(Query):
-    embedding: list[float]
+    embedding: EmbeddingVector
 
     class Config:
         category = DataCategory.QUERIES
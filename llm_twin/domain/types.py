@@ -1,4 +1,9 @@
 from enum import StrEnum
+from typing import Annotated, Any
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import PlainSerializer, PlainValidator
 
 
 class DataCategory(StrEnum):
@@ -13,3 +18,20 @@ class DataCategory(StrEnum):
     POSTS = "posts"
     ARTICLES = "articles"
     REPOSITORIES = "repositories"
+
+
+def _to_float32_array(value: Any) -> NDArray[np.float32]:
+    """Wraps the value into a float32 array, without copying float32 arrays."""
+
+    return np.asarray(value, dtype=np.float32)
+
+
+EmbeddingVector = Annotated[
+    np.ndarray,
+    PlainValidator(_to_float32_array),
+    PlainSerializer(lambda vector: vector.tolist(), when_used="json"),
+]
+"""
+A float32 embedding stored as a NumPy array. Arrays are validated as a whole instead of
+element by element and are serialized to a list only when dumping to JSON.
+"""
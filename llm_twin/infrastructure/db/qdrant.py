@@ -1,42 +1,157 @@
+from threading import Lock
 from typing import Optional
 
+import grpc
+import httpx
 from loguru import logger
-from qdrant_client import QdrantClient
-from qdrant_client.http.exceptions import UnexpectedResponse
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
 
 from llm_twin.settings import settings
 
 
+class CollectionNotFoundError(Exception):
+    """
+    Raised when a local mode request targets a missing collection. The local client signals it
+    with a bare ValueError, which can't be told apart from a validation error, hence the
+    collection is checked before the request instead.
+    """
+
+
+# Errors raised by the REST, gRPC and local clients when a request fails (e.g. missing collection).
+QDRANT_REQUEST_ERRORS = (UnexpectedResponse, grpc.RpcError, CollectionNotFoundError)
+# Errors raised when the server can't be reached (the REST client wraps them).
+QDRANT_TRANSPORT_ERRORS = (ResponseHandlingException, httpx.TransportError)
+
+
 class QdrantDatabaseConnector:
+    """
+    Singleton providing the `QdrantClient` shared by the vector documents. It is created on first
+    use, and only once even if several threads use it at the same time, as the local storage can
+    only be opened by a single client.
+    """
+
     _instance: Optional[QdrantClient] = None
+    _lock = Lock()
 
     def __new__(cls, *args, **kwargs) -> QdrantClient:
         if cls._instance is None:
-            try:
-                if settings.USE_QDRANT_CLOUD:
-                    cls._instance = QdrantClient(
-                        url=settings.QDRANT_CLOUD_URL, api_key=settings.QDRANT_APIKEY
-                    )
-                    uri = settings.QDRANT_CLOUD_URL
-                else:
-                    cls._instance = QdrantClient(
-                        host=settings.QDRANT_DATABASE_HOST,
-                        port=settings.QDRANT_DATABASE_PORT,
-                    )
-                    uri = f"{settings.QDRANT_DATABASE_HOST}:{settings.QDRANT_DATABASE_PORT}"
-
-                logger.info(f"Connection to Qdrant DB with URI successful: {uri}")
-            except UnexpectedResponse:
-                logger.exception(
-                    "Couldn't conntect to Qdrant.",
-                    host=settings.QDRANT_DATABASE_PORT,
-                    port=settings.QDRANT_DATABASE_PORT,
-                    url=settings.QDRANT_CLOUD_URL,
-                )
-
-                raise
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls._connect()
 
         return cls._instance
 
+    @classmethod
+    def _connect(cls) -> QdrantClient:
+        try:
+            client = QdrantClient(
+                **cls.get_connection_options(), **cls.get_client_options()
+            )
+
+            logger.info(f"Connection to Qdrant DB with URI successful: {cls.get_uri()}")
+        except UnexpectedResponse:
+            logger.exception(
+                "Couldn't conntect to Qdrant.",
+                host=settings.QDRANT_DATABASE_PORT,
+                port=settings.QDRANT_DATABASE_PORT,
+                url=settings.QDRANT_CLOUD_URL,
+            )
+
+            raise
+
+        return client
+
+    @staticmethod
+    def get_connection_options() -> dict:
+        """
+        Returns the address of the Qdrant server, either the cloud cluster or the local instance.
+
+        Returns:
+            dict: Keyword arguments forwarded to `QdrantClient`.
+        """
+
+        if settings.QDRANT_LOCAL_PATH == ":memory:":
+            return {"location": ":memory:"}
+        elif settings.QDRANT_LOCAL_PATH:
+            return {"path": settings.QDRANT_LOCAL_PATH}
+        elif settings.USE_QDRANT_CLOUD:
+            return {"url": settings.QDRANT_CLOUD_URL, "api_key": settings.QDRANT_APIKEY}
+
+        return {
+            "host": settings.QDRANT_DATABASE_HOST,
+            "port": settings.QDRANT_DATABASE_PORT,
+        }
+
+    @staticmethod
+    def get_client_options(prefer_grpc: bool | None = None) -> dict:
+        """
+        Returns the transport and connection pool options shared by every Qdrant client.
+
+        Args:
+            prefer_grpc (bool | None): Overrides `settings.QDRANT_PREFER_GRPC` when set.
 
-connection = QdrantDatabaseConnector()
+        Returns:
+            dict: Keyword arguments forwarded to `QdrantClient`.
+        """
+
+        if QdrantDatabaseConnector.is_local_mode():
+            return {}
+
+        return {
+            "prefer_grpc": settings.QDRANT_PREFER_GRPC
+            if prefer_grpc is None
+            else prefer_grpc,
+            "grpc_port": settings.QDRANT_GRPC_PORT,
+            "timeout": settings.QDRANT_TIMEOUT,
+            "limits": httpx.Limits(
+                max_connections=settings.QDRANT_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.QDRANT_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.QDRANT_HTTP_KEEPALIVE_EXPIRY,
+            ),
+        }
+
+    @staticmethod
+    def is_local_mode() -> bool:
+        """Whether Qdrant runs in-process, either in memory or on a local storage directory."""
+
+        return bool(settings.QDRANT_LOCAL_PATH)
+
+    @staticmethod
+    def get_uri() -> str:
+        if settings.QDRANT_LOCAL_PATH:
+            return f"{settings.QDRANT_LOCAL_PATH} (local mode)"
+        elif settings.USE_QDRANT_CLOUD:
+            uri = settings.QDRANT_CLOUD_URL
+        else:
+            uri = f"{settings.QDRANT_DATABASE_HOST}:{settings.QDRANT_DATABASE_PORT}"
+        transport = "gRPC" if settings.QDRANT_PREFER_GRPC else "REST"
+
+        return f"{uri} ({transport})"
+
+
+class AsyncQdrantDatabaseConnector:
+    """
+    Singleton providing an `AsyncQdrantClient` configured like the synchronous connection.
+    It is created on first use, as the local storage can't be shared with the sync client.
+    """
+
+    _instance: Optional[AsyncQdrantClient] = None
+
+    def __new__(cls, *args, **kwargs) -> AsyncQdrantClient:
+        if cls._instance is None:
+            if QdrantDatabaseConnector.is_local_mode():
+                raise RuntimeError(
+                    "The async Qdrant client requires a Qdrant server. Unset QDRANT_LOCAL_PATH."
+                )
+
+            cls._instance = AsyncQdrantClient(
+                **QdrantDatabaseConnector.get_connection_options(),
+                **QdrantDatabaseConnector.get_client_options(),
+            )
+
+            logger.info(
+                f"Async connection to Qdrant DB with URI created: {QdrantDatabaseConnector.get_uri()}"
+            )
+
+        return cls._instance
@@ -30,11 +30,19 @@ class Settings(BaseSettings):
     MONGO_INITDB_ROOT_PASSWORD: str | None = None
 
     # Qdrant vector database
+    # Runs Qdrant in-process instead of connecting to a server: ":memory:" or a storage directory.
+    QDRANT_LOCAL_PATH: str | None = None
     USE_QDRANT_CLOUD: bool = False
     QDRANT_DATABASE_HOST: str = "localhost"
     QDRANT_DATABASE_PORT: int = 6333
     QDRANT_CLOUD_URL: str = "str"
     QDRANT_APIKEY: str | None = None
+    QDRANT_PREFER_GRPC: bool = False
+    QDRANT_GRPC_PORT: int = 6334
+    QDRANT_TIMEOUT: int | None = None
+    QDRANT_HTTP_MAX_CONNECTIONS: int = 100
+    QDRANT_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    QDRANT_HTTP_KEEPALIVE_EXPIRY: float = 30.0
 
     # AWS Authentication
     AWS_REGION: str = "us-east-1"
@@ -61,10 +69,31 @@ class Settings(BaseSettings):
     # TOP_P_INFERENCE: float = 0.9
     # MAX_NEW_TOKENS_INFERENCE: int = 150
 
+    # Feature engineering
+    CLEANING_NUM_WORKERS: int | None = None  # Defaults to the CPU count.
+    CLEANING_CHUNK_SIZE: int = 16
+    CLEANING_MIN_PARALLEL_DOCUMENTS: int = 32
+    STREAMING_BATCH_SIZE: int = (
+        64  # Number of documents flowing through the stages at once.
+    )
+    STREAMING_MAX_QUEUED_BATCHES: int = 2
+
     # RAG
     TEXT_EMBEDDING_MODEL_ID: str = "sentence-transformers/all-MiniLM-L6-v2"
     RERANKING_CROSS_ENCODER_MODEL_ID: str = "cross-encoder/ms-marco-MiniLM-L-4-v2"
     RAG_MODEL_DEVICE: str = "cpu"
+    RAG_MODEL_BACKEND: str = "torch"  # One of "torch", "onnx" or "onnx-int8".
+    ONNX_MODELS_CACHE_DIR: str = "~/.cache/llm_twin/onnx"
+    ONNX_PARITY_TOLERANCE: float = 0.02
+    EMBEDDING_MAX_BATCH_TOKENS: int | None = 16_384
+    EMBEDDING_POOL_NUM_WORKERS: int = 0
+    EMBEDDING_POOL_THREADS_PER_WORKER: int | None = None
+    EMBEDDING_POOL_MIN_BATCH_SIZE: int = 128
+    EMBEDDING_CACHE_ENABLED: bool = True
+    EMBEDDING_CACHE_PATH: str | None = "~/.cache/llm_twin/embeddings.sqlite"
+    EMBEDDING_CACHE_MAX_MEMORY_ITEMS: int = 100_000
+    RERANKING_BATCH_SIZE: int = 32
+    RERANKING_CACHE_MAX_ITEMS: int = 10_000
 
     # LinkedIn Credentials
     LINKEDIN_USERNAME: str | None = None
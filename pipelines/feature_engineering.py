@@ -5,14 +5,48 @@ from steps import feature_engineering as fe_steps
 
 @pipeline
 def feature_engineering(
-    author_full_names: list[str], wait_for: str | list[str] | None = None
+    author_full_names: list[str],
+    wait_for: str | list[str] | None = None,
+    incremental: bool = True,
+    streaming: bool = False,
 ) -> list[str]:
+    if streaming:
+        # Runs all the stages, and the fingerprints filtering and updating when incremental, in a
+        # single step, which only outputs a summary of the run.
+        summary = fe_steps.stream_feature_engineering(
+            author_full_names, incremental=incremental, after=wait_for
+        )
+
+        return [summary.invocation_id]
+
     raw_documents = fe_steps.query_data_warehouse(author_full_names, after=wait_for)
+    if incremental:
+        raw_documents = fe_steps.filter_changed_documents(
+            raw_documents, author_full_names
+        )
 
     cleaned_documents = fe_steps.clean_documents(raw_documents)
     last_step_1 = fe_steps.load_to_vector_db(cleaned_documents)
 
-    embedded_documents = fe_steps.chunk_and_embed(cleaned_documents)
+    embedded_documents, num_chunks_per_document = fe_steps.chunk_and_embed(
+        cleaned_documents
+    )
     last_step_2 = fe_steps.load_to_vector_db(embedded_documents)
 
-    return [last_step_1.invocation_id, last_step_2.invocation_id]
+    if not incremental:
+        return [last_step_1.invocation_id, last_step_2.invocation_id]
+
+    # The fingerprints are only updated once the vector database holds the new documents.
+    last_step_3 = fe_steps.update_fingerprints(
+        raw_documents,
+        embedded_documents,
+        num_chunks_per_document,
+        cleaned_documents_loaded=last_step_1,
+        embedded_documents_loaded=last_step_2,
+    )
+
+    return [
+        last_step_1.invocation_id,
+        last_step_2.invocation_id,
+        last_step_3.invocation_id,
+    ]
@@ -1,6 +1,16 @@
 from .clean import clean_documents
+from .fingerprints import filter_changed_documents, update_fingerprints
 from .load_to_vector_db import load_to_vector_db
 from .query_data_warehouse import query_data_warehouse
 from .rag import chunk_and_embed
+from .stream import stream_feature_engineering
 
-__all__ = ["clean_documents", "query_data_warehouse", "load_to_vector_db", "chunk_and_embed"]
+__all__ = [
+    "clean_documents",
+    "filter_changed_documents",
+    "query_data_warehouse",
+    "load_to_vector_db",
+    "chunk_and_embed",
+    "stream_feature_engineering",
+    "update_fingerprints",
+]
@@ -2,23 +2,51 @@ from typing import Annotated
 
 from zenml import get_step_context, step
 
-from llm_twin.application.preprocessing.dispatchers import CleaningDispatcher
+from llm_twin.application.preprocessing.dispatchers import (
+    CleaningDispatcher,
+    CleaningProcessPool,
+)
 from llm_twin.domain.cleaned_documents import CleanedDocument
+from llm_twin.domain.types import DataCategory
+from llm_twin.settings import settings
 
 
 @step
 def clean_documents(
-    documents: Annotated[list, "raw_documents"]
+    documents: Annotated[list, "raw_documents"],
+    num_workers: int | None = settings.CLEANING_NUM_WORKERS,
+    chunk_size: int = settings.CLEANING_CHUNK_SIZE,
 ) -> Annotated[list, "cleaned_documents"]:
+    try:
+        results = CleaningDispatcher.dispatch_batch(
+            documents,
+            num_workers=num_workers,
+            chunk_size=chunk_size,
+            min_parallel_documents=settings.CLEANING_MIN_PARALLEL_DOCUMENTS,
+        )
+    finally:
+        CleaningProcessPool().shutdown()
+
     cleaned_documents = []
-    for document in documents:
-        cleaned_document = CleaningDispatcher.dispatch(document)
+    cleaning_seconds = {}
+    num_failed_documents = 0
+    for document, (cleaned_document, duration) in zip(documents, results, strict=True):
+        category = DataCategory(document.get_collection_name())
+        cleaning_seconds[category] = cleaning_seconds.get(category, 0.0) + duration
+
+        if cleaned_document is None:
+            num_failed_documents += 1
+            continue
+
         cleaned_documents.append(cleaned_document)
 
+    metadata = _get_metadata(cleaned_documents)
+    for category, duration in cleaning_seconds.items():
+        metadata.setdefault(category, {})["cleaning_seconds"] = round(duration, 3)
+    metadata["num_failed_documents"] = num_failed_documents
+
     step_context = get_step_context()
-    step_context.add_output_metadata(
-        output_name="cleaned_documents", metadata=_get_metadata(cleaned_documents)
-    )
+    step_context.add_output_metadata(output_name="cleaned_documents", metadata=metadata)
 
     return cleaned_documents
 
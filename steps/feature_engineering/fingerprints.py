@@ -0,0 +1,75 @@
+from typing import Annotated
+
+from loguru import logger
+from zenml import get_step_context, step
+
+from llm_twin.application import utils
+from llm_twin.application.preprocessing.fingerprints import FingerprintStore
+from llm_twin.domain.documents import UserDocument
+
+
+# Both steps depend on the fingerprints stored in MongoDB rather than on their inputs only.
+@step(enable_cache=False)
+def filter_changed_documents(
+    documents: Annotated[list, "raw_documents"],
+    author_full_names: list[str],
+) -> Annotated[list, "changed_documents"]:
+    author_ids = []
+    for author_full_name in author_full_names:
+        first_name, last_name = utils.split_user_full_name(author_full_name)
+        user = UserDocument.find(first_name=first_name, last_name=last_name)
+        if user is not None:
+            author_ids.append(user.id)
+
+    changes = FingerprintStore.get_changes(documents, author_ids=author_ids)
+    num_deleted_chunks = FingerprintStore.delete(changes.deleted_fingerprints)
+
+    logger.info(
+        "Compared the raw documents with their fingerprints.",
+        num_new_documents=len(changes.new_documents),
+        num_updated_documents=len(changes.updated_documents),
+        num_skipped_documents=len(changes.unchanged_documents),
+        num_deleted_documents=len(changes.deleted_fingerprints),
+    )
+
+    step_context = get_step_context()
+    step_context.add_output_metadata(
+        output_name="changed_documents",
+        metadata={
+            "num_documents": len(documents),
+            "num_new_documents": len(changes.new_documents),
+            "num_updated_documents": len(changes.updated_documents),
+            "num_skipped_documents": len(changes.unchanged_documents),
+            "num_deleted_documents": len(changes.deleted_fingerprints),
+            "num_deleted_chunks": num_deleted_chunks,
+        },
+    )
+
+    return changes.changed_documents
+
+
+@step(enable_cache=False)
+def update_fingerprints(
+    documents: Annotated[list, "changed_documents"],
+    embedded_documents: Annotated[list, "embedded_documents"],
+    num_chunks_per_document: Annotated[dict, "num_chunks_per_document"],
+    cleaned_documents_loaded: bool,
+    embedded_documents_loaded: bool,
+) -> Annotated[dict, "fingerprints"]:
+    if not (cleaned_documents_loaded and embedded_documents_loaded):
+        logger.warning(
+            "Some documents failed to load into the vector database. "
+            "Skipping the fingerprints update, so that the next run processes them again."
+        )
+        stats = {"num_fingerprinted_documents": 0}
+    else:
+        stats = FingerprintStore.update(
+            documents,
+            num_chunks_per_document=num_chunks_per_document,
+            embedded_chunks=embedded_documents,
+        )
+
+    step_context = get_step_context()
+    step_context.add_output_metadata(output_name="fingerprints", metadata=stats)
+
+    return stats
@@ -1,28 +1,43 @@
 from loguru import logger
 from typing_extensions import Annotated
-from zenml import step
+from zenml import get_step_context, step
 
-from llm_twin.application import utils
 from llm_twin.domain.base import VectorBaseDocument
 
 
 @step
 def load_to_vector_db(
     documents: Annotated[list, "documents"],
+    batch_size: int = 256,
+    max_batch_bytes: int = 8 * 1024 * 1024,
+    max_in_flight: int = 4,
 ) -> Annotated[bool, "successful"]:
     logger.info(f"Loading {len(documents)} documents into the vector database.")
 
+    metadata = {}
     grouped_documents = VectorBaseDocument.group_by_class(documents)
     for document_class, documents in grouped_documents.items():
-        logger.info(f"Loading documents into {document_class.get_collection_name()}")
-        for documents_batch in utils.misc.batch(documents, size=4):
-            try:
-                document_class.bulk_insert(documents_batch)
-            except Exception:
-                logger.error(
-                    f"Failed to insert documents into {document_class.get_collection_name()}"
-                )
-
-                return False
+        collection_name = document_class.get_collection_name()
+        logger.info(f"Loading documents into {collection_name}")
+
+        metadata[collection_name] = document_class.bulk_load(
+            documents,
+            batch_size=batch_size,
+            max_batch_bytes=max_batch_bytes,
+            max_in_flight=max_in_flight,
+        )
+
+    step_context = get_step_context()
+    step_context.add_output_metadata(output_name="successful", metadata=metadata)
+
+    failed_collections = [
+        collection_name
+        for collection_name, stats in metadata.items()
+        if stats["num_failed_documents"] > 0
+    ]
+    if failed_collections:
+        logger.error(f"Failed to insert some documents into {failed_collections}")
+
+        return False
 
     return True
@@ -1,35 +1,89 @@
+import time
+
 from typing_extensions import Annotated
 from zenml import get_step_context, step
 
 from llm_twin.application import utils
+from llm_twin.application.networks import EmbeddingProcessPool
 from llm_twin.application.preprocessing import ChunkingDispatcher, EmbeddingDispatcher
 from llm_twin.domain.chunks import Chunk
 from llm_twin.domain.embedded_chunks import EmbeddedChunk
+from llm_twin.settings import settings
 
 
 @step
 def chunk_and_embed(
     cleaned_documents: Annotated[list, "cleaned_documents"],
-) -> Annotated[list, "embedded_documents"]:
+    batch_size: int = 256,
+) -> tuple[
+    Annotated[list, "embedded_documents"],
+    Annotated[dict, "num_chunks_per_document"],
+]:
     metadata = {"chunking": {}, "embedding": {}, "num_documents": len(cleaned_documents)}
 
-    embedded_chunks = []
-    for document in cleaned_documents:
-        chunks = ChunkingDispatcher.dispatch(document)
-        metadata["chunking"] = _add_chunks_metadata(chunks, metadata["chunking"])
-
-        for batched_chunks in utils.misc.batch(chunks, 10):
-            batched_embedded_chunks = EmbeddingDispatcher.dispatch(batched_chunks)
-            embedded_chunks.extend(batched_embedded_chunks)
+    chunks = []
+    num_chunks_per_document = {}
+    for document, document_chunks in zip(
+        cleaned_documents, ChunkingDispatcher.dispatch_batch(cleaned_documents)
+    ):
+        metadata["chunking"] = _add_chunks_metadata(
+            document_chunks, metadata["chunking"]
+        )
+
+        chunks.extend(document_chunks)
+        num_chunks_per_document[str(document.id)] = len(document_chunks)
+
+    start_time = time.perf_counter()
+    try:
+        embedded_chunks = _embed_chunks(chunks, batch_size=batch_size)
+    finally:
+        if settings.EMBEDDING_POOL_NUM_WORKERS > 0:
+            EmbeddingProcessPool().shutdown()
+    duration = time.perf_counter() - start_time
 
     metadata["embedding"] = _add_embeddings_metadata(embedded_chunks, metadata["embedding"])
-    metadata["num_chunks"] = len(embedded_chunks)
+    metadata["embedding_throughput"] = {
+        "batch_size": batch_size,
+        "num_pool_workers": settings.EMBEDDING_POOL_NUM_WORKERS,
+        "duration_seconds": round(duration, 3),
+        "chunks_per_second": round(len(embedded_chunks) / duration, 2)
+        if duration > 0
+        else 0.0,
+    }
+    metadata["num_chunks"] = len(chunks)
     metadata["num_embedded_chunks"] = len(embedded_chunks)
 
     step_context = get_step_context()
     step_context.add_output_metadata(output_name="embedded_documents", metadata=metadata)
 
-    return embedded_chunks
+    # Lets the fingerprints tell the documents whose chunks were all embedded.
+    return embedded_chunks, num_chunks_per_document
+
+
+def _embed_chunks(chunks: list[Chunk], batch_size: int) -> list[EmbeddedChunk]:
+    """
+    Embeds the chunks of all the documents in large batches of a single category, as required by
+    the EmbeddingDispatcher, and returns the embedded chunks in the order of the input chunks.
+    """
+
+    chunk_indices_by_category = {}
+    for i, chunk in enumerate(chunks):
+        chunk_indices_by_category.setdefault(chunk.get_category(), []).append(i)
+
+    embedded_chunks = [None] * len(chunks)
+    for chunk_indices in chunk_indices_by_category.values():
+        for batch_indices in utils.misc.batch(chunk_indices, batch_size):
+            batched_embedded_chunks = EmbeddingDispatcher.dispatch(
+                [chunks[i] for i in batch_indices]
+            )
+            for i, embedded_chunk in zip(batch_indices, batched_embedded_chunks):
+                embedded_chunks[i] = embedded_chunk
+
+    return [
+        embedded_chunk
+        for embedded_chunk in embedded_chunks
+        if embedded_chunk is not None
+    ]
 
 
 def _add_chunks_metadata(chunks: list[Chunk], metadata: dict) -> dict:
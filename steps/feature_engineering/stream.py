@@ -0,0 +1,59 @@
+from typing import Annotated, Generator
+
+from loguru import logger
+from zenml import get_step_context, step
+
+from llm_twin.application import utils
+from llm_twin.application.networks import EmbeddingProcessPool
+from llm_twin.application.preprocessing import CleaningProcessPool
+from llm_twin.application.preprocessing.streaming import StreamingFeaturePipeline
+from llm_twin.domain.documents import (
+    ArticleDocument,
+    Document,
+    PostDocument,
+    RepositoryDocument,
+    UserDocument,
+)
+from llm_twin.settings import settings
+
+
+# The incremental runs depend on the fingerprints stored in MongoDB rather than on their inputs.
+@step(enable_cache=False)
+def stream_feature_engineering(
+    author_full_names: list[str],
+    incremental: bool = True,
+    batch_size: int = settings.STREAMING_BATCH_SIZE,
+    max_queued_batches: int = settings.STREAMING_MAX_QUEUED_BATCHES,
+) -> Annotated[dict, "summary"]:
+    users = []
+    for author_full_name in author_full_names:
+        first_name, last_name = utils.split_user_full_name(author_full_name)
+        users.append(
+            UserDocument.get_or_create(first_name=first_name, last_name=last_name)
+        )
+
+    streaming_pipeline = StreamingFeaturePipeline(
+        batch_size=batch_size, max_queued_batches=max_queued_batches
+    )
+    try:
+        summary = streaming_pipeline.run(
+            iter_documents(users),
+            author_ids=[user.id for user in users] if incremental else None,
+        )
+    finally:
+        CleaningProcessPool().shutdown()
+        if settings.EMBEDDING_POOL_NUM_WORKERS > 0:
+            EmbeddingProcessPool().shutdown()
+
+    step_context = get_step_context()
+    step_context.add_output_metadata(output_name="summary", metadata=summary)
+
+    return summary
+
+
+def iter_documents(users: list[UserDocument]) -> Generator[Document, None, None]:
+    for user in users:
+        logger.info(f"Streaming the data warehouse documents of user: {user.full_name}")
+
+        for document_class in (ArticleDocument, PostDocument, RepositoryDocument):
+            yield from document_class.iter_find({"author_id": str(user.id)})
@@ -1,7 +1,6 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from loguru import logger
-from qdrant_client.http import exceptions
 from typing_extensions import Annotated
 from zenml import step
 
@@ -67,17 +66,12 @@ def __fetch_repositories() -> list[CleanedDocument]:
 
 
 def __fetch(
-    cleaned_document_type: type[CleanedDocument], limit: int = 1
+    cleaned_document_type: type[CleanedDocument],
+    batch_size: int = 256,
+    num_segments: int = 4,
 ) -> list[CleanedDocument]:
-    try:
-        cleaned_documents, next_offset = cleaned_document_type.bulk_find(limit=limit)
-    except exceptions.UnexpectedResponse:
-        return []
-
-    while next_offset:
-        documents, next_offset = cleaned_document_type.bulk_find(
-            limit=limit, offset=next_offset
+    return list(
+        cleaned_document_type.iter_all_parallel(
+            num_segments=num_segments, batch_size=batch_size
         )
-        cleaned_documents.extend(documents)
-
-    return cleaned_documents
+    )
@@ -0,0 +1,76 @@
+import re
+
+import click
+from loguru import logger
+
+from llm_twin.application.preprocessing.operations import chunk_article
+
+from .common import Timer, generate_chunk_texts
+
+
+@click.command(
+    help="""
+Compares the linear-time `chunk_article` with its previous implementation, which split the
+text into a list of sentences and grew each chunk by string concatenation, on large documents.
+"""
+)
+@click.option(
+    "--document-size-mb",
+    "document_sizes_mb",
+    multiple=True,
+    default=[1, 4],
+    type=float,
+    help="Sizes of the documents to chunk, in MB.",
+)
+@click.option("--min-length", default=1000, help="Minimum length of a chunk.")
+@click.option("--max-length", default=2000, help="Maximum length of a chunk.")
+def main(
+    document_sizes_mb: tuple[float, ...], min_length: int, max_length: int
+) -> None:
+    article_texts = [text for text in generate_chunk_texts(1_000) if len(text) >= 1_000]
+
+    for document_size_mb in document_sizes_mb:
+        document_size = int(document_size_mb * 1024 * 1024)
+        repeats = document_size // sum(len(text) + 1 for text in article_texts) + 1
+        document = " ".join(article_texts * repeats)[:document_size]
+
+        with Timer() as previous_timer:
+            previous_chunks = _previous_chunk_article(document, min_length, max_length)
+        with Timer() as timer:
+            chunks = chunk_article(document, min_length, max_length)
+
+        if chunks != previous_chunks:
+            logger.error("chunk_article doesn't return the same chunks as before.")
+
+        logger.info(
+            f"{document_size_mb:g}MB document, {len(chunks)} chunks: "
+            f"previous {previous_timer.elapsed:.3f}s, "
+            f"linear-time {timer.elapsed:.3f}s ({previous_timer.elapsed / timer.elapsed:.1f}x)"
+        )
+
+
+def _previous_chunk_article(text: str, min_length: int, max_length: int) -> list[str]:
+    sentences = re.split(r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s", text)
+
+    extracts = []
+    current_chunk = ""
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+
+        if len(current_chunk) + len(sentence) <= max_length:
+            current_chunk += sentence + " "
+        else:
+            if len(current_chunk) >= min_length:
+                extracts.append(current_chunk.strip())
+            current_chunk = sentence + " "
+
+    if len(current_chunk) >= min_length:
+        extracts.append(current_chunk.strip())
+
+    return extracts
+
+
+if __name__ == "__main__":
+    main()
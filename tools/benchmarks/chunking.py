@@ -0,0 +1,100 @@
+import click
+from langchain.text_splitter import (
+    RecursiveCharacterTextSplitter,
+    SentenceTransformersTokenTextSplitter,
+)
+from loguru import logger
+
+from llm_twin.application.networks import EmbeddingModelSingleton
+from llm_twin.application.preprocessing.operations import chunk_text, chunk_texts
+
+from .common import Timer, generate_chunk_texts
+
+
+@click.command(
+    help="""
+Compares `chunk_text` with the shared splitters against building new splitters on every call,
+as it used to, and against the batch chunking engine `chunk_texts`, on documents shaped like
+posts, articles and repositories.
+
+Building a SentenceTransformersTokenTextSplitter loads a whole SentenceTransformer, hence the
+per-call splitters are timed on a sample of the documents and extrapolated.
+"""
+)
+@click.option("--num-documents", default=10_000, help="Number of documents to chunk.")
+@click.option(
+    "--num-sampled-documents",
+    default=50,
+    help="Number of documents chunked with per-call splitters.",
+)
+@click.option("--chunk-size", default=500, help="Chunk size of the character splitter.")
+@click.option(
+    "--chunk-overlap", default=50, help="Token overlap of the token splitter."
+)
+def main(
+    num_documents: int, num_sampled_documents: int, chunk_size: int, chunk_overlap: int
+) -> None:
+    documents = generate_chunk_texts(num_documents)
+    sampled_documents = documents[:num_sampled_documents]
+
+    with Timer() as timer:
+        per_call_chunks = [
+            _chunk_text_with_new_splitters(document, chunk_size, chunk_overlap)
+            for document in sampled_documents
+        ]
+    per_call_seconds = timer.elapsed / len(sampled_documents)
+
+    chunk_text(documents[0], chunk_size, chunk_overlap)  # Build the shared splitters.
+    with Timer() as timer:
+        shared_chunks = [
+            chunk_text(document, chunk_size, chunk_overlap) for document in documents
+        ]
+    shared_seconds = timer.elapsed / num_documents
+
+    with Timer() as timer:
+        batch_chunks = chunk_texts(documents, chunk_size, chunk_overlap)
+    batch_seconds = timer.elapsed / num_documents
+
+    if shared_chunks[:num_sampled_documents] != per_call_chunks:
+        logger.error(
+            "The shared splitters don't return the same chunks as per-call splitters."
+        )
+    if batch_chunks != shared_chunks:
+        logger.error("The batch chunking engine doesn't return the same chunks.")
+
+    logger.info(
+        f"Per-call splitters: {1000 * per_call_seconds:.2f} ms/document, "
+        f"~{per_call_seconds * num_documents:.1f}s for {num_documents} documents (extrapolated)"
+    )
+    logger.info(
+        f"Shared splitters: {1000 * shared_seconds:.2f} ms/document, "
+        f"{shared_seconds * num_documents:.1f}s for {num_documents} documents"
+    )
+    logger.info(
+        f"Batch chunking engine: {1000 * batch_seconds:.2f} ms/document, "
+        f"{batch_seconds * num_documents:.1f}s for {num_documents} documents"
+    )
+
+
+def _chunk_text_with_new_splitters(
+    text: str, chunk_size: int, chunk_overlap: int
+) -> list[str]:
+    embedding_model = EmbeddingModelSingleton()
+    character_splitter = RecursiveCharacterTextSplitter(
+        separators=["\n\n"], chunk_size=chunk_size, chunk_overlap=0
+    )
+    token_splitter = SentenceTransformersTokenTextSplitter(
+        chunk_overlap=chunk_overlap,
+        tokens_per_chunk=embedding_model.max_input_length,
+        model_name=embedding_model.model_id,
+    )
+
+    chunks = []
+    for section in character_splitter.split_text(text):
+        chunks.extend(token_splitter.split_text(section))
+
+    return chunks
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import time
+import uuid
+
+import numpy as np
+from qdrant_client import QdrantClient
+
+from llm_twin.domain.embedded_chunks import EmbeddedChunk, EmbeddedPostChunk
+from llm_twin.infrastructure.db.qdrant import QdrantDatabaseConnector
+
+WORD_PREFIXES = [
+    "data",
+    "model",
+    "vector",
+    "token",
+    "stream",
+    "query",
+    "index",
+    "layer",
+]
+
+
+class Timer:
+    """Context manager measuring the wall-clock time of its block in seconds."""
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        self.elapsed = 0.0
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed = time.perf_counter() - self.start
+
+
+def create_qdrant_client(prefer_grpc: bool | None = None) -> QdrantClient:
+    """
+    Creates a dedicated client with the same options as the shared connection. In local mode,
+    the storage can't be opened twice, hence the shared connection is returned.
+    """
+
+    if QdrantDatabaseConnector.is_local_mode():
+        return QdrantDatabaseConnector()
+
+    return QdrantClient(
+        **QdrantDatabaseConnector.get_connection_options(),
+        **QdrantDatabaseConnector.get_client_options(prefer_grpc=prefer_grpc),
+    )
+
+
+def generate_embedded_chunks(
+    num_chunks: int, embedding_size: int = 384, num_authors: int = 1, seed: int = 42
+) -> list[EmbeddedChunk]:
+    """Generates embedded post chunks with random unit vectors and realistic payloads."""
+
+    rng = np.random.default_rng(seed)
+    embeddings = random_unit_vectors(num_chunks, embedding_size, rng)
+    author_ids = [uuid.uuid4() for _ in range(num_authors)]
+
+    return [
+        EmbeddedPostChunk(
+            content=f"Benchmark chunk {i}. " * 20,
+            embedding=embedding,
+            platform="linkedin",
+            document_id=uuid.uuid4(),
+            author_id=author_ids[i % num_authors],
+            author_full_name=f"Benchmark Author {i % num_authors}",
+            metadata={"embedding_size": embedding_size},
+        )
+        for i, embedding in enumerate(embeddings)
+    ]
+
+
+def generate_chunk_texts(num_chunks: int, seed: int = 42) -> list[str]:
+    """
+    Generates a shuffled mix of chunk texts shaped like the ones produced by the chunking
+    handlers: short posts, article paragraphs and long repository chunks.
+    """
+
+    rng = np.random.default_rng(seed)
+    words = [f"{WORD_PREFIXES[i % len(WORD_PREFIXES)]}{i}" for i in range(2_000)]
+    code_lines = [
+        "def {name}(self, value):",
+        "    return self._{name}.get(value, None)",
+        "for item in {name}:",
+        "    logger.info(f'{name}: {{item}}')",
+        "import {name}",
+    ]
+
+    def prose(num_chars: int) -> str:
+        sentences = []
+        while sum(len(sentence) for sentence in sentences) < num_chars:
+            sentence_words = rng.choice(words, size=rng.integers(6, 20))
+            sentences.append(" ".join(sentence_words).capitalize() + ".")
+
+        return " ".join(sentences)
+
+    def code(num_chars: int) -> str:
+        lines = []
+        while sum(len(line) for line in lines) < num_chars:
+            line = code_lines[rng.integers(len(code_lines))]
+            lines.append(line.format(name=rng.choice(words)))
+
+        return "\n".join(lines)
+
+    texts = []
+    for kind in rng.choice(
+        ["post", "article", "repository"], size=num_chunks, p=[0.6, 0.25, 0.15]
+    ):
+        if kind == "post":
+            texts.append(prose(int(rng.integers(100, 250))))
+        elif kind == "article":
+            texts.append(prose(int(rng.integers(1_000, 2_000))))
+        else:
+            texts.append(code(int(rng.integers(3_000, 6_000))))
+
+    return texts
+
+
+def random_unit_vectors(
+    num_vectors: int, embedding_size: int, rng: np.random.Generator
+) -> np.ndarray:
+    vectors = rng.standard_normal((num_vectors, embedding_size), dtype=np.float32)
+
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
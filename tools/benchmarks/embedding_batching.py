@@ -0,0 +1,53 @@
+import click
+import numpy as np
+from loguru import logger
+
+from llm_twin.application.networks import EmbeddingModelSingleton
+
+from .common import Timer, generate_chunk_texts
+
+
+@click.command(
+    help="""
+Compares fixed-size batches with length-bucketed batches when embedding a realistic mix of
+post, article and repository chunks.
+
+Run it on the device configured by `RAG_MODEL_DEVICE` (CPU by default).
+"""
+)
+@click.option("--num-chunks", default=2_000, help="Number of chunks to embed.")
+@click.option(
+    "--max-batch-tokens",
+    "max_batch_tokens_options",
+    multiple=True,
+    default=[4_096, 8_192, 16_384, 32_768],
+    type=int,
+    help="Token budgets of the length-bucketed batches to benchmark.",
+)
+def main(num_chunks: int, max_batch_tokens_options: tuple[int, ...]) -> None:
+    texts = generate_chunk_texts(num_chunks)
+    embedding_model = EmbeddingModelSingleton()
+    embedding_model(texts[:8], to_list=False)  # Warm up the model.
+
+    with Timer() as timer:
+        reference = embedding_model(texts, to_list=False, max_batch_tokens=None)
+    logger.info(
+        f"Fixed-size batches: {num_chunks / timer.elapsed:.1f} chunks/s ({timer.elapsed:.2f}s)"
+    )
+
+    for max_batch_tokens in max_batch_tokens_options:
+        with Timer() as timer:
+            embeddings = embedding_model(
+                texts, to_list=False, max_batch_tokens=max_batch_tokens
+            )
+
+        max_abs_diff = float(np.abs(embeddings - reference).max())
+        logger.info(
+            f"Length-bucketed batches ({max_batch_tokens} tokens): "
+            f"{num_chunks / timer.elapsed:.1f} chunks/s ({timer.elapsed:.2f}s), "
+            f"max abs diff {max_abs_diff:.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import click
+from loguru import logger
+
+from llm_twin.application.networks import EmbeddingModelSingleton, EmbeddingProcessPool
+
+from .common import Timer, generate_chunk_texts
+
+
+@click.command(
+    help="""
+Compares the in-process embedding model with the multi-process embedding pool when embedding
+a realistic mix of post, article and repository chunks on CPU.
+"""
+)
+@click.option("--num-chunks", default=5_000, help="Number of chunks to embed.")
+@click.option(
+    "--num-workers", default=4, help="Number of worker processes of the pool."
+)
+@click.option(
+    "--threads-per-worker",
+    default=None,
+    type=int,
+    help="Number of torch threads per worker. Defaults to the CPU count divided by the workers.",
+)
+def main(num_chunks: int, num_workers: int, threads_per_worker: int | None) -> None:
+    texts = generate_chunk_texts(num_chunks)
+
+    embedding_model = EmbeddingModelSingleton()
+    embedding_model(texts[:8], to_list=False)  # Warm up the model.
+    with Timer() as timer:
+        embedding_model(texts, to_list=False)
+    logger.info(
+        f"Single process: {num_chunks / timer.elapsed:.1f} chunks/s ({timer.elapsed:.2f}s)"
+    )
+
+    pool = EmbeddingProcessPool(
+        num_workers=num_workers, threads_per_worker=threads_per_worker
+    )
+    try:
+        pool(
+            texts[: num_workers * 8], to_list=False
+        )  # Start the workers and load the models.
+        with Timer() as timer:
+            pool(texts, to_list=False)
+    finally:
+        pool.shutdown()
+    logger.info(
+        f"Pool of {num_workers} workers: {num_chunks / timer.elapsed:.1f} chunks/s "
+        f"({timer.elapsed:.2f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
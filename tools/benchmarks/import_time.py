@@ -0,0 +1,89 @@
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+
+import click
+from loguru import logger
+
+HEAVY_MODULES = ("torch", "transformers", "sentence_transformers", "onnxruntime")
+
+
+@click.command(
+    help="""
+Measures how long commands take to start, by running them in fresh interpreters with
+`-X importtime`, and reports the slowest top-level imports.
+
+It also reports which heavy ML libraries (torch, transformers, ...) get imported, as the models
+are expected to be imported and loaded only when first used.
+"""
+)
+@click.option("--repeat", default=5, help="Number of runs per command.")
+@click.option(
+    "--top", default=10, help="Number of slowest top-level imports to report."
+)
+@click.option(
+    "--command",
+    "commands",
+    multiple=True,
+    default=[
+        "tools/run.py --help",
+        "-c 'import llm_twin.application.preprocessing'",
+        "-c 'import llm_twin.domain'",
+    ],
+    help='Python arguments of the commands to run, e.g. "tools/run.py --help".',
+)
+def main(repeat: int, top: int, commands: tuple[str, ...]) -> None:
+    for command in commands:
+        args = shlex.split(command)
+
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, *args], capture_output=True, check=False)
+            durations.append(time.perf_counter() - start)
+
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", *args], capture_output=True, text=True
+        )
+        imports = _parse_import_times(result.stderr)
+        heavy_modules = [module for module in HEAVY_MODULES if module in imports]
+        slowest_imports = sorted(
+            imports.items(), key=lambda item: item[1], reverse=True
+        )[:top]
+
+        logger.info(
+            f"python {command}: median {statistics.median(durations):.2f}s, "
+            f"min {min(durations):.2f}s over {repeat} runs, "
+            f"heavy modules imported: {', '.join(heavy_modules) or 'none'}"
+        )
+        for module, cumulative_us in slowest_imports:
+            logger.info(f"    {cumulative_us / 1e6:6.2f}s  {module}")
+
+
+def _parse_import_times(stderr: str) -> dict[str, int]:
+    """Returns the cumulative import time in microseconds of each imported package."""
+
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if not cumulative.strip().isdigit():
+            continue  # The header line.
+
+        package = name.strip().split(".")[0]
+        is_top_level = not name.startswith("  ")
+        if is_top_level:
+            imports[package] = imports.get(package, 0) + int(cumulative)
+        else:
+            # Nested imports are included in the time of their top-level import.
+            imports.setdefault(package, 0)
+
+    return imports
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import click
+import numpy as np
+from loguru import logger
+
+from llm_twin.application.networks import (
+    CrossEncoderModelSingleton,
+    EmbeddingModelSingleton,
+)
+from llm_twin.application.networks.base import SingletonMeta
+from llm_twin.application.networks.onnx import INFERENCE_BACKENDS
+
+from .common import Timer, generate_chunk_texts
+
+
+@click.command(
+    help="""
+Compares the latency of single queries and the throughput of bulk batches of the embedding and
+cross-encoder models for each inference backend (torch, onnx, onnx-int8).
+
+The ONNX graphs are exported and cached on first use, which isn't included in the timings.
+"""
+)
+@click.option("--num-queries", default=200, help="Number of single queries to time.")
+@click.option(
+    "--num-chunks", default=2_000, help="Number of chunks of the bulk batches."
+)
+@click.option(
+    "--backend",
+    "backends",
+    multiple=True,
+    default=INFERENCE_BACKENDS,
+    type=click.Choice(INFERENCE_BACKENDS),
+    help="Backends to benchmark.",
+)
+def main(num_queries: int, num_chunks: int, backends: tuple[str, ...]) -> None:
+    chunks = generate_chunk_texts(num_chunks)
+    queries = [chunk[:100] for chunk in chunks[:num_queries]]
+    pairs = [(queries[i % len(queries)], chunk) for i, chunk in enumerate(chunks)]
+
+    reference_embeddings = None
+    for backend in backends:
+        # The models are singletons, hence a new instance is forced for each backend.
+        SingletonMeta._instances.pop(EmbeddingModelSingleton, None)
+        SingletonMeta._instances.pop(CrossEncoderModelSingleton, None)
+        embedding_model = EmbeddingModelSingleton(backend=backend)
+        cross_encoder_model = CrossEncoderModelSingleton(backend=backend)
+        if embedding_model.backend != backend:
+            logger.warning(
+                f"Skipping the {backend} backend, which failed the parity check."
+            )
+
+            continue
+
+        embedding_latencies = _time_single_calls(lambda q: embedding_model(q), queries)
+        with Timer() as embedding_timer:
+            embeddings = embedding_model(chunks, to_list=False)
+
+        scoring_latencies = _time_single_calls(
+            lambda q: cross_encoder_model([(q, chunks[0])]), queries
+        )
+        with Timer() as scoring_timer:
+            cross_encoder_model(pairs, to_list=False)
+
+        if reference_embeddings is None:
+            reference_embeddings = embeddings
+        similarities = _cosine_similarities(embeddings, reference_embeddings)
+
+        logger.info(
+            f"{backend}: embedding p50 {np.percentile(embedding_latencies, 50):.2f} ms, "
+            f"p95 {np.percentile(embedding_latencies, 95):.2f} ms, "
+            f"bulk {num_chunks / embedding_timer.elapsed:.1f} chunks/s | "
+            f"reranking p50 {np.percentile(scoring_latencies, 50):.2f} ms, "
+            f"p95 {np.percentile(scoring_latencies, 95):.2f} ms, "
+            f"bulk {num_chunks / scoring_timer.elapsed:.1f} pairs/s | "
+            f"min cosine similarity to {backends[0]} {similarities.min():.4f}"
+        )
+
+
+def _time_single_calls(call, inputs: list) -> np.ndarray:
+    call(inputs[0])  # Warm up the model.
+
+    latencies = []
+    for value in inputs:
+        with Timer() as timer:
+            call(value)
+        latencies.append(1000 * timer.elapsed)
+
+    return np.array(latencies)
+
+
+def _cosine_similarities(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+
+    return (a * b).sum(axis=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import re
+
+import click
+import numpy as np
+from loguru import logger
+from unstructured.cleaners.core import (
+    clean,
+    clean_non_ascii_chars,
+    replace_unicode_quotes,
+)
+
+from feature_pipeline.utils.cleaning import clean_text
+
+from .common import Timer, generate_chunk_texts
+
+EMOJIS = ["🚀", "🔥", "👉", "💡", "✅", "📈", "🤖", "🇪🇺", "↓", "↳", "→"]
+
+
+@click.command(
+    help="""
+Compares the fused `clean_text` of the feature pipeline with its previous implementation, which
+ran seven passes over the text, on LinkedIn-style posts with bold and italic letters, emojis,
+arrows, quotes and URLs.
+"""
+)
+@click.option("--num-posts", default=10_000, help="Number of posts to clean.")
+@click.option(
+    "--repeats", default=3, help="Number of timed runs, the best one is reported."
+)
+def main(num_posts: int, repeats: int) -> None:
+    posts = generate_posts(num_posts)
+    num_mb = sum(len(post.encode("utf-8")) for post in posts) / 1024 / 1024
+
+    previous_elapsed, elapsed = float("inf"), float("inf")
+    for _ in range(repeats):
+        with Timer() as previous_timer:
+            previous_cleaned_posts = [_previous_clean_text(post) for post in posts]
+        with Timer() as timer:
+            cleaned_posts = [clean_text(post) for post in posts]
+
+        previous_elapsed = min(previous_elapsed, previous_timer.elapsed)
+        elapsed = min(elapsed, timer.elapsed)
+
+    if cleaned_posts != previous_cleaned_posts:
+        logger.error("clean_text doesn't return the same text as before.")
+
+    logger.info(
+        f"{num_posts} posts ({num_mb:.1f}MB): "
+        f"previous {num_posts / previous_elapsed:,.0f} posts/s, "
+        f"fused {num_posts / elapsed:,.0f} posts/s ({previous_elapsed / elapsed:.1f}x)"
+    )
+
+
+def generate_posts(num_posts: int, seed: int = 42) -> list[str]:
+    rng = np.random.default_rng(seed)
+    texts = [
+        text for text in generate_chunk_texts(num_posts, seed=seed) if len(text) < 3_000
+    ]
+
+    posts = []
+    for i in range(num_posts):
+        words = texts[i % len(texts)].split(" ")
+        for j in rng.choice(len(words), size=max(len(words) // 10, 1)):
+            style = rng.integers(4)
+            if style == 0:
+                words[j] = _stylize(
+                    words[j], upper=0x1D5D4, lower=0x1D5EE, digits=0x1D7EC
+                )
+            elif style == 1:
+                words[j] = _stylize(words[j], upper=0x1D608, lower=0x1D622)
+            elif style == 2:
+                words[j] = f"{words[j]} {rng.choice(EMOJIS)}{rng.choice(EMOJIS)}"
+            else:
+                words[j] = f"“{words[j]}” it’s"
+        posts.append(
+            " ".join(words) + f"\n\n↓ Read more: https://example.com/posts/{i}?ref=li"
+        )
+
+    return posts
+
+
+def _stylize(word: str, upper: int, lower: int, digits: int | None = None) -> str:
+    characters = []
+    for character in word:
+        if "A" <= character <= "Z":
+            characters.append(chr(upper + ord(character) - ord("A")))
+        elif "a" <= character <= "z":
+            characters.append(chr(lower + ord(character) - ord("a")))
+        elif digits is not None and "0" <= character <= "9":
+            characters.append(chr(digits + ord(character) - ord("0")))
+        else:
+            characters.append(character)
+
+    return "".join(characters)
+
+
+def _previous_clean_text(text: str) -> str:
+    bold_numbers = {chr(0x1D7EC + digit): str(digit) for digit in range(10)}
+
+    def convert_bold_char(match):
+        char = match.group(0)
+        if char in bold_numbers:
+            return bold_numbers[char]
+        elif "\U0001d5d4" <= char <= "\U0001d5ed":
+            return chr(ord(char) - 0x1D5D4 + ord("A"))
+        elif "\U0001d5ee" <= char <= "\U0001d607":
+            return chr(ord(char) - 0x1D5EE + ord("a"))
+        return char
+
+    def convert_italic_char(match):
+        char = match.group(0)
+        if "\U0001d608" <= char <= "\U0001d621":
+            return chr(ord(char) - 0x1D608 + ord("A"))
+        elif "\U0001d622" <= char <= "\U0001d63b":
+            return chr(ord(char) - 0x1D622 + ord("a"))
+        return char
+
+    bold_pattern = re.compile(
+        r"[\U0001D5D4-\U0001D5ED\U0001D5EE-\U0001D607\U0001D7CE-\U0001D7FF]"
+    )
+    text = bold_pattern.sub(convert_bold_char, text)
+    italic_pattern = re.compile(r"[\U0001D608-\U0001D621\U0001D622-\U0001D63B]")
+    text = italic_pattern.sub(convert_italic_char, text)
+    emoji_and_symbol_pattern = re.compile(
+        "[\U0001f600-\U0001f64f\U0001f300-\U0001f5ff\U0001f680-\U0001f6ff\U0001f1e0-\U0001f1ff"
+        "\U00002193\U000021b3\U00002192]+",
+        flags=re.UNICODE,
+    )
+    text = emoji_and_symbol_pattern.sub(r" ", text)
+    text = clean(text)
+    text = replace_unicode_quotes(text)
+    text = clean_non_ascii_chars(text)
+
+    return re.sub(r"https?://\S+|www\.\S+", "[URL]", text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import click
+import numpy as np
+from loguru import logger
+from qdrant_client.http.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchValue,
+    PayloadSchemaType,
+    VectorParams,
+)
+
+from llm_twin.application import utils
+
+from .common import (
+    Timer,
+    create_qdrant_client,
+    generate_embedded_chunks,
+    random_unit_vectors,
+)
+
+
+@click.command(
+    help="""
+Measures the latency of searches filtered on `author_id`, before and after
+creating a keyword payload index on the field.
+"""
+)
+@click.option(
+    "--num-chunks", default=50_000, help="Number of embedded chunks to upsert."
+)
+@click.option("--num-authors", default=100, help="Number of distinct authors.")
+@click.option("--num-queries", default=200, help="Number of filtered search requests.")
+@click.option("--embedding-size", default=384, help="Size of the random embeddings.")
+def main(
+    num_chunks: int, num_authors: int, num_queries: int, embedding_size: int
+) -> None:
+    chunks = generate_embedded_chunks(
+        num_chunks, embedding_size=embedding_size, num_authors=num_authors
+    )
+    author_ids = list({str(chunk.author_id) for chunk in chunks})
+    queries = random_unit_vectors(
+        num_queries, embedding_size, np.random.default_rng(0)
+    ).tolist()
+
+    client = create_qdrant_client()
+    collection_name = "benchmark_payload_indexes"
+    client.delete_collection(collection_name=collection_name)
+    client.create_collection(
+        collection_name=collection_name,
+        vectors_config=VectorParams(size=embedding_size, distance=Distance.COSINE),
+    )
+
+    def run_filtered_searches() -> float:
+        with Timer() as timer:
+            for i, query in enumerate(queries):
+                author_filter = Filter(
+                    must=[
+                        FieldCondition(
+                            key="author_id",
+                            match=MatchValue(value=author_ids[i % len(author_ids)]),
+                        )
+                    ]
+                )
+                client.search(
+                    collection_name=collection_name,
+                    query_vector=query,
+                    query_filter=author_filter,
+                    limit=10,
+                )
+
+        return 1000 * timer.elapsed / num_queries
+
+    try:
+        for chunks_batch in utils.misc.batch(chunks, size=256):
+            client.upsert(
+                collection_name=collection_name,
+                points=[chunk.to_point() for chunk in chunks_batch],
+                wait=True,
+            )
+
+        latency_without_index = run_filtered_searches()
+
+        client.create_payload_index(
+            collection_name=collection_name,
+            field_name="author_id",
+            field_schema=PayloadSchemaType.KEYWORD,
+            wait=True,
+        )
+        latency_with_index = run_filtered_searches()
+    finally:
+        client.delete_collection(collection_name=collection_name)
+        client.close()
+
+    logger.info(
+        f"Filtered search without payload index: {latency_without_index:.2f} ms/query"
+    )
+    logger.info(
+        f"Filtered search with payload index: {latency_with_index:.2f} ms/query"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import time
+
+import click
+import numpy as np
+from loguru import logger
+from qdrant_client import QdrantClient
+from qdrant_client.http.models import CollectionStatus, SearchParams
+
+from llm_twin.application import utils
+from llm_twin.application.networks import EmbeddingModelSingleton
+from llm_twin.domain.embedded_chunks import EmbeddedChunk, EmbeddedPostChunk
+from llm_twin.domain.types import DataCategory
+
+from .common import (
+    Timer,
+    create_qdrant_client,
+    generate_embedded_chunks,
+    random_unit_vectors,
+)
+
+# Collection Config options to compare, in the same format as the document classes declare them.
+CONFIGURATIONS = {
+    "default": {},
+    "hnsw_m32_ef200": {"hnsw_config": {"m": 32, "ef_construct": 200}},
+    "scalar": {"quantization": "scalar", "search_params": {"rescore": False}},
+    "scalar_rescore": {
+        "quantization": "scalar",
+        "search_params": {"rescore": True, "oversampling": 2.0},
+    },
+    "scalar_rescore_on_disk": {
+        "on_disk": True,
+        "quantization": "scalar",
+        "search_params": {"rescore": True, "oversampling": 2.0},
+    },
+    "product_rescore": {
+        "quantization": "product",
+        "search_params": {"rescore": True, "oversampling": 4.0},
+    },
+}
+
+
+def create_document_class(
+    configuration_name: str, options: dict
+) -> type[EmbeddedChunk]:
+    config = type(
+        "Config",
+        (),
+        {
+            "name": f"benchmark_recall_{configuration_name}",
+            "category": DataCategory.POSTS,
+            "use_vector_index": True,
+            **options,
+        },
+    )
+
+    return type(
+        f"Benchmark{configuration_name.title().replace('_', '')}Chunk",
+        (EmbeddedPostChunk,),
+        {"Config": config, "__module__": __name__},
+    )
+
+
+def wait_until_indexed(
+    client: QdrantClient, collection_name: str, timeout: float = 600
+) -> None:
+    deadline = time.monotonic() + timeout
+    while (
+        client.get_collection(collection_name=collection_name).status
+        != CollectionStatus.GREEN
+    ):
+        if time.monotonic() > deadline:
+            raise TimeoutError(
+                f"Collection '{collection_name}' was not indexed in {timeout}s."
+            )
+
+        time.sleep(1)
+
+
+@click.command(
+    help="""
+Measures recall@k against an exact brute-force baseline and the search latency
+for several HNSW and quantization configurations, sweeping the search-time `hnsw_ef`.
+
+The local in-memory mode (--in-memory) always runs an exact search, as it does not
+implement HNSW nor quantization. Use it to validate the harness, and a Qdrant
+server to compare the configurations.
+"""
+)
+@click.option(
+    "--num-chunks", default=50_000, help="Number of embedded chunks to index."
+)
+@click.option("--num-queries", default=200, help="Number of search requests.")
+@click.option("--top-k", default=10, help="Number of neighbours to retrieve.")
+@click.option(
+    "--hnsw-ef",
+    "hnsw_efs",
+    default=[32, 64, 128, 256],
+    multiple=True,
+    help="Search-time ef.",
+)
+@click.option(
+    "--in-memory", is_flag=True, default=False, help="Use Qdrant's local mode."
+)
+def main(
+    num_chunks: int, num_queries: int, top_k: int, hnsw_efs: list[int], in_memory: bool
+) -> None:
+    embedding_size = EmbeddingModelSingleton().embedding_size
+    chunks = generate_embedded_chunks(num_chunks, embedding_size=embedding_size)
+    queries = random_unit_vectors(num_queries, embedding_size, np.random.default_rng(0))
+
+    # The vectors are normalized, so the cosine similarity is the dot product.
+    embeddings = np.stack([chunk.embedding for chunk in chunks])
+    exact_top_k = np.argsort(-(queries @ embeddings.T), axis=1)[:, :top_k]
+    chunk_ids = np.array([str(chunk.id) for chunk in chunks])
+    exact_ids = [set(chunk_ids[indices]) for indices in exact_top_k]
+
+    client = QdrantClient(":memory:") if in_memory else create_qdrant_client()
+    for configuration_name, options in CONFIGURATIONS.items():
+        document_class = create_document_class(configuration_name, options)
+        collection_name = document_class.get_collection_name()
+
+        client.delete_collection(collection_name=collection_name)
+        client.create_collection(
+            collection_name=collection_name, **document_class.get_collection_options()
+        )
+        try:
+            for chunks_batch in utils.misc.batch(chunks, size=256):
+                client.upsert(
+                    collection_name=collection_name,
+                    points=[chunk.to_point() for chunk in chunks_batch],
+                )
+            wait_until_indexed(client, collection_name)
+
+            search_params = document_class.get_search_params() or SearchParams()
+            for hnsw_ef in hnsw_efs:
+                params = search_params.model_copy(update={"hnsw_ef": hnsw_ef})
+                recalls = []
+                with Timer() as timer:
+                    for query, expected_ids in zip(queries.tolist(), exact_ids):
+                        hits = client.search(
+                            collection_name=collection_name,
+                            query_vector=query,
+                            limit=top_k,
+                            search_params=params,
+                        )
+                        recalls.append(
+                            len({str(hit.id) for hit in hits} & expected_ids) / top_k
+                        )
+
+                logger.info(
+                    f"{configuration_name} (hnsw_ef={hnsw_ef}): "
+                    f"recall@{top_k}={np.mean(recalls):.4f}, "
+                    f"latency={1000 * timer.elapsed / num_queries:.2f} ms/query"
+                )
+        finally:
+            client.delete_collection(collection_name=collection_name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import click
+import numpy as np
+from loguru import logger
+from qdrant_client.http.models import Distance, VectorParams
+
+from llm_twin.application import utils
+
+from .common import (
+    Timer,
+    create_qdrant_client,
+    generate_embedded_chunks,
+    random_unit_vectors,
+)
+
+
+@click.command(
+    help="""
+Compares the REST and gRPC Qdrant transports when upserting and searching embedded chunks.
+
+Both clients are created with the connection options from the settings,
+only `prefer_grpc` differs between them.
+"""
+)
+@click.option(
+    "--num-chunks", default=10_000, help="Number of embedded chunks to upsert."
+)
+@click.option("--batch-size", default=256, help="Number of points per upsert request.")
+@click.option("--num-queries", default=200, help="Number of search requests.")
+@click.option("--embedding-size", default=384, help="Size of the random embeddings.")
+def main(
+    num_chunks: int, batch_size: int, num_queries: int, embedding_size: int
+) -> None:
+    chunks = generate_embedded_chunks(num_chunks, embedding_size=embedding_size)
+    points = [chunk.to_point() for chunk in chunks]
+    queries = random_unit_vectors(
+        num_queries, embedding_size, np.random.default_rng(0)
+    ).tolist()
+
+    for transport, prefer_grpc in (("REST", False), ("gRPC", True)):
+        client = create_qdrant_client(prefer_grpc=prefer_grpc)
+        collection_name = f"benchmark_transport_{transport.lower()}"
+        client.delete_collection(collection_name=collection_name)
+        client.create_collection(
+            collection_name=collection_name,
+            vectors_config=VectorParams(size=embedding_size, distance=Distance.COSINE),
+        )
+
+        try:
+            with Timer() as upsert_timer:
+                for points_batch in utils.misc.batch(points, size=batch_size):
+                    client.upsert(
+                        collection_name=collection_name, points=points_batch, wait=True
+                    )
+
+            with Timer() as search_timer:
+                for query in queries:
+                    client.search(
+                        collection_name=collection_name, query_vector=query, limit=10
+                    )
+        finally:
+            client.delete_collection(collection_name=collection_name)
+            client.close()
+
+        logger.info(
+            f"{transport}: upsert {num_chunks / upsert_timer.elapsed:.0f} points/s "
+            f"({upsert_timer.elapsed:.2f}s), "
+            f"search {1000 * search_timer.elapsed / num_queries:.2f} ms/query"
+        )
+
+
+if __name__ == "__main__":
+    main()